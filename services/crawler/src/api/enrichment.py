@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 
 from src.core.exceptions import (
     CrawlerServiceError,
@@ -12,31 +17,68 @@ from src.core.exceptions import (
 )
 from src.models.requests.enrichment_request import (
     BatchEnrichmentRequest,
+    ConcurrencyLimitRequest,
     EnrichmentRequest,
 )
 from src.models.responses.enrichment_result import (
     ActiveJobsResponse,
     BatchEnrichmentResponse,
+    ConcurrencyStatusResponse,
     EnrichmentResponse,
     ErrorResponse,
     JobStatusResponse,
 )
-from src.services.enrichment_service import BookEnrichmentService, EnrichmentResult
+from src.services.enrichment_service import (
+    BookEnrichmentService,
+    EnrichmentResult,
+)
 
 router = APIRouter(prefix="/enrichment", tags=["enrichment"])
 
+# HTTP status for exception types that map directly, checked before the
+# ExternalAPIError subclasses whose status depends on the upstream response
+_STATUS_BY_ERROR: dict[type[Exception], int] = {
+    ValidationError: status.HTTP_400_BAD_REQUEST,
+}
+_EXTERNAL_API_STATUS: dict[int | None, int] = {
+    404: status.HTTP_404_NOT_FOUND,
+    429: status.HTTP_429_TOO_MANY_REQUESTS,
+}
 
-async def get_enrichment_service() -> BookEnrichmentService:
-    """Dependency to get enrichment service instance."""
-    service = BookEnrichmentService()
-    try:
-        await service._ensure_clients()
-        yield service
-    finally:
-        await service.close()
+# Serializes streamed results straight to bytes, skipping the str round trip
+_RESPONSE_ADAPTER = TypeAdapter(EnrichmentResponse)
+
+
+def get_enrichment_service(request: Request) -> BookEnrichmentService:
+    """Dependency to get the shared enrichment service instance.
 
+    The service is created once in the application lifespan so its HTTP
+    connection pools are reused across requests.
+    """
+    return request.app.state.enrichment_service
+
+
+def model_response(model: BaseModel, status_code: int) -> Response:
+    """Serialize a response model straight to JSON bytes.
 
-def create_error_response(error: Exception) -> JSONResponse:
+    Skips the intermediate ``.dict()`` pass so large batch payloads are
+    encoded in a single traversal by pydantic-core.
+
+    Args:
+        model: Response model to serialize
+        status_code: HTTP status code for the response
+
+    Returns:
+        JSON response with the serialized model
+    """
+    return Response(
+        content=model.model_dump_json(),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
+
+def create_error_response(error: Exception) -> Response:
     """Create standardized error response from exception.
 
     Args:
@@ -49,30 +91,23 @@ def create_error_response(error: Exception) -> JSONResponse:
         error_dict = error.to_dict()
 
         # Map to HTTP status codes
-        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        if isinstance(error, ValidationError):
-            status_code = status.HTTP_400_BAD_REQUEST
-        elif isinstance(error, ExternalAPIError):
-            if error.status_code == 404:
-                status_code = status.HTTP_404_NOT_FOUND
-            elif error.status_code == 429:
-                status_code = status.HTTP_429_TOO_MANY_REQUESTS
+        status_code = _STATUS_BY_ERROR.get(type(error))
+        if status_code is None:
+            if isinstance(error, ExternalAPIError):
+                status_code = _EXTERNAL_API_STATUS.get(
+                    error.status_code, status.HTTP_502_BAD_GATEWAY
+                )
             else:
-                status_code = status.HTTP_502_BAD_GATEWAY
+                status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
 
-        return JSONResponse(
-            status_code=status_code, content=ErrorResponse(**error_dict).dict()
-        )
+        return model_response(ErrorResponse(**error_dict), status_code)
 
     else:
         # Generic error response
         error_response = ErrorResponse(
             error_type="InternalServerError", message=str(error)
         )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=error_response.dict(),
-        )
+        return model_response(error_response, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 def enrichment_result_to_response(result: EnrichmentResult) -> EnrichmentResponse:
@@ -137,16 +172,14 @@ async def enrich_book(
 
         # Return appropriate HTTP status based on enrichment status
         if result.status == "failed":
-            return JSONResponse(
-                status_code=status.HTTP_404_NOT_FOUND
+            return model_response(
+                response,
+                status.HTTP_404_NOT_FOUND
                 if "not found" in (result.error or "").lower()
                 else status.HTTP_502_BAD_GATEWAY,
-                content=response.dict(),
             )
         elif result.status == "partial":
-            return JSONResponse(
-                status_code=status.HTTP_206_PARTIAL_CONTENT, content=response.dict()
-            )
+            return model_response(response, status.HTTP_206_PARTIAL_CONTENT)
 
         return response
 
@@ -182,9 +215,7 @@ async def batch_enrich_books(
         Batch enrichment results with individual book results
     """
     try:
-        import time
-
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         results = await service.batch_enrich_books(
             isbns=request.isbns,
@@ -192,15 +223,19 @@ async def batch_enrich_books(
             min_quality_score=request.min_quality_score,
         )
 
-        processing_time = time.time() - start_time
-
-        # Convert results to response format
-        response_results = [enrichment_result_to_response(result) for result in results]
+        processing_time = time.perf_counter() - start_time
 
-        # Calculate statistics
-        successful = sum(1 for r in results if r.status == "success")
-        failed = sum(1 for r in results if r.status == "failed")
-        partial = sum(1 for r in results if r.status == "partial")
+        # Convert results to response format and count statuses in one pass
+        response_results = []
+        successful = failed = partial = 0
+        for result in results:
+            response_results.append(enrichment_result_to_response(result))
+            if result.status == "success":
+                successful += 1
+            elif result.status == "failed":
+                failed += 1
+            elif result.status == "partial":
+                partial += 1
 
         response = BatchEnrichmentResponse(
             total_books=len(results),
@@ -213,9 +248,7 @@ async def batch_enrich_books(
 
         # Return 207 Multi-Status if there were any failures
         if failed > 0 or partial > 0:
-            return JSONResponse(
-                status_code=status.HTTP_207_MULTI_STATUS, content=response.dict()
-            )
+            return model_response(response, status.HTTP_207_MULTI_STATUS)
 
         return response
 
@@ -223,6 +256,51 @@ async def batch_enrich_books(
         return create_error_response(e)
 
 
+@router.post(
+    "/batch/stream",
+    summary="Stream batch enrichment results",
+    description=(
+        "Enrich multiple books and stream each result as newline-delimited JSON "
+        "as soon as it completes"
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "One EnrichmentResponse JSON object per line",
+            "content": {"application/x-ndjson": {}},
+        },
+    },
+)
+async def stream_batch_enrich_books(
+    request: BatchEnrichmentRequest,
+    service: BookEnrichmentService = Depends(get_enrichment_service),
+) -> StreamingResponse:
+    """Enrich multiple books, streaming results in completion order.
+
+    Args:
+        request: Batch enrichment request with ISBNs and options
+        service: Enrichment service instance
+
+    Returns:
+        NDJSON stream of enrichment results
+    """
+
+    async def stream_results() -> AsyncIterator[bytes]:
+        # The service's batch pool bounds concurrency; closing its iterator
+        # stops outstanding work if the client disconnects mid-stream
+        results = service.batch_enrich_books_iter(
+            isbns=request.isbns,
+            force_refresh=request.force_refresh,
+            min_quality_score=request.min_quality_score,
+        )
+        async with aclosing(results):
+            async for result in results:
+                response = enrichment_result_to_response(result)
+                yield _RESPONSE_ADAPTER.dump_json(response) + b"\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/status/{correlation_id}",
     response_model=EnrichmentResponse,
@@ -271,7 +349,7 @@ async def get_enrichment_status(correlation_id: str) -> EnrichmentResponse:
 async def get_job_status(
     job_id: str,
     service: BookEnrichmentService = Depends(get_enrichment_service),
-) -> JobStatusResponse | JSONResponse:
+) -> JobStatusResponse | Response:
     """Get status of a specific enrichment job.
 
     Args:
@@ -285,7 +363,7 @@ async def get_job_status(
         job_status = service.get_job_status(job_id)
 
         if job_status is None:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"error": f"Job {job_id} not found", "job_id": job_id},
             )
@@ -310,7 +388,7 @@ async def get_job_status(
 )
 async def get_active_jobs(
     service: BookEnrichmentService = Depends(get_enrichment_service),
-) -> ActiveJobsResponse | JSONResponse:
+) -> ActiveJobsResponse | Response:
     """Get list of currently active enrichment jobs.
 
     Args:
@@ -330,3 +408,60 @@ async def get_active_jobs(
 
     except Exception as e:
         return create_error_response(e)
+
+
+@router.get(
+    "/concurrency",
+    response_model=ConcurrencyStatusResponse,
+    summary="Get enrichment concurrency limit",
+    description="Get the enrichment concurrency limit and current usage",
+)
+async def get_concurrency_limit(
+    service: BookEnrichmentService = Depends(get_enrichment_service),
+) -> ConcurrencyStatusResponse:
+    """Get the enrichment concurrency limit.
+
+    Args:
+        service: Enrichment service instance
+
+    Returns:
+        Current limit and number of active enrichments
+    """
+    return ConcurrencyStatusResponse(**service.get_concurrency_status())
+
+
+@router.put(
+    "/concurrency",
+    response_model=ConcurrencyStatusResponse,
+    summary="Set enrichment concurrency limit",
+    description=(
+        "Change how many enrichments may run at once without restarting the "
+        "service. Running enrichments finish when the limit is lowered."
+    ),
+    responses={
+        200: {
+            "description": "Concurrency limit updated",
+            "model": ConcurrencyStatusResponse,
+        },
+        422: {"description": "Invalid limit", "model": ErrorResponse},
+    },
+)
+async def set_concurrency_limit(
+    request: ConcurrencyLimitRequest,
+    service: BookEnrichmentService = Depends(get_enrichment_service),
+) -> ConcurrencyStatusResponse | Response:
+    """Change the enrichment concurrency limit.
+
+    Args:
+        request: New concurrency limit
+        service: Enrichment service instance
+
+    Returns:
+        Updated limit and number of active enrichments
+    """
+    try:
+        concurrency = await service.set_concurrency_limit(request.limit)
+        return ConcurrencyStatusResponse(**concurrency)
+
+    except Exception as e:
+        return create_error_response(e)
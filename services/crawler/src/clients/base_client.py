@@ -23,6 +23,8 @@ class BaseHTTPClient(ABC):
         rate_limit_per_minute: int = 100,
         timeout: float = 10.0,
         max_retries: int = 3,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float | None = None,
     ) -> None:
         """Initialize base HTTP client.
 
@@ -32,16 +34,27 @@ class BaseHTTPClient(ABC):
             rate_limit_per_minute: Maximum requests per minute
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
+            keepalive_expiry: Seconds an idle pooled connection is kept open
+            connect_timeout: Connection timeout in seconds, defaults to timeout
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_concurrent = max_concurrent
+        self.keepalive_expiry = keepalive_expiry
+        self.connect_timeout = connect_timeout or timeout
 
-        # Rate limiting
+        # Rate limiting (token bucket refilled continuously over a minute)
         self._semaphore = asyncio.Semaphore(max_concurrent)
         self._rate_limit_per_minute = rate_limit_per_minute
-        self._request_times: list[float] = []
-        self._rate_limit_lock = asyncio.Lock()
+        self._tokens = float(rate_limit_per_minute)
+        self._refill_rate = rate_limit_per_minute / 60.0
+        self._last_refill = time.monotonic()
+        self._rate_limit_cond = asyncio.Condition()
+        self._refill_task: asyncio.Task[None] | None = None
+        self._rate_limit_waiters = 0
+        # Set by close so queued waiters stop instead of waiting for a refill
+        self._closed = False
 
         # HTTP client
         self._client: httpx.AsyncClient | None = None
@@ -55,53 +68,113 @@ class BaseHTTPClient(ABC):
         """Async context manager exit."""
         await self.close()
 
-    async def _ensure_client(self) -> None:
-        """Ensure HTTP client is initialized."""
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Ensure HTTP client is initialized.
+
+        Returns:
+            The shared HTTP client
+        """
         if self._client is None:
+            self._closed = False
+            # HTTP/2 multiplexes concurrent requests to one host over a few
+            # connections; keep as many idle connections as we allow in flight
             self._client = httpx.AsyncClient(
-                timeout=self.timeout,
+                http2=True,
+                # Fail fast on unreachable hosts, independent of read timeout
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
                 follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.max_concurrent,
+                    max_connections=self.max_concurrent * 2,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
             )
+        return self._client
 
     async def close(self) -> None:
         """Close HTTP client and cleanup resources."""
+        self._closed = True
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            self._refill_task = None
+
+        # The refill timer was the only thing waking queued waiters
+        async with self._rate_limit_cond:
+            self._rate_limit_cond.notify_all()
+
         if self._client:
             await self._client.aclose()
             self._client = None
 
+    def _refill_tokens(self, now: float) -> None:
+        """Add tokens earned since the last refill, capped at the bucket size."""
+        elapsed = now - self._last_refill
+        self._tokens = min(
+            float(self._rate_limit_per_minute),
+            self._tokens + elapsed * self._refill_rate,
+        )
+        self._last_refill = now
+
+    def _schedule_refill(self) -> None:
+        """Start the refill timer for queued waiters if it is not running."""
+        if self._refill_task is not None:
+            return
+
+        sleep_time = (1 - self._tokens) / self._refill_rate
+        logger.info(
+            "Rate limit reached, waiting",
+            sleep_time=sleep_time,
+            available_tokens=self._tokens,
+        )
+        self._refill_task = asyncio.create_task(self._notify_on_refill(sleep_time))
+
+    async def _notify_on_refill(self, sleep_time: float) -> None:
+        """Sleep until tokens are refilled, then wake that many waiters."""
+        await asyncio.sleep(sleep_time)
+        async with self._rate_limit_cond:
+            self._refill_task = None
+            self._refill_tokens(time.monotonic())
+            self._rate_limit_cond.notify(max(1, int(self._tokens)))
+
     async def _wait_for_rate_limit(self) -> None:
-        """Wait if rate limit would be exceeded."""
-        async with self._rate_limit_lock:
-            now = time.time()
-            # Remove requests older than 1 minute
-            self._request_times = [t for t in self._request_times if now - t < 60]
-
-            # Wait if we would exceed rate limit
-            if len(self._request_times) >= self._rate_limit_per_minute:
-                sleep_time = 60 - (now - self._request_times[0])
-                if sleep_time > 0:
-                    logger.info(
-                        "Rate limit reached, waiting",
-                        sleep_time=sleep_time,
-                        current_requests=len(self._request_times),
-                    )
-                    await asyncio.sleep(sleep_time)
-                    # Clean up old requests after sleeping
-                    now = time.time()
-                    self._request_times = [
-                        t for t in self._request_times if now - t < 60
-                    ]
+        """Wait until a rate limit token is available and consume it.
 
-            # Record this request
-            self._request_times.append(now)
+        Waiters queue on a condition in arrival order; a single refill timer
+        wakes only as many of them as there are tokens, instead of every
+        waiter sleeping and waking at once.
+
+        Raises:
+            RuntimeError: If the client is closed while waiting
+        """
+        async with self._rate_limit_cond:
+            self._rate_limit_waiters += 1
+            try:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("HTTP client closed while rate limited")
+
+                    self._refill_tokens(time.monotonic())
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+
+                    self._schedule_refill()
+                    await self._rate_limit_cond.wait()
+            finally:
+                self._rate_limit_waiters -= 1
+                # Hand off to the next queued waiter, re-arming the refill
+                # timer if this waiter took the last token
+                if self._rate_limit_waiters and not self._closed:
+                    if self._tokens >= 1:
+                        self._rate_limit_cond.notify(1)
+                    else:
+                        self._schedule_refill()
 
     async def _retry_request(
         self, method: str, url: str, **kwargs: Any
     ) -> httpx.Response:
         """Make HTTP request with exponential backoff retry."""
-        await self._ensure_client()
-        assert self._client is not None
+        client = await self._ensure_client()
 
         last_exception = None
 
@@ -124,7 +197,7 @@ class BaseHTTPClient(ABC):
                     "Making HTTP request", method=method, url=url, attempt=attempt + 1
                 )
 
-                response = await self._client.request(method, url, **kwargs)
+                response = await client.request(method, url, **kwargs)
 
                 # Log successful requests
                 logger.debug(
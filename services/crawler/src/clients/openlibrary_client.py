@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import logging
+import re
+from collections import OrderedDict
 from typing import Any
 
 import httpx
+import orjson
 import structlog
 
 from src.clients.base_client import BaseHTTPClient
@@ -12,6 +16,41 @@ from src.core.config import settings
 from src.core.exceptions import OpenLibraryError, ValidationError
 
 logger = structlog.get_logger(__name__)
+_stdlib_logger = logging.getLogger(__name__)
+
+# ASCII-only so Unicode digits (e.g. Arabic-Indic) are rejected
+_ISBN13_RE = re.compile(r"\d{13}", re.ASCII)
+
+# Maximum number of ISBNs whose ETag and details are kept for conditional GETs
+_ETAG_CACHE_SIZE = 1024
+
+
+def _response_snippet(response: httpx.Response, limit: int = 500) -> str:
+    """Decode only the first bytes of a response body for logging.
+
+    Args:
+        response: HTTP response to summarize
+        limit: Maximum number of bytes to decode
+
+    Returns:
+        Decoded prefix of the response body
+    """
+    return response.content[:limit].decode("utf-8", "replace")
+
+
+def _validate_isbn13(isbn: str) -> None:
+    """Check that an ISBN is exactly 13 ASCII digits.
+
+    Args:
+        isbn: ISBN-13 identifier
+
+    Raises:
+        ValidationError: On invalid ISBN format
+    """
+    if not _ISBN13_RE.fullmatch(isbn or ""):
+        if len(isbn or "") != 13:
+            raise ValidationError("ISBN must be 13 digits", field="isbn", value=isbn)
+        raise ValidationError("ISBN must contain only digits", field="isbn", value=isbn)
 
 
 class OpenLibraryClient(BaseHTTPClient):
@@ -21,12 +60,17 @@ class OpenLibraryClient(BaseHTTPClient):
         """Initialize OpenLibrary client with configuration."""
         super().__init__(
             base_url=settings.OPENLIBRARY_BASE_URL,
-            max_concurrent=10,
+            # Matches the ExternalAPIService limit on concurrent OpenLibrary calls
+            max_concurrent=settings.MAX_CONCURRENT_REQUESTS,
             rate_limit_per_minute=settings.OPENLIBRARY_RATE_LIMIT,
             timeout=settings.OPENLIBRARY_TIMEOUT,
+            connect_timeout=settings.OPENLIBRARY_CONNECT_TIMEOUT,
             max_retries=settings.OPENLIBRARY_MAX_RETRIES,
         )
 
+        # ISBN -> (ETag, details serialized as JSON bytes), least recently used first
+        self._etag_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+
     async def health_check(self) -> bool:
         """Check if OpenLibrary API is healthy."""
         try:
@@ -49,23 +93,31 @@ class OpenLibraryClient(BaseHTTPClient):
             OpenLibraryError: On API errors
             ValidationError: On invalid ISBN format
         """
-        if not isbn or len(isbn) != 13:
-            raise ValidationError("ISBN must be 13 digits", field="isbn", value=isbn)
+        _validate_isbn13(isbn)
 
-        # Validate ISBN contains only digits
-        if not isbn.isdigit():
-            raise ValidationError(
-                "ISBN must contain only digits", field="isbn", value=isbn
-            )
+        # OpenLibrary keys both the request and the response by "ISBN:{isbn}"
+        book_key = f"ISBN:{isbn}"
 
         # OpenLibrary API endpoint for book details
         path = "/api/books"
-        params = {"bibkeys": f"ISBN:{isbn}", "format": "json", "jscmd": "details"}
+        params = {"bibkeys": book_key, "format": "json", "jscmd": "details"}
 
         logger.info("Fetching book from OpenLibrary", isbn=isbn)
 
+        # Revalidate previously fetched books instead of downloading them again
+        request_kwargs: dict[str, Any] = {"params": params}
+        cached = self._etag_cache.get(isbn)
+        if cached is not None:
+            request_kwargs["headers"] = {"If-None-Match": cached[0]}
+
         try:
-            response = await self.get(path, params=params)
+            response = await self.get(path, **request_kwargs)
+
+            if response.status_code == 304 and cached is not None:
+                logger.info("OpenLibrary book not modified", isbn=isbn)
+                self._etag_cache.move_to_end(isbn)
+                # A fresh copy, so callers cannot alter the cached details
+                return orjson.loads(cached[1])
 
             if response.status_code == 404:
                 logger.info("Book not found in OpenLibrary", isbn=isbn)
@@ -73,27 +125,27 @@ class OpenLibraryClient(BaseHTTPClient):
 
             if response.status_code != 200:
                 error_msg = f"OpenLibrary API returned {response.status_code}"
-                logger.warning(
-                    "OpenLibrary API error",
-                    isbn=isbn,
-                    status_code=response.status_code,
-                    response_text=response.text[:500],
-                )
+                if _stdlib_logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "OpenLibrary API error",
+                        isbn=isbn,
+                        status_code=response.status_code,
+                        response_text=_response_snippet(response),
+                    )
                 raise OpenLibraryError(error_msg, status_code=response.status_code)
 
             try:
-                data = response.json()
+                data = orjson.loads(response.content)
             except Exception as e:
-                logger.error(
-                    "Failed to parse OpenLibrary response as JSON",
-                    isbn=isbn,
-                    error=str(e),
-                    response_text=response.text[:500],
-                )
+                if _stdlib_logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        "Failed to parse OpenLibrary response as JSON",
+                        isbn=isbn,
+                        error=str(e),
+                        response_text=_response_snippet(response),
+                    )
                 raise OpenLibraryError("Invalid JSON response from OpenLibrary") from e
 
-            # OpenLibrary returns data keyed by "ISBN:{isbn}"
-            book_key = f"ISBN:{isbn}"
             if book_key not in data:
                 logger.info(
                     "Book not found in OpenLibrary response",
@@ -114,13 +166,19 @@ class OpenLibraryClient(BaseHTTPClient):
                 return None
 
             details = book_data["details"]
+            self._remember_etag(isbn, response.headers.get("etag"), details)
 
             logger.info(
                 "Successfully fetched book from OpenLibrary",
                 isbn=isbn,
                 title=details.get("title", "Unknown"),
-                authors_count=len(details.get("authors", [])),
             )
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "OpenLibrary book details",
+                    isbn=isbn,
+                    authors_count=len(details.get("authors") or ()),
+                )
 
             return details
 
@@ -145,6 +203,127 @@ class OpenLibraryClient(BaseHTTPClient):
             )
             raise OpenLibraryError(f"Failed to connect to OpenLibrary: {str(e)}") from e
 
+    def _remember_etag(
+        self, isbn: str, etag: str | None, details: dict[str, Any]
+    ) -> None:
+        """Store the ETag and details of a fetched book for revalidation.
+
+        Args:
+            isbn: ISBN-13 identifier
+            etag: ETag response header, if the server sent one
+            details: Parsed book details from the response
+        """
+        if not etag:
+            self._etag_cache.pop(isbn, None)
+            return
+
+        # Stored serialized, so the caller's dict and the cache never alias
+        self._etag_cache[isbn] = (etag, orjson.dumps(details))
+        self._etag_cache.move_to_end(isbn)
+        if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+            self._etag_cache.popitem(last=False)
+
+    async def fetch_books_by_isbns(self, isbns: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch metadata for several books with a single OpenLibrary request.
+
+        The books API accepts a comma-separated list of bibkeys, so a whole
+        batch costs one round trip (and one rate-limit token) instead of one
+        per ISBN. Books OpenLibrary does not know are left out of the result.
+
+        Args:
+            isbns: ISBN-13 identifiers
+
+        Returns:
+            Book metadata dictionaries keyed by ISBN
+
+        Raises:
+            OpenLibraryError: On API errors
+            ValidationError: On invalid ISBN format
+        """
+        for isbn in isbns:
+            _validate_isbn13(isbn)
+
+        # Preserve order while dropping duplicates from the bibkeys list
+        unique_isbns = list(dict.fromkeys(isbns))
+        if not unique_isbns:
+            return {}
+
+        path = "/api/books"
+        params = {
+            "bibkeys": ",".join(f"ISBN:{isbn}" for isbn in unique_isbns),
+            "format": "json",
+            "jscmd": "details",
+        }
+
+        logger.info("Fetching books from OpenLibrary", book_count=len(unique_isbns))
+
+        try:
+            response = await self.get(path, params=params)
+
+            if response.status_code == 404:
+                logger.info(
+                    "Books not found in OpenLibrary", book_count=len(unique_isbns)
+                )
+                return {}
+
+            if response.status_code != 200:
+                error_msg = f"OpenLibrary API returned {response.status_code}"
+                if _stdlib_logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "OpenLibrary API error",
+                        book_count=len(unique_isbns),
+                        status_code=response.status_code,
+                        response_text=_response_snippet(response),
+                    )
+                raise OpenLibraryError(error_msg, status_code=response.status_code)
+
+            try:
+                data = orjson.loads(response.content)
+            except Exception as e:
+                if _stdlib_logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        "Failed to parse OpenLibrary response as JSON",
+                        book_count=len(unique_isbns),
+                        error=str(e),
+                        response_text=_response_snippet(response),
+                    )
+                raise OpenLibraryError("Invalid JSON response from OpenLibrary") from e
+
+            books: dict[str, dict[str, Any]] = {}
+            for isbn in unique_isbns:
+                book_data = data.get(f"ISBN:{isbn}")
+                if book_data and "details" in book_data:
+                    books[isbn] = book_data["details"]
+
+            logger.info(
+                "Successfully fetched books from OpenLibrary",
+                requested=len(unique_isbns),
+                found=len(books),
+            )
+
+            return books
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "HTTP error from OpenLibrary",
+                book_count=len(unique_isbns),
+                status_code=e.response.status_code,
+                error=str(e),
+            )
+            raise OpenLibraryError(
+                f"HTTP {e.response.status_code} from OpenLibrary",
+                status_code=e.response.status_code,
+            ) from e
+
+        except httpx.RequestError as e:
+            logger.error(
+                "Request error to OpenLibrary",
+                book_count=len(unique_isbns),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise OpenLibraryError(f"Failed to connect to OpenLibrary: {str(e)}") from e
+
     async def search_books(
         self, title: str | None = None, author: str | None = None, limit: int = 10
     ) -> list[dict[str, Any]]:
@@ -201,7 +380,7 @@ class OpenLibraryClient(BaseHTTPClient):
                 raise OpenLibraryError(error_msg, status_code=response.status_code)
 
             try:
-                data = response.json()
+                data = orjson.loads(response.content)
             except Exception as e:
                 logger.error("Failed to parse search response as JSON", error=str(e))
                 raise OpenLibraryError(
@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
+from typing import Any
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings
 
 
+@lru_cache(maxsize=256)
+def _join_url(base: str, path: str) -> str:
+    """Join a base URL and path with exactly one slash between them."""
+    return f"{base.rstrip('/')}/{path.lstrip('/')}"
+
+
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
 
@@ -32,9 +40,15 @@ class Settings(BaseSettings):
     OPENLIBRARY_TIMEOUT: float = Field(
         10.0, description="OpenLibrary request timeout in seconds"
     )
+    OPENLIBRARY_CONNECT_TIMEOUT: float = Field(
+        3.0, description="OpenLibrary connection timeout in seconds"
+    )
     OPENLIBRARY_MAX_RETRIES: int = Field(
         3, description="Maximum retry attempts for OpenLibrary requests"
     )
+    OPENLIBRARY_BATCH_SIZE: int = Field(
+        50, gt=0, description="Maximum ISBNs per OpenLibrary bulk lookup"
+    )
 
     # Cache settings
     CACHE_TTL: int = Field(
@@ -82,6 +96,24 @@ class Settings(BaseSettings):
     ENRICHMENT_MIN_QUALITY_SCORE: float = Field(
         0.6, description="Minimum acceptable quality score"
     )
+    ENRICHMENT_CACHE_TTL: int = Field(
+        86400, description="External API response cache TTL in seconds"
+    )
+    ENRICHMENT_CACHE_SIZE: int = Field(
+        10000, description="Maximum number of cached enrichment results"
+    )
+    ENRICHMENT_RESULT_CACHE_TTL: int = Field(
+        86400, description="Completed enrichment result cache TTL in seconds"
+    )
+    ENRICHMENT_NOT_FOUND_CACHE_TTL: int = Field(
+        3600, description="How long ISBNs missing from external sources are skipped"
+    )
+    ENRICHMENT_NOT_FOUND_CACHE_SIZE: int = Field(
+        100000, description="Maximum number of remembered not-found ISBNs"
+    )
+    ENRICHMENT_BATCH_PROGRESS_INTERVAL: int = Field(
+        1000, gt=0, description="Completed books between batch progress logs"
+    )
 
     # Security settings
     SECRET_KEY: str | None = Field(None, description="Secret key for JWT tokens")
@@ -98,6 +130,10 @@ class Settings(BaseSettings):
     ENABLE_METRICS: bool = Field(False, description="Enable metrics collection")
     METRICS_PORT: int = Field(9090, description="Port for metrics endpoint")
 
+    # Environment flags, resolved once at startup
+    _is_development: bool = PrivateAttr(False)
+    _is_production: bool = PrivateAttr(False)
+
     class Config:
         """Pydantic configuration."""
 
@@ -105,22 +141,25 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         case_sensitive = True
 
+    def model_post_init(self, __context: Any) -> None:
+        """Resolve environment-derived flags once after loading settings."""
+        environment = os.getenv("ENVIRONMENT", "").lower()
+        self._is_development = self.DEBUG or environment in ("dev", "development")
+        self._is_production = environment in ("prod", "production")
+
     @property
     def is_development(self) -> bool:
         """Check if running in development mode."""
-        return self.DEBUG or os.getenv("ENVIRONMENT", "").lower() in (
-            "dev",
-            "development",
-        )
+        return self._is_development
 
     @property
     def is_production(self) -> bool:
         """Check if running in production mode."""
-        return os.getenv("ENVIRONMENT", "").lower() in ("prod", "production")
+        return self._is_production
 
     def get_openlibrary_api_url(self, path: str) -> str:
         """Get full OpenLibrary API URL for a path."""
-        return f"{self.OPENLIBRARY_BASE_URL.rstrip('/')}/{path.lstrip('/')}"
+        return _join_url(self.OPENLIBRARY_BASE_URL, path)
 
 
 # Global settings instance
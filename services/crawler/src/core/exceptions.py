@@ -2,12 +2,32 @@
 
 from __future__ import annotations
 
-from typing import Any
+import sys
+from typing import Any, ClassVar
+
+_VALIDATION_ERROR = sys.intern("VALIDATION_ERROR")
+_EXTERNAL_API_ERROR = sys.intern("EXTERNAL_API_ERROR")
+_RATE_LIMIT_ERROR = sys.intern("RATE_LIMIT_ERROR")
+_ENRICHMENT_ERROR = sys.intern("ENRICHMENT_ERROR")
+_DATA_QUALITY_ERROR = sys.intern("DATA_QUALITY_ERROR")
+_CONFIGURATION_ERROR = sys.intern("CONFIGURATION_ERROR")
+_DATABASE_ERROR = sys.intern("DATABASE_ERROR")
+_CONCURRENCY_ERROR = sys.intern("CONCURRENCY_ERROR")
 
 
 class CrawlerServiceError(Exception):
     """Base exception for all crawler service errors."""
 
+    # Only attributes new to each class; BaseException keeps its own storage
+    __slots__ = ("message", "error_code", "context")
+
+    # Class name reported as ``error_type``; set per subclass below
+    _error_type: ClassVar[str] = "CrawlerServiceError"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._error_type = sys.intern(cls.__name__)
+
     def __init__(
         self, message: str, error_code: str | None = None, **context: Any
     ) -> None:
@@ -20,21 +40,24 @@ class CrawlerServiceError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.error_code = error_code
-        self.context = context
+        self.error_code = sys.intern(error_code) if error_code else None
+        # Don't keep the empty kwargs dict alive on every raised error
+        self.context: dict[str, Any] | None = context or None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert error to dictionary representation."""
-        result = {
-            "error_type": self.__class__.__name__,
+        result: dict[str, Any] = {
+            "error_type": self._error_type,
             "message": self.message,
         }
 
-        if self.error_code:
-            result["error_code"] = self.error_code
+        error_code = self.error_code
+        if error_code:
+            result["error_code"] = error_code
 
-        if self.context:
-            result["context"] = self.context
+        context = self.context
+        if context:
+            result["context"] = context
 
         return result
 
@@ -42,6 +65,8 @@ class CrawlerServiceError(Exception):
 class ValidationError(CrawlerServiceError):
     """Error in data validation."""
 
+    __slots__ = ("field", "value")
+
     def __init__(
         self,
         message: str,
@@ -57,7 +82,7 @@ class ValidationError(CrawlerServiceError):
             value: Invalid value
             **context: Additional context
         """
-        super().__init__(message, error_code="VALIDATION_ERROR", **context)
+        super().__init__(message, error_code=_VALIDATION_ERROR, **context)
         self.field = field
         self.value = value
 
@@ -77,12 +102,15 @@ class ValidationError(CrawlerServiceError):
 class ExternalAPIError(CrawlerServiceError):
     """Error communicating with external APIs."""
 
+    __slots__ = ("api_name", "status_code", "response_data")
+
     def __init__(
         self,
         message: str,
         api_name: str | None = None,
         status_code: int | None = None,
         response_data: str | None = None,
+        error_code: str = _EXTERNAL_API_ERROR,
         **context: Any,
     ) -> None:
         """Initialize external API error.
@@ -92,12 +120,14 @@ class ExternalAPIError(CrawlerServiceError):
             api_name: Name of the external API
             status_code: HTTP status code if applicable
             response_data: Response data if available
+            error_code: Error code, overridable by subclasses
             **context: Additional context
         """
-        super().__init__(message, error_code="EXTERNAL_API_ERROR", **context)
+        super().__init__(message, error_code=error_code, **context)
         self.api_name = api_name
         self.status_code = status_code
-        self.response_data = response_data
+        # Truncate long responses up front so the error doesn't pin the full body
+        self.response_data = response_data[:500] if response_data else None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert API error to dictionary."""
@@ -110,9 +140,7 @@ class ExternalAPIError(CrawlerServiceError):
             result["status_code"] = self.status_code
 
         if self.response_data:
-            result["response_data"] = self.response_data[
-                :500
-            ]  # Truncate long responses
+            result["response_data"] = self.response_data
 
         return result
 
@@ -120,6 +148,8 @@ class ExternalAPIError(CrawlerServiceError):
 class OpenLibraryError(ExternalAPIError):
     """Specific error for OpenLibrary API issues."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -140,6 +170,8 @@ class OpenLibraryError(ExternalAPIError):
 class RateLimitError(ExternalAPIError):
     """Error when API rate limits are exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str,
@@ -159,7 +191,7 @@ class RateLimitError(ExternalAPIError):
             message,
             api_name=api_name,
             status_code=429,
-            error_code="RATE_LIMIT_ERROR",
+            error_code=_RATE_LIMIT_ERROR,
             **context,
         )
         self.retry_after = retry_after
@@ -177,12 +209,15 @@ class RateLimitError(ExternalAPIError):
 class EnrichmentError(CrawlerServiceError):
     """Error during book enrichment process."""
 
+    __slots__ = ("isbn", "source", "stage")
+
     def __init__(
         self,
         message: str,
         isbn: str | None = None,
         source: str | None = None,
         stage: str | None = None,
+        error_code: str = _ENRICHMENT_ERROR,
         **context: Any,
     ) -> None:
         """Initialize enrichment error.
@@ -192,9 +227,10 @@ class EnrichmentError(CrawlerServiceError):
             isbn: Book ISBN being processed
             source: Data source name
             stage: Stage of enrichment where error occurred
+            error_code: Error code, overridable by subclasses
             **context: Additional context
         """
-        super().__init__(message, error_code="ENRICHMENT_ERROR", **context)
+        super().__init__(message, error_code=error_code, **context)
         self.isbn = isbn
         self.source = source
         self.stage = stage
@@ -218,6 +254,8 @@ class EnrichmentError(CrawlerServiceError):
 class DataQualityError(EnrichmentError):
     """Error when enriched data quality is below threshold."""
 
+    __slots__ = ("quality_score", "min_score", "missing_fields")
+
     def __init__(
         self,
         message: str,
@@ -237,7 +275,7 @@ class DataQualityError(EnrichmentError):
         """
         super().__init__(
             message,
-            error_code="DATA_QUALITY_ERROR",
+            error_code=_DATA_QUALITY_ERROR,
             stage="quality_validation",
             **context,
         )
@@ -261,6 +299,8 @@ class DataQualityError(EnrichmentError):
 class ConfigurationError(CrawlerServiceError):
     """Error in application configuration."""
 
+    __slots__ = ("config_key",)
+
     def __init__(
         self, message: str, config_key: str | None = None, **context: Any
     ) -> None:
@@ -271,7 +311,7 @@ class ConfigurationError(CrawlerServiceError):
             config_key: Configuration key that caused the error
             **context: Additional context
         """
-        super().__init__(message, error_code="CONFIGURATION_ERROR", **context)
+        super().__init__(message, error_code=_CONFIGURATION_ERROR, **context)
         self.config_key = config_key
 
     def to_dict(self) -> dict[str, Any]:
@@ -287,6 +327,8 @@ class ConfigurationError(CrawlerServiceError):
 class DatabaseError(CrawlerServiceError):
     """Error in database operations."""
 
+    __slots__ = ("operation", "table")
+
     def __init__(
         self,
         message: str,
@@ -302,7 +344,7 @@ class DatabaseError(CrawlerServiceError):
             table: Database table involved
             **context: Additional context
         """
-        super().__init__(message, error_code="DATABASE_ERROR", **context)
+        super().__init__(message, error_code=_DATABASE_ERROR, **context)
         self.operation = operation
         self.table = table
 
@@ -322,6 +364,8 @@ class DatabaseError(CrawlerServiceError):
 class ConcurrencyError(CrawlerServiceError):
     """Error related to concurrent request processing."""
 
+    __slots__ = ("current_requests", "max_requests")
+
     def __init__(
         self,
         message: str,
@@ -337,7 +381,7 @@ class ConcurrencyError(CrawlerServiceError):
             max_requests: Maximum allowed requests
             **context: Additional context
         """
-        super().__init__(message, error_code="CONCURRENCY_ERROR", **context)
+        super().__init__(message, error_code=_CONCURRENCY_ERROR, **context)
         self.current_requests = current_requests
         self.max_requests = max_requests
 
@@ -4,13 +4,29 @@ from __future__ import annotations
 
 import logging
 import sys
-from typing import Any
+from typing import Any, ClassVar
 
+import orjson
 import structlog
 
 from src.core.config import settings
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer.
+
+    Args:
+        obj: Event dictionary to serialize
+        **kwargs: Renderer options; only ``default`` is honored
+
+    Returns:
+        JSON string, since stdlib logging handlers expect text
+    """
+    return orjson.dumps(
+        obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
 def setup_logging() -> None:
     """Configure structured logging for the application."""
 
@@ -41,7 +57,7 @@ def setup_logging() -> None:
     else:
         processors.extend(
             [
-                structlog.processors.JSONRenderer(),
+                structlog.processors.JSONRenderer(serializer=_orjson_dumps),
             ]
         )
 
@@ -70,13 +86,18 @@ def get_logger(name: str) -> structlog.BoundLogger:
 class LoggerMixin:
     """Mixin class to add structured logging to any class."""
 
+    # One logger per class, shared by all of its instances
+    _class_loggers: ClassVar[dict[type, structlog.BoundLogger]] = {}
+
     @property
     def logger(self) -> structlog.BoundLogger:
         """Get logger instance for this class."""
-        if not hasattr(self, "_logger"):
-            class_name = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
-            self._logger = structlog.get_logger(class_name)
-        return self._logger
+        cls = type(self)
+        logger = LoggerMixin._class_loggers.get(cls)
+        if logger is None:
+            logger = structlog.get_logger(f"{cls.__module__}.{cls.__qualname__}")
+            LoggerMixin._class_loggers[cls] = logger
+        return logger
 
 
 def log_function_call(func_name: str, **kwargs: Any) -> dict[str, Any]:
@@ -87,12 +108,10 @@ def log_function_call(func_name: str, **kwargs: Any) -> dict[str, Any]:
         **kwargs: Function arguments to log
 
     Returns:
-        Logging context dictionary
+        Flat logging context to pass as keyword arguments
     """
-    context = {
-        "function": func_name,
-        "args": {k: v for k, v in kwargs.items() if not k.startswith("_")},
-    }
+    context = {k: v for k, v in kwargs.items() if not k.startswith("_")}
+    context["function"] = func_name
     return context
 
 
@@ -109,26 +128,20 @@ def log_api_request(
         **extra: Additional context
 
     Returns:
-        Logging context dictionary
+        Flat logging context to pass as keyword arguments
     """
-    context = {
-        "api_request": {
-            "method": method,
-            "url": url,
-            "status_code": status_code,
-            "response_time": response_time,
-        }
-    }
-    context.update(extra)
-    return context
+    extra.update(
+        method=method, url=url, status_code=status_code, response_time=response_time
+    )
+    return extra
 
 
 def log_enrichment_request(
     isbn: str,
     source: str,
     success: bool,
-    quality_score: float = None,
-    error: str = None,
+    quality_score: float | None = None,
+    error: str | None = None,
     **extra: Any,
 ) -> dict[str, Any]:
     """Create log context for book enrichment requests.
@@ -142,21 +155,14 @@ def log_enrichment_request(
         **extra: Additional context
 
     Returns:
-        Logging context dictionary
+        Flat logging context to pass as keyword arguments
     """
-    context = {
-        "enrichment": {
-            "isbn": isbn,
-            "source": source,
-            "success": success,
-        }
-    }
+    extra.update(isbn=isbn, source=source, success=success)
 
     if quality_score is not None:
-        context["enrichment"]["quality_score"] = quality_score
+        extra["quality_score"] = quality_score
 
     if error:
-        context["enrichment"]["error"] = error
+        extra["error"] = error
 
-    context.update(extra)
-    return context
+    return extra
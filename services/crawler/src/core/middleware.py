@@ -0,0 +1,45 @@
+"""HTTP middleware for the book crawler service."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from starlette.middleware.cors import CORSMiddleware
+
+
+class AllowlistCORSMiddleware(CORSMiddleware):
+    """CORS middleware that checks origins, methods and headers against sets.
+
+    Starlette keeps the configured allowlists as sequences and scans them on
+    every request; this subclass freezes them once at startup so each check
+    is a single hash lookup.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize middleware and precompute membership sets.
+
+        Args:
+            *args: Positional arguments for CORSMiddleware
+            **kwargs: Keyword arguments for CORSMiddleware
+        """
+        super().__init__(*args, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+        self.allow_methods = frozenset(self.allow_methods)
+        self.allow_headers = frozenset(self.allow_headers)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        """Check whether a request origin is allowed.
+
+        Args:
+            origin: Value of the request Origin header
+
+        Returns:
+            True if the origin may access the API
+        """
+        if self.allow_all_origins or origin in self.allow_origins:
+            return True
+
+        return (
+            self.allow_origin_regex is not None
+            and self.allow_origin_regex.fullmatch(origin) is not None
+        )
@@ -7,11 +7,13 @@ from typing import Any
 
 import uvicorn
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api import enrichment, health
 from src.core.config import settings
 from src.core.logging import setup_logging
+from src.core.middleware import AllowlistCORSMiddleware
+from src.services.enrichment_service import BookEnrichmentService
 
 
 @asynccontextmanager
@@ -20,7 +22,12 @@ async def lifespan(app: FastAPI) -> Any:  # type: ignore
     # Startup
     setup_logging()
     print("🚀 EzLib Book Crawler Service starting up...")
-    yield
+
+    # Share one enrichment service (and its pooled HTTP clients) across requests
+    async with BookEnrichmentService() as enrichment_service:
+        app.state.enrichment_service = enrichment_service
+        yield
+
     # Shutdown
     print("🛑 EzLib Book Crawler Service shutting down...")
 
@@ -33,11 +40,12 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
 app.add_middleware(
-    CORSMiddleware,
+    AllowlistCORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
@@ -67,4 +75,6 @@ if __name__ == "__main__":
         port=8000,
         reload=True,
         log_level="info",
+        # Uses uvloop where installed (all non-Windows deployments)
+        loop="auto",
     )
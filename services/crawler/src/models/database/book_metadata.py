@@ -2,13 +2,96 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
+import re
+import time
+from datetime import UTC, date, datetime
+from typing import Any, NamedTuple
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 from src.models.external.openlibrary_models import OpenLibraryBookDetails
 
+# Author name normalization patterns
+_TITLE_PREFIX_RE = re.compile(r"\b(dr|prof|mr|mrs|ms|sir|dame)\.?\s+")
+_NAME_SUFFIX_RE = re.compile(r"\s+(jr|sr|ii|iii|iv)\.?$")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+# Latest accepted publication year, refreshed daily instead of per validation
+_MAX_PUB_YEAR_REFRESH_SECONDS = 86400
+_max_pub_year = datetime.now().year + 2
+_max_pub_year_refresh_at = time.monotonic() + _MAX_PUB_YEAR_REFRESH_SECONDS
+
+
+def _get_max_pub_year() -> int:
+    """Return the latest accepted publication year."""
+    global _max_pub_year, _max_pub_year_refresh_at
+
+    now = time.monotonic()
+    if now >= _max_pub_year_refresh_at:
+        _max_pub_year = datetime.now().year + 2
+        _max_pub_year_refresh_at = now + _MAX_PUB_YEAR_REFRESH_SECONDS
+
+    return _max_pub_year
+
+
+def _is_reasonable_year(year: int) -> bool:
+    """Check that a publication year falls in the accepted range."""
+    return 1450 <= year <= _get_max_pub_year()
+
+
+def _clean_authors(v: list[str]) -> list[str]:
+    """Strip author names, dropping empty and overlong entries."""
+    if not v:
+        return []
+
+    # Clean and filter author names
+    cleaned_authors = []
+    for author in v:
+        if author and isinstance(author, str):
+            cleaned = author.strip()
+            if cleaned and len(cleaned) <= 200:
+                cleaned_authors.append(cleaned)
+
+    return cleaned_authors
+
+
+def _clean_subjects(v: list[str]) -> list[str]:
+    """Deduplicate subject tags case-insensitively, keeping at most 10."""
+    if not v:
+        return []
+
+    # Lowercased key -> first stripped spelling, in insertion order
+    cleaned: dict[str, str] = {}
+    for subject in v:
+        if not (subject and isinstance(subject, str)):
+            continue
+        stripped = subject.strip()
+        key = stripped.lower()
+        if key and len(key) <= 100 and key not in cleaned:
+            cleaned[key] = stripped
+            if len(cleaned) == 10:  # Limit to 10 subjects
+                break
+
+    return list(cleaned.values())
+
+
+def _clean_cover_url(v: str | None) -> str | None:
+    """Return the cover URL if it is a plausible HTTP(S) URL, else None."""
+    if not v:
+        return None
+
+    if not v.startswith(("http://", "https://")):
+        return None
+
+    # Basic URL validation
+    if len(v) > 500:
+        return None
+
+    return v
+
 
 class BookMetadata(BaseModel):
     """Standardized book metadata model for internal use."""
@@ -31,85 +114,47 @@ class BookMetadata(BaseModel):
     # Metadata about the enrichment
     source: str = Field("openlibrary", description="Data source identifier")
     enriched_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Enrichment timestamp"
+        default_factory=lambda: datetime.now(UTC), description="Enrichment timestamp"
     )
     quality_score: float | None = Field(
         None, ge=0.0, le=1.0, description="Data quality score"
     )
 
-    @validator("publication_date")
+    @field_validator("publication_date", mode="after")
+    @classmethod
     def validate_publication_date(cls, v: date | None) -> date | None:
         """Validate publication date is reasonable."""
-        if v is None:
-            return v
-
-        current_year = datetime.now().year
-        if v.year < 1450 or v.year > current_year + 2:
+        if v is not None and not _is_reasonable_year(v.year):
             raise ValueError(f"Publication year {v.year} is not reasonable")
 
         return v
 
-    @validator("publication_year")
+    @field_validator("publication_year", mode="after")
+    @classmethod
     def validate_publication_year(cls, v: int | None) -> int | None:
         """Validate publication year is reasonable."""
-        if v is None:
-            return v
-
-        current_year = datetime.now().year
-        if v < 1450 or v > current_year + 2:
+        if v is not None and not _is_reasonable_year(v):
             raise ValueError(f"Publication year {v} is not reasonable")
 
         return v
 
-    @validator("authors")
+    @field_validator("authors", mode="after")
+    @classmethod
     def validate_authors(cls, v: list[str]) -> list[str]:
         """Validate and clean author names."""
-        if not v:
-            return []
-
-        # Clean and filter author names
-        cleaned_authors = []
-        for author in v:
-            if author and isinstance(author, str):
-                cleaned = author.strip()
-                if cleaned and len(cleaned) <= 200:
-                    cleaned_authors.append(cleaned)
-
-        return cleaned_authors
+        return _clean_authors(v)
 
-    @validator("subjects")
+    @field_validator("subjects", mode="after")
+    @classmethod
     def validate_subjects(cls, v: list[str]) -> list[str]:
         """Validate and clean subject tags."""
-        if not v:
-            return []
-
-        # Clean and deduplicate subjects
-        cleaned_subjects = []
-        seen = set()
+        return _clean_subjects(v)
 
-        for subject in v:
-            if subject and isinstance(subject, str):
-                cleaned = subject.strip().lower()
-                if cleaned and cleaned not in seen and len(cleaned) <= 100:
-                    cleaned_subjects.append(subject.strip())  # Keep original casing
-                    seen.add(cleaned)
-
-        return cleaned_subjects[:10]  # Limit to 10 subjects
-
-    @validator("cover_image_url")
+    @field_validator("cover_image_url", mode="after")
+    @classmethod
     def validate_cover_url(cls, v: str | None) -> str | None:
         """Validate cover image URL."""
-        if not v:
-            return None
-
-        if not v.startswith(("http://", "https://")):
-            return None
-
-        # Basic URL validation
-        if len(v) > 500:
-            return None
-
-        return v
+        return _clean_cover_url(v)
 
     def calculate_quality_score(self) -> float:
         """Calculate data quality score based on completeness and validity.
@@ -117,134 +162,122 @@ class BookMetadata(BaseModel):
         Returns:
             Quality score between 0.0 and 1.0
         """
-        score = 0.0
-        max_score = 0.0
-
-        # Core fields (higher weight)
-        if self.title:
-            score += 0.2
-        max_score += 0.2
-
-        if self.authors:
-            score += 0.2
-        max_score += 0.2
-
-        if self.isbn_13 and len(self.isbn_13) == 13:
-            score += 0.15
-        max_score += 0.15
-
-        # Important fields (medium weight)
-        if self.publication_date or self.publication_year:
-            score += 0.1
-        max_score += 0.1
-
-        if self.publisher:
-            score += 0.1
-        max_score += 0.1
-
-        # Nice-to-have fields (lower weight)
-        if self.cover_image_url:
-            score += 0.1
-        max_score += 0.1
-
-        if self.description:
-            score += 0.05
-        max_score += 0.05
-
-        if self.page_count:
-            score += 0.05
-        max_score += 0.05
-
-        if self.subjects:
-            score += 0.05
-        max_score += 0.05
-
-        return score / max_score if max_score > 0 else 0.0
+        # Weights sum to 1.0: core fields (0.2/0.2/0.15), important fields
+        # (0.1/0.1), nice-to-have fields (0.1/0.05/0.05/0.05)
+        return (
+            0.2 * bool(self.title)
+            + 0.2 * bool(self.authors)
+            + 0.15 * bool(self.isbn_13 and len(self.isbn_13) == 13)
+            + 0.1 * bool(self.publication_date or self.publication_year)
+            + 0.1 * bool(self.publisher)
+            + 0.1 * bool(self.cover_image_url)
+            + 0.05 * bool(self.description)
+            + 0.05 * bool(self.page_count)
+            + 0.05 * bool(self.subjects)
+        )
 
     @classmethod
     def from_openlibrary(
-        cls, isbn: str, ol_details: OpenLibraryBookDetails
+        cls,
+        isbn: str,
+        ol_details: OpenLibraryBookDetails,
+        enriched_at: datetime | None = None,
     ) -> BookMetadata:
         """Create BookMetadata from OpenLibrary details.
 
         Args:
             isbn: The ISBN-13 used for the request
             ol_details: OpenLibrary book details
+            enriched_at: Enrichment timestamp, so a batch can share one;
+                defaults to now
 
         Returns:
             Standardized BookMetadata instance
         """
+        publishers = ol_details.publishers
+        publish_date = ol_details.publish_date
+
         # Extract publication info
         pub_year = ol_details.get_publication_year()
         pub_date = None
 
         # Try to create date if we have enough info
-        if pub_year and ol_details.publish_date:
+        if pub_year and publish_date:
             try:
                 # Simple date parsing - can be enhanced later
-                if len(ol_details.publish_date) >= 4:
+                if len(publish_date) >= 4:
                     pub_date = date(pub_year, 1, 1)  # Default to Jan 1st
             except (ValueError, TypeError):
                 pass
 
-        # Get primary publisher
-        primary_publisher = None
-        if ol_details.publishers:
-            primary_publisher = ol_details.publishers[0]
-
-        # Create metadata instance
-        metadata = cls(
-            isbn_13=isbn,
-            title=ol_details.title or "Unknown Title",
-            subtitle=ol_details.subtitle,
-            authors=ol_details.get_author_names(),
-            publication_date=pub_date,
-            publication_year=pub_year,
-            publisher=primary_publisher,
-            publishers=ol_details.publishers,
-            page_count=ol_details.number_of_pages,
-            cover_image_url=ol_details.get_cover_url("L"),  # Large cover
-            description=ol_details.description,
-            subjects=ol_details.subjects,
-            isbn_10=ol_details.get_primary_isbn_10(),
-            source="openlibrary",
+        # Run the field cleaners once up front; OpenLibrary details are already
+        # parsed, so skip pydantic validation unless a field constraint would fail
+        fields = {
+            "isbn_13": isbn,
+            "title": ol_details.title or "Unknown Title",
+            "subtitle": ol_details.subtitle,
+            "authors": _clean_authors(ol_details.get_author_names()),
+            "publication_date": pub_date,
+            "publication_year": pub_year,
+            "publisher": publishers[0] if publishers else None,
+            "publishers": list(publishers),
+            "page_count": ol_details.number_of_pages,
+            "cover_image_url": _clean_cover_url(ol_details.get_cover_url("L")),
+            "description": ol_details.description,
+            "subjects": _clean_subjects(ol_details.subjects),
+            "isbn_10": ol_details.get_primary_isbn_10(),
+            "source": "openlibrary",
+        }
+        if enriched_at is not None:
+            fields["enriched_at"] = enriched_at
+        if _fits_constraints(fields):
+            metadata = cls.model_construct(**fields)
+        else:
+            # Full validation raises the same errors as before
+            metadata = cls(**fields)
+
+        # Calculate and set quality score, bypassing model __setattr__
+        object.__setattr__(
+            metadata, "quality_score", metadata.calculate_quality_score()
         )
 
-        # Calculate and set quality score
-        metadata.quality_score = metadata.calculate_quality_score()
-
         return metadata
 
     def is_high_quality(self, min_score: float = 0.7) -> bool:
         """Check if metadata meets quality threshold."""
-        if self.quality_score is None:
-            self.quality_score = self.calculate_quality_score()
+        quality_score = self.quality_score
+        if quality_score is None:
+            quality_score = self.calculate_quality_score()
+            object.__setattr__(self, "quality_score", quality_score)
 
-        return self.quality_score >= min_score
+        return quality_score >= min_score
 
     def get_missing_fields(self) -> list[str]:
         """Get list of important missing fields."""
-        missing = []
-
-        if not self.title or self.title == "Unknown Title":
-            missing.append("title")
-
-        if not self.authors:
-            missing.append("authors")
-
-        if not self.publication_date and not self.publication_year:
-            missing.append("publication_date")
-
-        if not self.publisher:
-            missing.append("publisher")
-
-        if not self.cover_image_url:
-            missing.append("cover_image")
-
-        if not self.description:
-            missing.append("description")
-
-        return missing
+        checks = (
+            ("title", not self.title or self.title == "Unknown Title"),
+            ("authors", not self.authors),
+            ("publication_date", not (self.publication_date or self.publication_year)),
+            ("publisher", not self.publisher),
+            ("cover_image", not self.cover_image_url),
+            ("description", not self.description),
+        )
+        return [name for name, missing in checks if missing]
+
+
+def _fits_constraints(fields: dict[str, Any]) -> bool:
+    """Check the BookMetadata field constraints that cleaners don't enforce."""
+    subtitle = fields["subtitle"]
+    publisher = fields["publisher"]
+    page_count = fields["page_count"]
+    year = fields["publication_year"]
+    return (
+        1 <= len(fields["title"]) <= 500
+        and (subtitle is None or len(subtitle) <= 200)
+        and (publisher is None or len(publisher) <= 200)
+        and (page_count is None or 1 <= page_count <= 10000)
+        and (year is None or _is_reasonable_year(year))
+    )
 
 
 class AuthorData(BaseModel):
@@ -252,53 +285,86 @@ class AuthorData(BaseModel):
 
     id: UUID | None = Field(None, description="Author UUID")
     name: str = Field(..., min_length=1, max_length=200, description="Author name")
-    canonical_name: str = Field(..., description="Normalized name for deduplication")
+    canonical_name: str = Field(
+        "", validate_default=True, description="Normalized name for deduplication"
+    )
     birth_date: date | None = Field(None, description="Birth date")
     death_date: date | None = Field(None, description="Death date")
     nationality: str | None = Field(None, max_length=100, description="Nationality")
     biography: str | None = Field(None, description="Author biography")
     photo_url: str | None = Field(None, description="Author photo URL")
 
-    @validator("canonical_name", pre=True, always=True)
-    def generate_canonical_name(cls, v: str | None, values: dict) -> str:
+    @field_validator("canonical_name", mode="before")
+    @classmethod
+    def generate_canonical_name(cls, v: str | None, info: ValidationInfo) -> str:
         """Generate canonical name for deduplication."""
         if v:
             return v
 
-        name = values.get("name", "")
+        name = info.data.get("name", "")
         if not name:
             return ""
 
         # Normalize name for deduplication
-        import re
-
         # Convert to lowercase
         canonical = name.lower()
 
         # Remove common prefixes/suffixes
-        canonical = re.sub(r"\b(dr|prof|mr|mrs|ms|sir|dame)\.?\s+", "", canonical)
-        canonical = re.sub(r"\s+(jr|sr|ii|iii|iv)\.?$", "", canonical)
+        canonical = _TITLE_PREFIX_RE.sub("", canonical)
+        canonical = _NAME_SUFFIX_RE.sub("", canonical)
 
         # Remove extra whitespace and punctuation
-        canonical = re.sub(r"[^\w\s]", "", canonical)
-        canonical = re.sub(r"\s+", " ", canonical).strip()
+        canonical = _NON_WORD_RE.sub("", canonical)
+        canonical = _WHITESPACE_RE.sub(" ", canonical).strip()
 
         return canonical
 
 
-class BookContributor(BaseModel):
-    """Book-contributor relationship model."""
+_VALID_CONTRIBUTION_TYPES = frozenset(
+    {"author", "editor", "translator", "illustrator", "contributor"}
+)
+
+
+class BookContributor(NamedTuple):
+    """Book-contributor relationship row.
+
+    Build instances with ``make_contributor`` so the contribution type is
+    validated; the tuple itself performs no checks.
+    """
+
+    book_id: UUID
+    author_id: UUID
+    contribution_type: str = "author"
+    contribution_order: int | None = None
 
-    book_id: UUID = Field(..., description="Book UUID")
-    author_id: UUID = Field(..., description="Author UUID")
-    contribution_type: str = Field("author", description="Type of contribution")
-    contribution_order: int | None = Field(None, description="Order of contribution")
 
-    @validator("contribution_type")
-    def validate_contribution_type(cls, v: str) -> str:
-        """Validate contribution type."""
-        valid_types = {"author", "editor", "translator", "illustrator", "contributor"}
-        if v.lower() not in valid_types:
-            raise ValueError(f"Invalid contribution type: {v}")
+def make_contributor(
+    book_id: UUID | str,
+    author_id: UUID | str,
+    contribution_type: str = "author",
+    contribution_order: int | None = None,
+) -> BookContributor:
+    """Create a validated book-contributor relationship.
 
-        return v.lower()
+    Args:
+        book_id: Book UUID
+        author_id: Author UUID
+        contribution_type: Type of contribution
+        contribution_order: Order of contribution
+
+    Returns:
+        BookContributor with a normalized contribution type
+
+    Raises:
+        ValueError: If the contribution type or an ID is invalid
+    """
+    normalized_type = contribution_type.lower()
+    if normalized_type not in _VALID_CONTRIBUTION_TYPES:
+        raise ValueError(f"Invalid contribution type: {contribution_type}")
+
+    return BookContributor(
+        book_id if isinstance(book_id, UUID) else UUID(book_id),
+        author_id if isinstance(author_id, UUID) else UUID(author_id),
+        normalized_type,
+        contribution_order,
+    )
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+_uuid4 = uuid.uuid4
 
 
 class EnrichmentStatus(str, Enum):
@@ -18,6 +21,12 @@ class EnrichmentStatus(str, Enum):
     PARTIAL = "partial"
 
 
+# str-based members hash like their values, so raw status strings match too
+_TERMINAL_STATUSES = frozenset(
+    {EnrichmentStatus.SUCCESS, EnrichmentStatus.FAILED, EnrichmentStatus.PARTIAL}
+)
+
+
 class ErrorCategory(str, Enum):
     """Error category enumeration for classification."""
 
@@ -29,7 +38,7 @@ class ErrorCategory(str, Enum):
     UNKNOWN_ERROR = "unknown_error"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorDetails:
     """Detailed error information."""
 
@@ -46,12 +55,20 @@ class ErrorDetails:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
-        result = asdict(self)
-        result["timestamp"] = self.timestamp.isoformat()
-        return result
+        category = self.category
+        return {
+            "category": (
+                category.value if isinstance(category, ErrorCategory) else category
+            ),
+            "message": self.message,
+            "api_source": self.api_source,
+            "field_name": self.field_name,
+            "error_code": self.error_code,
+            "timestamp": self.timestamp.isoformat(),
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingMetrics:
     """Metrics for enrichment processing."""
 
@@ -77,11 +94,16 @@ class ProcessingMetrics:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
-        result = asdict(self)
-        result["started_at"] = self.started_at.isoformat()
-        if self.completed_at:
-            result["completed_at"] = self.completed_at.isoformat()
-        return result
+        completed_at = self.completed_at
+        return {
+            "started_at": self.started_at.isoformat(),
+            "completed_at": completed_at.isoformat() if completed_at else None,
+            "processing_time_seconds": self.processing_time_seconds,
+            "api_calls_made": self.api_calls_made,
+            "cache_hits": self.cache_hits,
+            "sources_used": list(self.sources_used),
+            "retry_attempts": self.retry_attempts,
+        }
 
 
 class EnrichmentJob(BaseModel):
@@ -135,30 +157,48 @@ class EnrichmentJob(BaseModel):
         default_factory=list, description="List of data quality concerns"
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            ErrorCategory: lambda v: v.value,
-            EnrichmentStatus: lambda v: v.value,
+    # Fields exposed by to_summary_dict
+    _SUMMARY_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "job_id",
+            "correlation_id",
+            "isbn",
+            "status",
+            "created_at",
+            "updated_at",
+            "quality_score",
+            "has_warnings",
+            "requires_review",
+            "error_message",
         }
+    )
+
+    # Datetimes and enums serialize natively in pydantic-core. Setters write
+    # fields on every status change, so keep assignment unvalidated.
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=False)
+
+    def _touch(self, now: datetime | None = None) -> None:
+        """Set updated_at, reusing a caller's timestamp when given."""
+        self.updated_at = now or datetime.utcnow()
 
-    def update_status(self, status: EnrichmentStatus) -> None:
+    def update_status(
+        self, status: EnrichmentStatus, now: datetime | None = None
+    ) -> None:
         """Update job status and timestamp.
 
         Args:
             status: New status to set
+            now: Timestamp to record; defaults to the current time
         """
         self.status = status
-        self.updated_at = datetime.utcnow()
+        self._touch(now)
 
     def set_error(
         self,
         error: str,
         category: ErrorCategory = ErrorCategory.UNKNOWN_ERROR,
         details: ErrorDetails | None = None,
+        now: datetime | None = None,
     ) -> None:
         """Set error information and update status.
 
@@ -166,59 +206,73 @@ class EnrichmentJob(BaseModel):
             error: Error message
             category: Error category
             details: Detailed error information
+            now: Timestamp to record; defaults to the current time
         """
         self.error_message = error
         self.error_category = category
         self.status = EnrichmentStatus.FAILED
-        self.updated_at = datetime.utcnow()
+        self._touch(now)
 
         if details:
             self.error_details = details.to_dict()
 
     def set_quality_scores(
-        self, quality_score: float, completeness_score: float | None = None
+        self,
+        quality_score: float,
+        completeness_score: float | None = None,
+        now: datetime | None = None,
     ) -> None:
         """Set quality assessment scores.
 
         Args:
             quality_score: Overall quality score
             completeness_score: Data completeness score
+            now: Timestamp to record; defaults to the current time
         """
         self.quality_score = quality_score
         if completeness_score is not None:
             self.completeness_score = completeness_score
-        self.updated_at = datetime.utcnow()
+        self._touch(now)
 
-    def add_quality_warnings(self, warnings: list[str]) -> None:
+    def add_quality_warnings(
+        self, warnings: list[str], now: datetime | None = None
+    ) -> None:
         """Add quality warning flags.
 
         Args:
             warnings: List of quality warning messages
+            now: Timestamp to record; defaults to the current time
         """
         if warnings:
             self.has_warnings = True
             self.suspicious_data_flags.extend(warnings)
-            self.updated_at = datetime.utcnow()
+            self._touch(now)
 
-    def mark_for_review(self, reason: str = None) -> None:
+    def mark_for_review(self, reason: str = None, now: datetime | None = None) -> None:
         """Mark job as requiring manual review.
 
         Args:
             reason: Reason for requiring review
+            now: Timestamp to record; defaults to the current time
         """
         self.requires_review = True
         if reason:
             self.suspicious_data_flags.append(f"Review required: {reason}")
-        self.updated_at = datetime.utcnow()
+        self._touch(now)
 
-    def set_processing_metrics(self, metrics: ProcessingMetrics) -> None:
+    def set_processing_metrics(
+        self, metrics: ProcessingMetrics, now: datetime | None = None
+    ) -> None:
         """Set processing performance metrics.
 
         Args:
             metrics: Processing metrics to store
+            now: Timestamp to record; defaults to the current time
         """
+        # Stored as a plain dict so attribute reads and every dump option
+        # (exclude_none, include, exclude) see the same metrics
         self.processing_metrics = metrics.to_dict()
-        self.updated_at = datetime.utcnow()
+        self._touch(now)
 
     def is_completed(self) -> bool:
         """Check if job has completed (successfully or with errors).
@@ -226,11 +280,7 @@ class EnrichmentJob(BaseModel):
         Returns:
             True if job is in a terminal state
         """
-        return self.status in [
-            EnrichmentStatus.SUCCESS,
-            EnrichmentStatus.FAILED,
-            EnrichmentStatus.PARTIAL,
-        ]
+        return self.status in _TERMINAL_STATUSES
 
     def is_successful(self) -> bool:
         """Check if job completed successfully.
@@ -256,19 +306,9 @@ class EnrichmentJob(BaseModel):
         Returns:
             Dictionary with key job information
         """
-        return {
-            "job_id": self.job_id,
-            "correlation_id": self.correlation_id,
-            "isbn": self.isbn,
-            "status": self.status,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "quality_score": self.quality_score,
-            "has_warnings": self.has_warnings,
-            "requires_review": self.requires_review,
-            "error_message": self.error_message,
-            "processing_time": self.get_duration(),
-        }
+        summary = self.model_dump(mode="json", include=self._SUMMARY_FIELDS)
+        summary["processing_time"] = self.get_duration()
+        return summary
 
     @classmethod
     def create_job(
@@ -285,10 +325,8 @@ class EnrichmentJob(BaseModel):
         Returns:
             New EnrichmentJob instance
         """
-        import uuid
-
         if correlation_id is None:
-            correlation_id = str(uuid.uuid4())
+            correlation_id = str(_uuid4())
 
         return cls(job_id=job_id, correlation_id=correlation_id, isbn=isbn, **kwargs)
 
@@ -322,16 +360,29 @@ class BatchEnrichmentJob(BaseModel):
         default_factory=list, description="List of individual job IDs"
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    # Fields exposed by to_summary_dict, alongside the derived rates
+    _SUMMARY_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "batch_id",
+            "status",
+            "total_books",
+            "completed_jobs",
+            "successful_jobs",
+            "failed_jobs",
+            "partial_jobs",
+            "created_at",
+            "updated_at",
+            "started_at",
+            "completed_at",
+        }
+    )
 
     def start_processing(self) -> None:
         """Mark batch as started."""
-        self.started_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.started_at = now
         self.status = "processing"
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
 
     def update_progress(
         self, completed: int = 0, successful: int = 0, failed: int = 0, partial: int = 0
@@ -348,17 +399,23 @@ class BatchEnrichmentJob(BaseModel):
         self.successful_jobs += successful
         self.failed_jobs += failed
         self.partial_jobs += partial
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.updated_at = now
 
         # Check if batch is complete
         if self.completed_jobs >= self.total_books:
-            self.complete_batch()
+            self.complete_batch(now)
 
-    def complete_batch(self) -> None:
-        """Mark batch as completed."""
-        self.completed_at = datetime.utcnow()
+    def complete_batch(self, now: datetime | None = None) -> None:
+        """Mark batch as completed.
+
+        Args:
+            now: Completion timestamp; defaults to the current time
+        """
+        now = now or datetime.utcnow()
+        self.completed_at = now
         self.status = "completed"
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
 
     def get_success_rate(self) -> float:
         """Calculate batch success rate.
@@ -386,20 +443,7 @@ class BatchEnrichmentJob(BaseModel):
         Returns:
             Dictionary with batch status information
         """
-        return {
-            "batch_id": self.batch_id,
-            "status": self.status,
-            "total_books": self.total_books,
-            "completed_jobs": self.completed_jobs,
-            "successful_jobs": self.successful_jobs,
-            "failed_jobs": self.failed_jobs,
-            "partial_jobs": self.partial_jobs,
-            "success_rate": self.get_success_rate(),
-            "progress_percentage": self.get_progress_percentage(),
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat()
-            if self.completed_at
-            else None,
-        }
+        summary = self.model_dump(mode="json", include=self._SUMMARY_FIELDS)
+        summary["success_rate"] = self.get_success_rate()
+        summary["progress_percentage"] = self.get_progress_percentage()
+        return summary
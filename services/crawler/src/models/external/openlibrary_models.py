@@ -2,24 +2,31 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+from typing_extensions import TypedDict
 
+# 4-digit publication years 1500-2199; the bounds mirror the pattern
+_YEAR_RE = re.compile(r"\b(1[5-9]\d\d|20\d\d|21\d\d)\b")
+_MIN_YEAR = 1500
+_MAX_YEAR = 2199
 
-class OpenLibraryAuthor(BaseModel):
+
+class OpenLibraryAuthor(TypedDict, total=False):
     """OpenLibrary author information."""
 
-    key: str | None = Field(None, description="OpenLibrary author key")
-    name: str | None = Field(None, description="Author name")
+    key: str | None  # OpenLibrary author key
+    name: str | None  # Author name
 
 
-class OpenLibraryCover(BaseModel):
+class OpenLibraryCover(TypedDict, total=False):
     """OpenLibrary cover information."""
 
-    small: str | None = Field(None, description="Small cover image URL")
-    medium: str | None = Field(None, description="Medium cover image URL")
-    large: str | None = Field(None, description="Large cover image URL")
+    small: str | None  # Small cover image URL
+    medium: str | None  # Medium cover image URL
+    large: str | None  # Large cover image URL
 
 
 class OpenLibraryBookDetails(BaseModel):
@@ -40,7 +47,13 @@ class OpenLibraryBookDetails(BaseModel):
     subjects: list[str] = Field(default_factory=list, description="Subject tags")
     key: str | None = Field(None, description="OpenLibrary book key")
 
-    @validator("authors", pre=True)
+    # Memoized accessor results
+    _author_names: tuple[list[OpenLibraryAuthor], list[str]] | None = PrivateAttr(None)
+    _cover_urls_source: list[int] | None = PrivateAttr(None)
+    _cover_urls: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    @field_validator("authors", mode="before")
+    @classmethod
     def parse_authors(cls, v: Any) -> list[OpenLibraryAuthor]:
         """Parse authors from various OpenLibrary formats."""
         if not v:
@@ -53,14 +66,17 @@ class OpenLibraryBookDetails(BaseModel):
         for author in v:
             if isinstance(author, dict):
                 # Handle {"key": "/authors/...", "name": "..."}
-                authors.append(OpenLibraryAuthor(**author))
+                authors.append(
+                    OpenLibraryAuthor(key=author.get("key"), name=author.get("name"))
+                )
             elif isinstance(author, str):
                 # Handle plain string names
                 authors.append(OpenLibraryAuthor(name=author))
 
         return authors
 
-    @validator("description", pre=True)
+    @field_validator("description", mode="before")
+    @classmethod
     def parse_description(cls, v: Any) -> str | None:
         """Parse description from OpenLibrary format."""
         if not v:
@@ -75,7 +91,8 @@ class OpenLibraryBookDetails(BaseModel):
 
         return None
 
-    @validator("covers", pre=True)
+    @field_validator("covers", mode="before")
+    @classmethod
     def parse_covers(cls, v: Any) -> list[int]:
         """Parse cover IDs from OpenLibrary format."""
         if not v:
@@ -101,7 +118,15 @@ class OpenLibraryBookDetails(BaseModel):
 
     def get_author_names(self) -> list[str]:
         """Get list of author names."""
-        return [author.name for author in self.authors if author.name]
+        # Cached against the authors list it was built from, so reassigning
+        # authors invalidates it
+        authors = self.authors
+        cached = self._author_names
+        if cached is None or cached[0] is not authors:
+            names = [author["name"] for author in authors if author.get("name")]
+            cached = self._author_names = (authors, names)
+
+        return list(cached[1])
 
     def get_cover_url(self, size: str = "M") -> str | None:
         """Generate cover image URL from OpenLibrary cover ID.
@@ -112,22 +137,36 @@ class OpenLibraryBookDetails(BaseModel):
         Returns:
             Cover image URL or None if no covers available
         """
-        if not self.covers:
+        covers = self.covers
+        if not covers:
             return None
 
-        cover_id = self.covers[0]  # Use first cover
-        return f"https://covers.openlibrary.org/b/id/{cover_id}-{size}.jpg"
+        # Per-size URLs, reset whenever covers is reassigned
+        if self._cover_urls_source is not covers:
+            self._cover_urls_source = covers
+            self._cover_urls = {}
+
+        url = self._cover_urls.get(size)
+        if url is None:
+            cover_id = covers[0]  # Use first cover
+            url = f"https://covers.openlibrary.org/b/id/{cover_id}-{size}.jpg"
+            self._cover_urls[size] = url
+
+        return url
 
     def get_publication_year(self) -> int | None:
         """Extract publication year from publish_date string."""
-        if not self.publish_date:
+        publish_date = self.publish_date
+        if not publish_date:
             return None
 
-        # Try to extract year from various date formats
-        import re
+        # Fast path for the common bare-year format, e.g. "1994"
+        if len(publish_date) == 4 and publish_date.isascii() and publish_date.isdigit():
+            year = int(publish_date)
+            return year if _MIN_YEAR <= year <= _MAX_YEAR else None
 
-        # Look for 4-digit year
-        year_match = re.search(r"\b(1[5-9]\d\d|20\d\d|21\d\d)\b", self.publish_date)
+        # Look for 4-digit year in other date formats
+        year_match = _YEAR_RE.search(publish_date)
         if year_match:
             return int(year_match.group(1))
 
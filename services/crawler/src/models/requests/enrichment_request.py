@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from src.utils.isbn_utils import is_valid_isbn
 
+# Deletes the hyphens and spaces users commonly type in ISBNs
+_ISBN_TRANS = str.maketrans("", "", "- ")
+
+
+def _clean_request_isbn(isbn: str) -> str:
+    """Strip ISBN formatting in one pass, uppercasing only when needed."""
+    clean_isbn = isbn.translate(_ISBN_TRANS)
+    # All-digit ISBNs (every ISBN-13) have nothing to uppercase
+    return clean_isbn if clean_isbn.isdigit() else clean_isbn.upper()
+
 
 class EnrichmentRequest(BaseModel):
     """Request model for single book enrichment."""
@@ -18,75 +28,86 @@ class EnrichmentRequest(BaseModel):
         None, ge=0.0, le=1.0, description="Minimum quality score threshold (0.0-1.0)"
     )
 
-    @validator("isbn")
+    @field_validator("isbn")
+    @classmethod
     def validate_isbn_format(cls, v: str) -> str:
         """Validate ISBN format."""
         if not v:
             raise ValueError("ISBN is required")
 
         # Remove common formatting
-        clean_isbn = v.replace("-", "").replace(" ", "").upper()
+        clean_isbn = _clean_request_isbn(v)
 
         if not is_valid_isbn(clean_isbn):
             raise ValueError(f"Invalid ISBN format: {v}")
 
         return clean_isbn
 
-    class Config:
-        """Pydantic configuration."""
-
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "isbn": "9780134685991",
                 "force_refresh": False,
                 "min_quality_score": 0.7,
             }
         }
+    )
 
 
 class BatchEnrichmentRequest(BaseModel):
     """Request model for batch book enrichment."""
 
     isbns: list[str] = Field(
-        ..., min_items=1, max_items=50, description="List of book ISBN identifiers"
+        ..., min_length=1, max_length=50, description="List of book ISBN identifiers"
     )
     force_refresh: bool = Field(False, description="Skip cache and fetch fresh data")
     min_quality_score: float | None = Field(
         None, ge=0.0, le=1.0, description="Minimum quality score threshold (0.0-1.0)"
     )
 
-    @validator("isbns")
+    @field_validator("isbns")
+    @classmethod
     def validate_isbn_list(cls, v: list[str]) -> list[str]:
         """Validate all ISBNs in the list."""
         if not v:
             raise ValueError("At least one ISBN is required")
 
         validated_isbns = []
+        seen: set[str] = set()
         for isbn in v:
             if not isbn:
                 raise ValueError("Empty ISBN in list")
 
-            # Clean and validate
-            clean_isbn = isbn.replace("-", "").replace(" ", "").upper()
+            # Clean, then reject duplicates before paying for checksum validation
+            clean_isbn = _clean_request_isbn(isbn)
+
+            if clean_isbn in seen:
+                raise ValueError(f"Duplicate ISBN in request: {isbn}")
 
             if not is_valid_isbn(clean_isbn):
                 raise ValueError(f"Invalid ISBN format: {isbn}")
 
+            seen.add(clean_isbn)
             validated_isbns.append(clean_isbn)
 
-        # Check for duplicates
-        if len(set(validated_isbns)) != len(validated_isbns):
-            raise ValueError("Duplicate ISBNs in request")
-
         return validated_isbns
 
-    class Config:
-        """Pydantic configuration."""
-
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "isbns": ["9780134685991", "9780596517748"],
                 "force_refresh": False,
                 "min_quality_score": 0.7,
             }
         }
+    )
+
+
+class ConcurrencyLimitRequest(BaseModel):
+    """Request model for changing the enrichment concurrency limit."""
+
+    limit: int = Field(
+        ..., ge=1, le=1000, description="Maximum number of concurrent enrichments"
+    )
+
+    model_config = ConfigDict(json_schema_extra={"example": {"limit": 10}})
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.database.book_metadata import BookMetadata
 
@@ -29,10 +29,8 @@ class EnrichmentResponse(BaseModel):
         None, description="Processing time in seconds"
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "isbn": "9780134685991",
                 "status": "success",
@@ -51,6 +49,7 @@ class EnrichmentResponse(BaseModel):
                 "processing_time": 2.5,
             }
         }
+    )
 
 
 class BatchEnrichmentResponse(BaseModel):
@@ -67,10 +66,8 @@ class BatchEnrichmentResponse(BaseModel):
         None, description="Total processing time in seconds"
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_books": 2,
                 "successful": 1,
@@ -90,6 +87,7 @@ class BatchEnrichmentResponse(BaseModel):
                 ],
             }
         }
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -105,10 +103,8 @@ class ErrorResponse(BaseModel):
         default_factory=datetime.utcnow, description="Error timestamp"
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "error_type": "ValidationError",
                 "message": "Invalid ISBN format",
@@ -118,6 +114,7 @@ class ErrorResponse(BaseModel):
                 "timestamp": "2023-01-01T12:00:00Z",
             }
         }
+    )
 
 
 class HealthResponse(BaseModel):
@@ -129,16 +126,15 @@ class HealthResponse(BaseModel):
         default_factory=dict, description="Status of individual services"
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "timestamp": "2023-01-01T12:00:00Z",
                 "services": {"openlibrary": {"status": "healthy", "available": True}},
             }
         }
+    )
 
 
 class JobStatusResponse(BaseModel):
@@ -166,3 +162,10 @@ class ActiveJobsResponse(BaseModel):
         default_factory=list, description="List of currently active enrichment jobs"
     )
     total_active: int = Field(..., description="Total number of active jobs")
+
+
+class ConcurrencyStatusResponse(BaseModel):
+    """Response model for the enrichment concurrency limit."""
+
+    limit: int = Field(..., description="Maximum number of concurrent enrichments")
+    active: int = Field(..., description="Number of enrichments currently running")
@@ -3,8 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import itertools
+import logging
 import uuid
-from datetime import datetime
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from contextvars import ContextVar
+from datetime import UTC, datetime
 from typing import Any
 
 import structlog
@@ -21,18 +29,78 @@ from src.models.database.enrichment_job import (
     ErrorDetails,
     ProcessingMetrics,
 )
+from src.models.external.openlibrary_models import OpenLibraryBookDetails
+from src.services.external_api_service import ExternalAPIService
+from src.services.validation_service import ValidationService
+from src.utils.cache import TTLCache
+from src.utils.concurrency import AdmissionController
 
 logger = structlog.get_logger(__name__)
+_stdlib_logger = logging.getLogger(__name__)
 
+# Failed results are never cached so transient errors are retried
+_CACHEABLE_STATUSES = frozenset({EnrichmentStatus.SUCCESS, EnrichmentStatus.PARTIAL})
 
-# Forward references for type hints
-if False:
-    from src.services.external_api_service import ExternalAPIService
-    from src.services.validation_service import ValidationService
+_NOT_FOUND_ERROR = "Book not found in any external source"
+
+# Number of completed jobs kept for status lookups
+_JOB_HISTORY_SIZE = 1000
+
+# Set for enrichments run by a batch, which log progress summaries instead
+_in_batch: ContextVar[bool] = ContextVar("enrichment_in_batch", default=False)
+
+# Enrichment time shared by every book a batch enriches, None outside batches
+_batch_enriched_at: ContextVar[datetime | None] = ContextVar(
+    "enrichment_batch_enriched_at", default=None
+)
+
+
+def _log_book_info() -> bool:
+    """Whether per-book INFO logs should be emitted for this enrichment."""
+    return not _in_batch.get() and _stdlib_logger.isEnabledFor(logging.INFO)
+
+
+# Admission controller shared by every service instance on an event loop
+_shared_admission: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, AdmissionController
+] = weakref.WeakKeyDictionary()
+
+
+def _get_shared_admission() -> AdmissionController:
+    """Return the admission controller shared on the running event loop.
+
+    Created on first use, so importing this module never needs a loop.
+
+    Returns:
+        Controller limited to ``ENRICHMENT_MAX_CONCURRENT`` enrichments
+    """
+    loop = asyncio.get_running_loop()
+    admission = _shared_admission.get(loop)
+    if admission is None:
+        admission = AdmissionController(settings.ENRICHMENT_MAX_CONCURRENT)
+        _shared_admission[loop] = admission
+    return admission
 
 
 class EnrichmentResult:
-    """Result of book enrichment operation."""
+    """Result of book enrichment operation.
+
+    The correlation ID and timestamp are generated on first access, so
+    results built with an explicit correlation ID, or never serialized,
+    skip generating them.
+    """
+
+    __slots__ = (
+        "isbn",
+        "status",
+        "metadata",
+        "error",
+        "quality_score",
+        "sources_used",
+        "processing_time",
+        "_correlation_id",
+        "_timestamp",
+    )
 
     def __init__(
         self,
@@ -64,11 +132,33 @@ class EnrichmentResult:
         self.quality_score = quality_score
         self.sources_used = sources_used or []
         self.processing_time = processing_time
-        self.correlation_id = correlation_id or str(uuid.uuid4())
-        self.timestamp = datetime.utcnow()
+        self._correlation_id = correlation_id or None
+        self._timestamp: datetime | None = None
+
+    @property
+    def correlation_id(self) -> str:
+        """Unique identifier for tracking, generated on first access."""
+        if self._correlation_id is None:
+            self._correlation_id = str(uuid.uuid4())
+        return self._correlation_id
+
+    @correlation_id.setter
+    def correlation_id(self, value: str | None) -> None:
+        self._correlation_id = value
+
+    @property
+    def timestamp(self) -> datetime:
+        """UTC time the result was first reported, set on first access."""
+        if self._timestamp is None:
+            self._timestamp = datetime.now(UTC)
+        return self._timestamp
 
     def to_dict(self) -> dict:
-        """Convert result to dictionary representation."""
+        """Convert result to a JSON-ready dictionary representation.
+
+        Dates in the metadata are serialized to ISO strings by pydantic-core in
+        the same pass that dumps the model, matching the result timestamp.
+        """
         result = {
             "isbn": self.isbn,
             "status": self.status,
@@ -78,7 +168,7 @@ class EnrichmentResult:
         }
 
         if self.metadata:
-            result["metadata"] = self.metadata.dict()
+            result["metadata"] = self.metadata.model_dump(mode="json")
 
         if self.error:
             result["error"] = self.error
@@ -91,6 +181,38 @@ class EnrichmentResult:
 
         return result
 
+    def with_correlation_id(self, correlation_id: str | None) -> EnrichmentResult:
+        """Copy the result for another request.
+
+        Args:
+            correlation_id: Correlation ID of the copy, generated if None
+
+        Returns:
+            Shallow copy sharing this result's metadata, timestamped when the
+            copy is first reported
+        """
+        result = copy.copy(self)
+        result.correlation_id = correlation_id
+        result._timestamp = None
+        return result
+
+    def _as_cache_hit(self, correlation_id: str | None) -> EnrichmentResult:
+        """Copy a cached result for a request it is served to.
+
+        Args:
+            correlation_id: Correlation ID of the copy, generated if None
+
+        Returns:
+            Copy with no processing time and its sources marked as cached
+        """
+        result = self.with_correlation_id(correlation_id)
+        result.processing_time = None
+        result.sources_used = [
+            source if source.endswith(":cached") else f"{source}:cached"
+            for source in self.sources_used
+        ]
+        return result
+
     @property
     def is_successful(self) -> bool:
         """Check if enrichment was successful."""
@@ -113,26 +235,70 @@ class BookEnrichmentService:
         validation_service: ValidationService | None = None,
         external_api_service: ExternalAPIService | None = None,
         openlibrary_client: OpenLibraryClient | None = None,
+        result_cache: TTLCache[tuple[str, float], EnrichmentResult] | None = None,
+        admission: AdmissionController | None = None,
     ) -> None:
         """Initialize enrichment service with dependency injection.
 
+        All services share one process-wide concurrency limit by default, so
+        creating more instances does not raise the number of enrichments in
+        flight. Pass ``admission`` to give an instance its own limit, or to
+        share a caller's existing limiter with it.
+
         Args:
             validation_service: Service for data validation and quality assessment
             external_api_service: Service for coordinating external API calls
             openlibrary_client: Direct OpenLibrary client (for backward compatibility)
+            result_cache: Cache for completed results, in-memory if not given
+            admission: Concurrency limiter, the shared one if not given
         """
         self._validation_service = validation_service
         self._external_api_service = external_api_service
         self._openlibrary_client = openlibrary_client
 
-        # Concurrency control
-        self._concurrency_semaphore = asyncio.Semaphore(
-            settings.ENRICHMENT_MAX_CONCURRENT
-        )
+        # Concurrency control, resizable at runtime; None uses the shared one
+        self._admission_controller = admission
 
-        # Job tracking
+        # Job tracking; job IDs are a random per-instance prefix plus a counter,
+        # so creating a job needs no fresh randomness
+        self._job_id_prefix = uuid.uuid4().hex[:16]
+        self._job_ids = itertools.count(1)
         self._active_jobs: dict[str, EnrichmentJob] = {}
-        self._job_history: list[EnrichmentJob] = []
+        # Completed jobs by job_id, oldest first
+        self._job_history: OrderedDict[str, EnrichmentJob] = OrderedDict()
+
+        # Completed results keyed by (normalized isbn, effective quality threshold);
+        # an empty injected cache is falsy, so test for None explicitly
+        if result_cache is None:
+            result_cache = TTLCache(
+                maxsize=settings.ENRICHMENT_CACHE_SIZE,
+                ttl=settings.ENRICHMENT_RESULT_CACHE_TTL,
+            )
+        self._result_cache = result_cache
+
+        # Sources tried for ISBNs no external source knows, by normalized isbn
+        self._not_found_cache: TTLCache[str, list[str]] = TTLCache(
+            maxsize=settings.ENRICHMENT_NOT_FOUND_CACHE_SIZE,
+            ttl=settings.ENRICHMENT_NOT_FOUND_CACHE_TTL,
+        )
+
+        # Set once the external API service and its clients are started; the
+        # lock keeps concurrent first calls from starting them twice
+        self._services_ready = False
+        self._init_lock = asyncio.Lock()
+
+        # In-flight enrichments, keyed like the result cache
+        self._inflight: dict[tuple[str, float], asyncio.Future[EnrichmentResult]] = {}
+
+    @property
+    def _admission(self) -> AdmissionController:
+        """Concurrency limiter used by this service.
+
+        The shared limiter is looked up on every use rather than stored, so
+        an instance created before or reused across event loops always gets
+        the one belonging to the running loop.
+        """
+        return self._admission_controller or _get_shared_admission()
 
     async def __aenter__(self) -> BookEnrichmentService:
         """Async context manager entry."""
@@ -144,27 +310,48 @@ class BookEnrichmentService:
         await self.close()
 
     async def _ensure_services(self) -> None:
-        """Ensure all services are initialized."""
-        # Initialize validation service
-        if self._validation_service is None:
-            from src.services.validation_service import ValidationService
+        """Ensure all services are initialized.
 
-            self._validation_service = ValidationService()
+        Called once per public call (a single enrichment or a whole batch),
+        never per book. Runs its setup once per service lifetime; later calls
+        return immediately so enrichments reuse the started clients.
+        """
+        if self._services_ready:
+            return
 
-        # Initialize external API service
-        if self._external_api_service is None:
-            from src.services.external_api_service import ExternalAPIService
+        async with self._init_lock:
+            if self._services_ready:
+                return
 
-            self._external_api_service = ExternalAPIService(
-                openlibrary_client=self._openlibrary_client
-            )
+            # Initialize validation service
+            self._get_validation_service()
+
+            # Initialize external API service
+            if self._external_api_service is None:
+                self._external_api_service = ExternalAPIService(
+                    openlibrary_client=self._openlibrary_client
+                )
+
+            # Start external API service
+            if hasattr(self._external_api_service, "__aenter__"):
+                await self._external_api_service.__aenter__()
+
+            self._services_ready = True
+
+    def _get_validation_service(self) -> ValidationService:
+        """Return the validation service, creating it on first use.
+
+        Validation needs no started clients, so it is available without
+        going through _ensure_services.
+        """
+        if self._validation_service is None:
+            self._validation_service = ValidationService()
 
-        # Start external API service
-        if hasattr(self._external_api_service, "__aenter__"):
-            await self._external_api_service.__aenter__()
+        return self._validation_service
 
     async def close(self) -> None:
         """Close all services and clean up resources."""
+        self._services_ready = False
         if self._external_api_service and hasattr(self._external_api_service, "close"):
             await self._external_api_service.close()
 
@@ -186,7 +373,7 @@ class BookEnrichmentService:
         Returns:
             New enrichment job instance
         """
-        job_id = str(uuid.uuid4())
+        job_id = f"{self._job_id_prefix}-{next(self._job_ids):08x}"
 
         if correlation_id is None:
             correlation_id = str(uuid.uuid4())
@@ -203,12 +390,13 @@ class BookEnrichmentService:
         # Store in active jobs
         self._active_jobs[job_id] = job
 
-        logger.info(
-            "Created enrichment job",
-            job_id=job_id,
-            correlation_id=correlation_id,
-            isbn=isbn,
-        )
+        if _log_book_info():
+            logger.info(
+                "Created enrichment job",
+                job_id=job_id,
+                correlation_id=correlation_id,
+                isbn=isbn,
+            )
 
         return job
 
@@ -219,22 +407,22 @@ class BookEnrichmentService:
             job: Enrichment job to complete
         """
         # Move to history
-        self._job_history.append(job)
+        self._job_history[job.job_id] = job
 
         # Remove from active jobs
-        if job.job_id in self._active_jobs:
-            del self._active_jobs[job.job_id]
-
-        # Keep history size manageable
-        if len(self._job_history) > 1000:
-            self._job_history = self._job_history[-1000:]
-
-        logger.debug(
-            "Job completed and archived",
-            job_id=job.job_id,
-            status=job.status,
-            duration=job.get_duration(),
-        )
+        self._active_jobs.pop(job.job_id, None)
+
+        # Keep history size manageable by dropping the oldest job
+        if len(self._job_history) > _JOB_HISTORY_SIZE:
+            self._job_history.popitem(last=False)
+
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Job completed and archived",
+                job_id=job.job_id,
+                status=job.status,
+                duration=job.get_duration(),
+            )
 
     async def enrich_book(
         self,
@@ -245,6 +433,14 @@ class BookEnrichmentService:
     ) -> EnrichmentResult:
         """Enrich book metadata with comprehensive validation and quality control.
 
+        Concurrent calls for the same ISBN and quality threshold share a single
+        in-flight enrichment, each receiving a copy of its result under its
+        own correlation ID. Successful and
+        partial results are cached, so repeat calls skip enrichment entirely
+        unless force_refresh is set; so are ISBNs recently not found, for a
+        shorter time. Invalid ISBNs and cache hits are answered without
+        waiting for a concurrency slot.
+
         Args:
             isbn: Book ISBN identifier
             force_refresh: Skip cache and fetch fresh data
@@ -258,155 +454,322 @@ class BookEnrichmentService:
             ValidationError: If ISBN is invalid
             EnrichmentError: If enrichment fails
         """
-        # Create job for tracking
-        job = self._create_enrichment_job(
-            isbn=isbn,
-            force_refresh=force_refresh,
-            min_quality_score=min_quality_score,
-            correlation_id=correlation_id,
+        await self._ensure_services()
+        return await self._enrich_coalesced(
+            isbn, force_refresh, min_quality_score, correlation_id
         )
 
-        start_time = asyncio.get_event_loop().time()
-        processing_metrics = ProcessingMetrics(started_at=datetime.utcnow())
+    async def _enrich_coalesced(
+        self,
+        isbn: str,
+        force_refresh: bool,
+        min_quality_score: float | None,
+        correlation_id: str | None,
+        prefetched: tuple[OpenLibraryBookDetails | None, list[str]] | None = None,
+    ) -> EnrichmentResult:
+        """Run an enrichment, joining an in-flight one for the same key.
 
-        logger.info(
-            "Starting enhanced book enrichment",
-            job_id=job.job_id,
-            correlation_id=job.correlation_id,
-            isbn=isbn,
-            force_refresh=force_refresh,
-        )
+        The ISBN is validated and the cache and in-flight map are checked
+        before any admission slot is taken, so only enrichments that need
+        external data wait on the concurrency limit.
 
-        # Update job status
-        job.update_status(EnrichmentStatus.IN_PROGRESS)
+        Args:
+            isbn: Book ISBN identifier
+            force_refresh: Skip cache and fetch fresh data
+            min_quality_score: Minimum quality score threshold
+            correlation_id: Optional correlation ID for tracking
+            prefetched: External API result already fetched for this ISBN
 
+        Returns:
+            Enrichment result with metadata or error information
+        """
         try:
-            await self._ensure_services()
-            assert self._validation_service is not None
+            normalized_isbn = self._get_validation_service().validate_isbn(isbn)
+        except ValidationError as e:
+            return self._reject_invalid_isbn(
+                isbn, e, force_refresh, min_quality_score, correlation_id
+            )
 
-            # Step 1: Validate and normalize ISBN
-            try:
-                normalized_isbn = self._validation_service.validate_isbn(isbn)
-                job.isbn = normalized_isbn  # Update job with normalized ISBN
+        return await self._enrich_normalized(
+            normalized_isbn,
+            force_refresh,
+            min_quality_score,
+            correlation_id,
+            prefetched,
+        )
 
-            except ValidationError as e:
-                job.set_error(
-                    str(e),
-                    ErrorCategory.VALIDATION_ERROR,
-                    ErrorDetails(
-                        category=ErrorCategory.VALIDATION_ERROR,
-                        message=str(e),
-                        field_name="isbn",
-                    ),
+    async def _enrich_normalized(
+        self,
+        normalized_isbn: str,
+        force_refresh: bool,
+        min_quality_score: float | None,
+        correlation_id: str | None,
+        prefetched: tuple[OpenLibraryBookDetails | None, list[str]] | None = None,
+    ) -> EnrichmentResult:
+        """Enrich an already validated ISBN, joining an in-flight enrichment.
+
+        Args:
+            normalized_isbn: Normalized ISBN-13
+            force_refresh: Skip cache and fetch fresh data
+            min_quality_score: Minimum quality score threshold
+            correlation_id: Optional correlation ID for tracking
+            prefetched: External API result already fetched for this ISBN
+
+        Returns:
+            Enrichment result with metadata or error information
+        """
+        # Omitting the threshold and passing the default yield the same result
+        key = (
+            normalized_isbn,
+            min_quality_score or settings.ENRICHMENT_MIN_QUALITY_SCORE,
+        )
+
+        if not force_refresh:
+            cached = self._get_cached_result(key, correlation_id)
+            if cached is not None:
+                return cached
+
+            sources_tried = self._not_found_cache.get(normalized_isbn)
+            if sources_tried is not None:
+                return EnrichmentResult(
+                    isbn=normalized_isbn,
+                    status=EnrichmentStatus.FAILED,
+                    error=_NOT_FOUND_ERROR,
+                    sources_used=[f"{source}:cached" for source in sources_tried],
+                    correlation_id=correlation_id,
                 )
 
-                result = self._create_error_result(job, str(e))
-                self._complete_job(job)
-                return result
+        while (inflight := self._inflight.get(key)) is not None:
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Joining in-flight enrichment", isbn=normalized_isbn)
+            try:
+                # Shield so a cancelled follower does not cancel the shared work
+                shared = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only the owner was cancelled: its entry is already gone, so
+                # join the next owner or take over the enrichment
+                task = asyncio.current_task()
+                if inflight.cancelled() and task is not None and not task.cancelling():
+                    continue
+                raise
+            return shared.with_correlation_id(correlation_id)
+
+        # No await between the lookup and registration, so the dict needs no lock
+        future: asyncio.Future[
+            EnrichmentResult
+        ] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._enrich_book(
+                normalized_isbn,
+                force_refresh,
+                min_quality_score,
+                correlation_id,
+                prefetched,
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unjoined failure is not logged by asyncio
+            future.exception()
+            raise
+        else:
+            if result.status in _CACHEABLE_STATUSES:
+                # Cache a copy so the caller's result can be changed freely
+                self._result_cache.set(key, result.with_correlation_id(None))
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
 
-            # Step 2: Use concurrency control and timeout
-            async with self._concurrency_semaphore:
-                try:
-                    result = await asyncio.wait_for(
-                        self._enrich_single_book_enhanced(job, processing_metrics),
-                        timeout=settings.ENRICHMENT_TIMEOUT,
-                    )
+    def _get_cached_result(
+        self,
+        key: tuple[str, float],
+        correlation_id: str | None,
+    ) -> EnrichmentResult | None:
+        """Look up a cached result for an ISBN.
 
-                    # Update processing time
-                    processing_time = asyncio.get_event_loop().time() - start_time
-                    result.processing_time = processing_time
-                    processing_metrics.processing_time_seconds = processing_time
+        Args:
+            key: Normalized ISBN-13 and effective quality threshold
+            correlation_id: Optional correlation ID for tracking
 
-                    # Set final job metrics
-                    job.set_processing_metrics(processing_metrics)
+        Returns:
+            Copy of the cached result for this request, or None
+        """
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
 
-                    logger.info(
-                        "Enhanced book enrichment completed",
-                        job_id=job.job_id,
-                        correlation_id=job.correlation_id,
-                        isbn=normalized_isbn,
-                        status=result.status,
-                        quality_score=result.quality_score,
-                        processing_time=processing_time,
-                    )
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Returning cached enrichment result", isbn=key[0])
+        return cached._as_cache_hit(correlation_id)
 
-                    self._complete_job(job)
-                    return result
+    def _reject_invalid_isbn(
+        self,
+        isbn: str,
+        error: ValidationError,
+        force_refresh: bool,
+        min_quality_score: float | None,
+        correlation_id: str | None,
+    ) -> EnrichmentResult:
+        """Record a failed job for an invalid ISBN and return its result.
 
-                except asyncio.TimeoutError:
-                    processing_time = asyncio.get_event_loop().time() - start_time
-                    error_msg = (
-                        f"Enrichment timeout after {settings.ENRICHMENT_TIMEOUT}s"
-                    )
+        Args:
+            isbn: ISBN as supplied by the caller
+            error: Validation error raised for the ISBN
+            force_refresh: Skip cache and fetch fresh data
+            min_quality_score: Minimum quality score threshold
+            correlation_id: Optional correlation ID for tracking
 
-                    job.set_error(
-                        error_msg,
-                        ErrorCategory.TIMEOUT_ERROR,
-                        ErrorDetails(
-                            category=ErrorCategory.TIMEOUT_ERROR, message=error_msg
-                        ),
-                    )
+        Returns:
+            Failed enrichment result describing the validation error
+        """
+        job = self._create_enrichment_job(
+            isbn=isbn,
+            force_refresh=force_refresh,
+            min_quality_score=min_quality_score,
+            correlation_id=correlation_id,
+        )
+        result = self._fail_job(
+            job, str(error), ErrorCategory.VALIDATION_ERROR, field_name="isbn"
+        )
+        self._complete_job(job)
+        return result
 
-                    logger.error(
-                        "Enrichment timeout",
-                        job_id=job.job_id,
-                        correlation_id=job.correlation_id,
-                        isbn=normalized_isbn,
-                        timeout=settings.ENRICHMENT_TIMEOUT,
-                        processing_time=processing_time,
-                    )
+    async def _enrich_book(
+        self,
+        isbn: str,
+        force_refresh: bool,
+        min_quality_score: float | None,
+        correlation_id: str | None,
+        prefetched: tuple[OpenLibraryBookDetails | None, list[str]] | None = None,
+    ) -> EnrichmentResult:
+        """Run a single enrichment, tracking it as a job.
 
-                    result = EnrichmentResult(
-                        isbn=normalized_isbn,
-                        status=EnrichmentStatus.FAILED,
-                        error=error_msg,
-                        correlation_id=job.correlation_id,
-                        processing_time=processing_time,
-                    )
+        Args:
+            isbn: Normalized ISBN-13
+            force_refresh: Skip cache and fetch fresh data
+            min_quality_score: Minimum quality score threshold
+            correlation_id: Optional correlation ID for tracking
+            prefetched: External API result already fetched for this ISBN
+
+        Returns:
+            Enrichment result with metadata or error information
+        """
+        # Create job for tracking
+        job = self._create_enrichment_job(
+            isbn=isbn,
+            force_refresh=force_refresh,
+            min_quality_score=min_quality_score,
+            correlation_id=correlation_id,
+        )
 
-                    self._complete_job(job)
-                    return result
+        # The job records the timeout it is held to, read from settings once
+        timeout = job.timeout_seconds
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        processing_metrics = ProcessingMetrics(started_at=datetime.utcnow())
 
+        if _log_book_info():
+            logger.info(
+                "Starting enhanced book enrichment",
+                job_id=job.job_id,
+                correlation_id=job.correlation_id,
+                isbn=isbn,
+                force_refresh=force_refresh,
+            )
+
+        # Update job status
+        job.update_status(EnrichmentStatus.IN_PROGRESS)
+
+        error: Exception | None = None
+        try:
+            # Use concurrency control and timeout
+            async with self._admission:
+                async with asyncio.timeout(timeout):
+                    result = await self._enrich_single_book_enhanced(
+                        job, processing_metrics, prefetched
+                    )
         except Exception as e:
-            processing_time = asyncio.get_event_loop().time() - start_time
-            error_msg = f"Unexpected error: {str(e)}"
+            error = e
 
-            job.set_error(
-                error_msg,
-                ErrorCategory.UNKNOWN_ERROR,
-                ErrorDetails(category=ErrorCategory.UNKNOWN_ERROR, message=str(e)),
+        # Every exit path is timed here, once
+        processing_time = loop.time() - start_time
+
+        if error is None:
+            result.processing_time = processing_time
+            processing_metrics.processing_time_seconds = processing_time
+
+            # Set final job metrics
+            job.set_processing_metrics(processing_metrics)
+
+            if _log_book_info():
+                logger.info(
+                    "Enhanced book enrichment completed",
+                    job_id=job.job_id,
+                    correlation_id=job.correlation_id,
+                    isbn=isbn,
+                    status=result.status,
+                    quality_score=result.quality_score,
+                    processing_time=processing_time,
+                )
+
+            self._complete_job(job)
+            return result
+
+        if isinstance(error, TimeoutError):
+            result = self._fail_job(
+                job,
+                f"Enrichment timeout after {timeout}s",
+                ErrorCategory.TIMEOUT_ERROR,
+                processing_time=processing_time,
             )
 
             logger.error(
-                "Unexpected error during enrichment",
+                "Enrichment timeout",
                 job_id=job.job_id,
                 correlation_id=job.correlation_id,
                 isbn=isbn,
-                error=error_msg,
-                error_type=type(e).__name__,
+                timeout=timeout,
+                processing_time=processing_time,
+            )
+        else:
+            result = self._fail_job(
+                job,
+                f"Unexpected error: {str(error)}",
+                ErrorCategory.UNKNOWN_ERROR,
+                message=str(error),
                 processing_time=processing_time,
-                exc_info=True,
             )
 
-            result = EnrichmentResult(
-                isbn=job.isbn,
-                status=EnrichmentStatus.FAILED,
-                error=error_msg,
+            logger.error(
+                "Unexpected error during enrichment",
+                job_id=job.job_id,
                 correlation_id=job.correlation_id,
+                isbn=isbn,
+                error=result.error,
+                error_type=type(error).__name__,
                 processing_time=processing_time,
+                exc_info=error,
             )
 
-            self._complete_job(job)
-            return result
+        self._complete_job(job)
+        return result
 
     async def _enrich_single_book_enhanced(
-        self, job: EnrichmentJob, metrics: ProcessingMetrics
+        self,
+        job: EnrichmentJob,
+        metrics: ProcessingMetrics,
+        prefetched: tuple[OpenLibraryBookDetails | None, list[str]] | None = None,
     ) -> EnrichmentResult:
         """Enhanced single book enrichment with full quality control.
 
         Args:
             job: Enrichment job being processed
             metrics: Processing metrics to update
+            prefetched: External API result already fetched for this ISBN
 
         Returns:
             Enrichment result
@@ -418,82 +781,85 @@ class BookEnrichmentService:
 
         try:
             # Step 3: Fetch data from external APIs
-            logger.debug(
-                "Fetching book data from external APIs",
-                job_id=job.job_id,
-                isbn=job.isbn,
-            )
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Fetching book data from external APIs",
+                    job_id=job.job_id,
+                    isbn=job.isbn,
+                )
 
-            (
-                book_details,
-                sources_used,
-            ) = await self._external_api_service.fetch_book_by_isbn(
-                job.isbn, force_refresh=job.force_refresh
-            )
+            if prefetched is not None:
+                book_details, sources_used = prefetched
+            else:
+                (
+                    book_details,
+                    sources_used,
+                ) = await self._external_api_service.fetch_book_by_isbn(
+                    job.isbn, force_refresh=job.force_refresh
+                )
 
+            cache_hits = sum(1 for s in sources_used if s.endswith(":cached"))
             metrics.sources_used = sources_used
-            metrics.api_calls_made = len(
-                [s for s in sources_used if not s.endswith(":cached")]
-            )
-            metrics.cache_hits = len([s for s in sources_used if s.endswith(":cached")])
+            metrics.cache_hits = cache_hits
+            metrics.api_calls_made = len(sources_used) - cache_hits
 
             if not book_details:
-                error_msg = "Book not found in any external source"
-                job.set_error(
-                    error_msg,
+                self._not_found_cache.set(job.isbn, sources_used)
+                result = self._fail_job(
+                    job,
+                    _NOT_FOUND_ERROR,
                     ErrorCategory.API_ERROR,
-                    ErrorDetails(
-                        category=ErrorCategory.API_ERROR,
-                        message=error_msg,
-                        api_source=", ".join(sources_used),
-                    ),
+                    sources_used=sources_used,
+                    api_source=", ".join(sources_used),
                 )
 
-                logger.info(
-                    "Book not found in external sources",
-                    job_id=job.job_id,
-                    isbn=job.isbn,
-                    sources_tried=sources_used,
-                )
+                if _log_book_info():
+                    logger.info(
+                        "Book not found in external sources",
+                        job_id=job.job_id,
+                        isbn=job.isbn,
+                        sources_tried=sources_used,
+                    )
 
-                return EnrichmentResult(
-                    isbn=job.isbn,
-                    status=EnrichmentStatus.FAILED,
-                    error=error_msg,
-                    sources_used=sources_used,
-                    correlation_id=job.correlation_id,
-                )
+                return result
 
             # Step 4: Convert to internal metadata format
-            metadata = BookMetadata.from_openlibrary(job.isbn, book_details)
+            metadata = BookMetadata.from_openlibrary(
+                job.isbn, book_details, enriched_at=_batch_enriched_at.get()
+            )
 
             # Step 5: Enhanced data validation and quality assessment
             quality_report = self._validation_service.validate_metadata_quality(
                 metadata, min_completeness=min_score
             )
 
-            # Update job with quality scores
+            # Update job with quality scores; the follow-up flags share one timestamp
+            assessed_at = datetime.utcnow()
             job.set_quality_scores(
                 quality_score=quality_report["completeness_score"],
                 completeness_score=quality_report["completeness_score"],
+                now=assessed_at,
             )
 
             # Step 6: Process quality warnings
             if quality_report["warnings"]:
-                job.add_quality_warnings(quality_report["warnings"])
+                job.add_quality_warnings(quality_report["warnings"], now=assessed_at)
 
                 # Mark for review if highly suspicious
                 if quality_report["suspicion_level"] >= 3:
-                    job.mark_for_review("Multiple data quality concerns detected")
+                    job.mark_for_review(
+                        "Multiple data quality concerns detected", now=assessed_at
+                    )
 
-            logger.debug(
-                "Data quality assessment completed",
-                job_id=job.job_id,
-                isbn=job.isbn,
-                completeness_score=quality_report["completeness_score"],
-                quality_status=quality_report["quality_status"],
-                warnings_count=len(quality_report["warnings"]),
-            )
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Data quality assessment completed",
+                    job_id=job.job_id,
+                    isbn=job.isbn,
+                    completeness_score=quality_report["completeness_score"],
+                    quality_status=quality_report["quality_status"],
+                    warnings_count=len(quality_report["warnings"]),
+                )
 
             # Step 7: Determine enrichment result based on quality
             if not quality_report["meets_threshold"]:
@@ -506,17 +872,21 @@ class BookEnrichmentService:
                         category=ErrorCategory.QUALITY_ERROR,
                         message=error_msg,
                         field_name="quality_score",
+                        timestamp=assessed_at,
                     ),
+                    now=assessed_at,
                 )
 
-                logger.warning(
-                    "Data quality below threshold",
-                    job_id=job.job_id,
-                    isbn=job.isbn,
-                    quality_score=quality_report["completeness_score"],
-                    min_score=min_score,
-                    missing_fields=quality_report["missing_fields"],
-                )
+                # Common for sparse records, so only built when it will be emitted
+                if _stdlib_logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "Data quality below threshold",
+                        job_id=job.job_id,
+                        isbn=job.isbn,
+                        quality_score=quality_report["completeness_score"],
+                        min_score=min_score,
+                        missing_fields=quality_report["missing_fields"],
+                    )
 
                 return EnrichmentResult(
                     isbn=job.isbn,
@@ -542,12 +912,12 @@ class BookEnrichmentService:
             )
 
         except Exception as e:
-            error_msg = f"Error during enhanced enrichment: {str(e)}"
-
-            job.set_error(
-                error_msg,
+            result = self._fail_job(
+                job,
+                f"Error during enhanced enrichment: {str(e)}",
                 ErrorCategory.UNKNOWN_ERROR,
-                ErrorDetails(category=ErrorCategory.UNKNOWN_ERROR, message=str(e)),
+                message=str(e),
+                sources_used=getattr(metrics, "sources_used", []),
             )
 
             logger.error(
@@ -558,30 +928,58 @@ class BookEnrichmentService:
                 error_type=type(e).__name__,
             )
 
-            return EnrichmentResult(
-                isbn=job.isbn,
-                status=EnrichmentStatus.FAILED,
-                error=error_msg,
-                sources_used=getattr(metrics, "sources_used", []),
-                correlation_id=job.correlation_id,
-            )
+            return result
 
-    def _create_error_result(
-        self, job: EnrichmentJob, error_message: str
+    def _fail_job(
+        self,
+        job: EnrichmentJob,
+        error_message: str,
+        category: ErrorCategory,
+        *,
+        message: str | None = None,
+        sources_used: list[str] | None = None,
+        processing_time: float | None = None,
+        field_name: str | None = None,
+        api_source: str | None = None,
     ) -> EnrichmentResult:
-        """Create an error result from a failed job.
+        """Record an error on a job and create its failed result.
+
+        Logging and completing the job are left to the caller.
 
         Args:
             job: Failed enrichment job
-            error_message: Error message
+            error_message: Error message for the job and result
+            category: Error category
+            message: Message for the error details, error_message if not given
+            sources_used: Data sources tried before failing
+            processing_time: Processing duration in seconds
+            field_name: Field that caused the error
+            api_source: External source that caused the error
 
         Returns:
             EnrichmentResult indicating failure
         """
+        # The job and its error details record the same failure time
+        now = datetime.utcnow()
+        job.set_error(
+            error_message,
+            category,
+            ErrorDetails(
+                category=category,
+                message=message or error_message,
+                api_source=api_source,
+                field_name=field_name,
+                timestamp=now,
+            ),
+            now=now,
+        )
+
         return EnrichmentResult(
             isbn=job.isbn,
             status=EnrichmentStatus.FAILED,
             error=error_message,
+            sources_used=sources_used,
+            processing_time=processing_time,
             correlation_id=job.correlation_id,
         )
 
@@ -599,8 +997,59 @@ class BookEnrichmentService:
             min_quality_score: Minimum quality score threshold
 
         Returns:
-            List of enrichment results
+            List of enrichment results, in the order of ``isbns``
         """
+        enrichment_results: list[EnrichmentResult | None] = [None] * len(isbns)
+        async for index, result in self._run_batch(
+            isbns, force_refresh, min_quality_score
+        ):
+            enrichment_results[index] = result
+
+        return enrichment_results  # type: ignore[return-value]
+
+    async def batch_enrich_books_iter(
+        self,
+        isbns: list[str],
+        force_refresh: bool = False,
+        min_quality_score: float | None = None,
+    ) -> AsyncIterator[EnrichmentResult]:
+        """Enrich multiple books, yielding each result as soon as it completes.
+
+        Args:
+            isbns: List of ISBN identifiers
+            force_refresh: Skip cache and fetch fresh data
+            min_quality_score: Minimum quality score threshold
+
+        Yields:
+            Enrichment results in completion order
+        """
+        # Closing this iterator early closes the batch, cancelling its workers
+        batch = self._run_batch(isbns, force_refresh, min_quality_score)
+        async with aclosing(batch):
+            async for _, result in batch:
+                yield result
+
+    async def _run_batch(
+        self,
+        isbns: list[str],
+        force_refresh: bool,
+        min_quality_score: float | None,
+    ) -> AsyncIterator[tuple[int, EnrichmentResult]]:
+        """Enrich a batch with a fixed pool of workers.
+
+        Only as many enrichments as the concurrency limit are scheduled at a
+        time, and finished results wait in a queue of the same size, so
+        memory stays flat however large the batch is.
+
+        Args:
+            isbns: List of ISBN identifiers
+            force_refresh: Skip cache and fetch fresh data
+            min_quality_score: Minimum quality score threshold
+
+        Yields:
+            (position in isbns, enrichment result) in completion order
+        """
+        await self._ensure_services()
         batch_id = str(uuid.uuid4())
 
         # Create batch job for tracking
@@ -619,31 +1068,113 @@ class BookEnrichmentService:
             force_refresh=force_refresh,
         )
 
-        # Create enrichment tasks
-        tasks = [
-            self.enrich_book(isbn, force_refresh, min_quality_score) for isbn in isbns
-        ]
+        progress_interval = settings.ENRICHMENT_BATCH_PROGRESS_INTERVAL
 
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        def track(result: EnrichmentResult) -> None:
+            if result.is_successful:
+                batch_job.update_progress(completed=1, successful=1)
+            elif result.status == EnrichmentStatus.PARTIAL:
+                batch_job.update_progress(completed=1, partial=1)
+            else:
+                batch_job.update_progress(completed=1, failed=1)
 
-        # Process results and update batch tracking
-        enrichment_results = []
-        for isbn, result in zip(isbns, results, strict=True):
-            if isinstance(result, Exception):
-                error_result = EnrichmentResult(
-                    isbn=isbn, status=EnrichmentStatus.FAILED, error=str(result)
+            if batch_job.completed_jobs % progress_interval == 0:
+                logger.info(
+                    "Batch enrichment progress",
+                    batch_id=batch_id,
+                    completed=batch_job.completed_jobs,
+                    total_books=len(isbns),
+                    successful=batch_job.successful_jobs,
+                    failed=batch_job.failed_jobs,
+                    partial=batch_job.partial_jobs,
                 )
-                enrichment_results.append(error_result)
-                batch_job.update_progress(completed=1, failed=1)
+
+        # Validate the whole batch in one pass so invalid ISBNs need no worker,
+        # and group duplicates so each distinct ISBN is enriched once
+        validation_service = self._get_validation_service()
+        positions: dict[str, list[int]] = {}
+        rejected: list[tuple[int, str, ValidationError]] = []
+        for index, isbn in enumerate(isbns):
+            try:
+                normalized_isbn = validation_service.validate_isbn(isbn)
+            except ValidationError as e:
+                rejected.append((index, isbn, e))
             else:
-                enrichment_results.append(result)
-                if result.is_successful:
-                    batch_job.update_progress(completed=1, successful=1)
-                elif result.status == EnrichmentStatus.PARTIAL:
-                    batch_job.update_progress(completed=1, partial=1)
-                else:
-                    batch_job.update_progress(completed=1, failed=1)
+                positions.setdefault(normalized_isbn, []).append(index)
+
+        worker_count = min(self._admission.limit, len(positions))
+        pending = iter(positions)
+        completed: asyncio.Queue[tuple[str, EnrichmentResult]] = asyncio.Queue(
+            maxsize=max(worker_count, 1)
+        )
+        prefetched: dict[str, tuple[OpenLibraryBookDetails | None, list[str]]] = {}
+
+        async def worker() -> None:
+            # Workers share one iterator, so each ISBN is taken exactly once
+            for isbn in pending:
+                try:
+                    result = await self._enrich_normalized(
+                        isbn,
+                        force_refresh,
+                        min_quality_score,
+                        None,
+                        # Popped so each book's details are freed once enriched
+                        prefetched.pop(isbn, None),
+                    )
+                except Exception as e:
+                    result = EnrichmentResult(
+                        isbn=isbn, status=EnrichmentStatus.FAILED, error=str(e)
+                    )
+                await completed.put((isbn, result))
+
+        # Per-book INFO logs give way to progress logs for everything the batch
+        # starts, and every book is stamped with one enrichment time. Workers
+        # copy the context when created; both are reset before the first yield
+        # so the caller's own context is unaffected.
+        in_batch = _in_batch.set(True)
+        batch_enriched_at = _batch_enriched_at.set(datetime.now(UTC))
+        try:
+            rejected_results = [
+                (
+                    index,
+                    self._reject_invalid_isbn(
+                        isbn, error, force_refresh, min_quality_score, None
+                    ),
+                )
+                for index, isbn, error in rejected
+            ]
+
+            # Fetch the whole batch with bulk lookups before enriching each book
+            prefetched.update(
+                await self._prefetch_books(
+                    list(positions), force_refresh, min_quality_score
+                )
+            )
+
+            workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        finally:
+            _batch_enriched_at.reset(batch_enriched_at)
+            _in_batch.reset(in_batch)
+
+        try:
+            for index, result in rejected_results:
+                track(result)
+                yield index, result
+
+            for _ in range(len(positions)):
+                isbn, result = await completed.get()
+                first, *duplicates = positions[isbn]
+                track(result)
+                yield first, result
+
+                for index in duplicates:
+                    duplicate = result.with_correlation_id(None)
+                    track(duplicate)
+                    yield index, duplicate
+        finally:
+            # Stop outstanding work if the caller stops consuming early
+            for task in workers:
+                task.cancel()
 
         # Complete batch
         batch_job.complete_batch()
@@ -658,7 +1189,78 @@ class BookEnrichmentService:
             success_rate=batch_job.get_success_rate(),
         )
 
-        return enrichment_results
+    async def _prefetch_books(
+        self,
+        isbns: list[str],
+        force_refresh: bool,
+        min_quality_score: float | None = None,
+    ) -> dict[str, tuple[OpenLibraryBookDetails | None, list[str]]]:
+        """Fetch external data for a batch of ISBNs using bulk lookups.
+
+        Cached results and recently not-found ISBNs are skipped here and
+        answered by the per-book enrichment; other ISBNs missing from the
+        result (e.g. because their bulk request failed) are fetched
+        individually during enrichment.
+
+        Args:
+            isbns: Normalized ISBN-13 identifiers
+            force_refresh: Skip cache and fetch fresh data
+            min_quality_score: Minimum quality score threshold of the batch
+
+        Returns:
+            Mapping of ISBN to (book_details, sources_used)
+        """
+        assert self._external_api_service is not None
+
+        if not force_refresh:
+            threshold = min_quality_score or settings.ENRICHMENT_MIN_QUALITY_SCORE
+            isbns = [
+                isbn
+                for isbn in isbns
+                if self._result_cache.get((isbn, threshold)) is None
+                and self._not_found_cache.get(isbn) is None
+            ]
+
+        if not isbns:
+            return {}
+
+        try:
+            return await self._external_api_service.fetch_books_by_isbns(
+                list(dict.fromkeys(isbns)), force_refresh=force_refresh
+            )
+        except Exception as e:
+            logger.warning(
+                "Bulk prefetch failed, falling back to single lookups",
+                book_count=len(isbns),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return {}
+
+    def get_concurrency_status(self) -> dict[str, int]:
+        """Get the enrichment concurrency limit and current usage.
+
+        Returns:
+            Dictionary with the limit and the number of active enrichments
+        """
+        return {"limit": self._admission.limit, "active": self._admission.active}
+
+    async def set_concurrency_limit(self, limit: int) -> dict[str, int]:
+        """Change how many enrichments may run at once.
+
+        Enrichments already running are not interrupted when the limit is
+        lowered; new ones wait until enough of them finish. The limit applies
+        to every service sharing this service's admission controller.
+
+        Args:
+            limit: New maximum number of concurrent enrichments
+
+        Returns:
+            Dictionary with the new limit and the number of active enrichments
+        """
+        await self._admission.set_limit(limit)
+        logger.info("Enrichment concurrency limit changed", limit=limit)
+        return self.get_concurrency_status()
 
     def get_job_status(self, job_id: str) -> dict[str, Any] | None:
         """Get status of an enrichment job.
@@ -669,16 +1271,11 @@ class BookEnrichmentService:
         Returns:
             Job status dictionary or None if not found
         """
-        # Check active jobs
-        if job_id in self._active_jobs:
-            return self._active_jobs[job_id].to_summary_dict()
-
-        # Check history
-        for job in self._job_history:
-            if job.job_id == job_id:
-                return job.to_summary_dict()
+        job = self._active_jobs.get(job_id) or self._job_history.get(job_id)
+        if job is None:
+            return None
 
-        return None
+        return job.to_summary_dict()
 
     def get_active_jobs(self) -> list[dict[str, Any]]:
         """Get list of currently active jobs.
@@ -66,9 +66,12 @@ class ExternalAPIService:
 
         # Semaphores for rate limiting per API
         self._api_semaphores: dict[str, asyncio.Semaphore] = {
-            "openlibrary": asyncio.Semaphore(10),  # Conservative limit
+            "openlibrary": asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS),
         }
 
+        # Set once the API clients are started
+        self._clients_ready = False
+
         # Metrics tracking
         self._call_metrics: list[APICallMetrics] = []
         self._health_status: dict[str, dict[str, Any]] = {}
@@ -84,6 +87,9 @@ class ExternalAPIService:
 
     async def _ensure_clients(self) -> None:
         """Ensure all API clients are initialized."""
+        if self._clients_ready:
+            return
+
         if self._openlibrary_client is None:
             self._openlibrary_client = OpenLibraryClient()
 
@@ -91,8 +97,11 @@ class ExternalAPIService:
         if hasattr(self._openlibrary_client, "__aenter__"):
             await self._openlibrary_client.__aenter__()
 
+        self._clients_ready = True
+
     async def close(self) -> None:
         """Close all API clients and clean up resources."""
+        self._clients_ready = False
         if self._openlibrary_client and hasattr(self._openlibrary_client, "close"):
             await self._openlibrary_client.close()
 
@@ -261,7 +270,7 @@ class ExternalAPIService:
                 )
 
                 if data:
-                    book_details = OpenLibraryBookDetails(**data)
+                    book_details = OpenLibraryBookDetails.model_validate(data)
                     await self._record_api_call(api_name, start_time, True)
 
                     logger.debug(
@@ -281,7 +290,9 @@ class ExternalAPIService:
             error_msg = "OpenLibrary API timeout"
             await self._record_api_call(api_name, start_time, False, error_msg)
             logger.warning("OpenLibrary API timeout", isbn=isbn)
-            raise ExternalAPIError(api_name, 408, error_msg) from None
+            raise ExternalAPIError(
+                error_msg, api_name=api_name, status_code=408
+            ) from None
 
         except Exception as e:
             error_msg = f"OpenLibrary API error: {str(e)}"
@@ -292,7 +303,130 @@ class ExternalAPIService:
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            raise ExternalAPIError(api_name, 500, error_msg) from e
+            raise ExternalAPIError(error_msg, api_name=api_name, status_code=500) from e
+
+    async def fetch_books_by_isbns(
+        self, isbns: list[str], force_refresh: bool = False
+    ) -> dict[str, tuple[OpenLibraryBookDetails | None, list[str]]]:
+        """Fetch several books using OpenLibrary bulk lookups.
+
+        Cached books are served from the response cache; the rest are split
+        into chunks of ``OPENLIBRARY_BATCH_SIZE`` and each chunk is fetched
+        with a single request. ISBNs whose chunk failed are left out of the
+        result so callers can fall back to ``fetch_book_by_isbn``.
+
+        Args:
+            isbns: Normalized ISBN-13 identifiers
+            force_refresh: Skip cache and fetch fresh data
+
+        Returns:
+            Mapping of ISBN to (book_details, sources_used)
+        """
+        results: dict[str, tuple[OpenLibraryBookDetails | None, list[str]]] = {}
+        missing: list[str] = []
+
+        for isbn in dict.fromkeys(isbns):
+            if not force_refresh:
+                cache_key = self._get_cache_key("openlibrary", "fetch_book", isbn=isbn)
+                cached_data = self._get_cached_response(cache_key)
+                if cached_data:
+                    results[isbn] = (cached_data, ["openlibrary:cached"])
+                    continue
+            missing.append(isbn)
+
+        batch_size = settings.OPENLIBRARY_BATCH_SIZE
+        chunks = [
+            missing[i : i + batch_size] for i in range(0, len(missing), batch_size)
+        ]
+
+        logger.info(
+            "Starting bulk book fetch",
+            book_count=len(results) + len(missing),
+            cached=len(results),
+            request_count=len(chunks),
+        )
+
+        fetched = await asyncio.gather(
+            *(self._fetch_batch_from_openlibrary(chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        for chunk, outcome in zip(chunks, fetched, strict=True):
+            if isinstance(outcome, Exception):
+                logger.warning(
+                    "Bulk fetch chunk failed",
+                    book_count=len(chunk),
+                    error=str(outcome),
+                )
+                continue
+
+            for isbn in chunk:
+                book_details = outcome.get(isbn)
+                if book_details:
+                    cache_key = self._get_cache_key(
+                        "openlibrary", "fetch_book", isbn=isbn
+                    )
+                    self._cache_response(cache_key, book_details)
+                results[isbn] = (book_details, ["openlibrary"])
+
+        return results
+
+    async def _fetch_batch_from_openlibrary(
+        self, isbns: list[str]
+    ) -> dict[str, OpenLibraryBookDetails]:
+        """Fetch one chunk of books from the OpenLibrary bulk API.
+
+        Args:
+            isbns: ISBNs to fetch in a single request
+
+        Returns:
+            Book details keyed by ISBN, for the books that were found
+        """
+        api_name = "openlibrary"
+        start_time = time.time()
+
+        try:
+            async with self._api_semaphores[api_name]:
+                await self._ensure_clients()
+                assert self._openlibrary_client is not None
+
+                data = await asyncio.wait_for(
+                    self._openlibrary_client.fetch_books_by_isbns(isbns),
+                    timeout=30.0,  # 30 second timeout per API
+                )
+
+                books = {
+                    isbn: OpenLibraryBookDetails.model_validate(details)
+                    for isbn, details in data.items()
+                }
+                await self._record_api_call(api_name, start_time, True)
+
+                logger.debug(
+                    "Successfully fetched chunk from OpenLibrary",
+                    requested=len(isbns),
+                    found=len(books),
+                )
+
+                return books
+
+        except asyncio.TimeoutError:
+            error_msg = "OpenLibrary API timeout"
+            await self._record_api_call(api_name, start_time, False, error_msg)
+            logger.warning("OpenLibrary API timeout", book_count=len(isbns))
+            raise ExternalAPIError(
+                error_msg, api_name=api_name, status_code=408
+            ) from None
+
+        except Exception as e:
+            error_msg = f"OpenLibrary API error: {str(e)}"
+            await self._record_api_call(api_name, start_time, False, error_msg)
+            logger.error(
+                "Error fetching chunk from OpenLibrary",
+                book_count=len(isbns),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise ExternalAPIError(error_msg, api_name=api_name, status_code=500) from e
 
     async def fetch_books_parallel(
         self, isbns: list[str], max_concurrent: int = None
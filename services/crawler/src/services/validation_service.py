@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import html
+import logging
 import re
 import unicodedata
 from datetime import date, datetime
@@ -14,6 +15,25 @@ from src.models.database.book_metadata import BookMetadata
 from src.utils.isbn_utils import is_valid_isbn, normalize_isbn
 
 logger = structlog.get_logger(__name__)
+_stdlib_logger = logging.getLogger(__name__)
+
+# Completeness weight of each field, by importance; the weights sum to 100
+_FIELD_WEIGHTS: tuple[tuple[str, float], ...] = (
+    ("title", 25.0),
+    ("authors", 20.0),
+    ("publication_date", 15.0),
+    ("publisher", 10.0),
+    ("description", 10.0),
+    ("page_count", 8.0),
+    ("language", 7.0),
+    ("cover_image_url", 5.0),
+)
+_TOTAL_WEIGHT = sum(weight for _, weight in _FIELD_WEIGHTS)
+
+# Lowercased values that mean the source had no real data
+_PLACEHOLDER_TITLES = frozenset({"unknown", "n/a", "untitled"})
+_PLACEHOLDER_AUTHORS = frozenset({"unknown", "anonymous", "n/a"})
+_PLACEHOLDER_PUBLISHERS = frozenset({"unknown", "self-published", "n/a"})
 
 
 class ValidationService:
@@ -55,9 +75,12 @@ class ValidationService:
 
         normalized = normalize_isbn(isbn_clean)
 
-        logger.debug(
-            "ISBN validation successful", original_isbn=isbn, normalized_isbn=normalized
-        )
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "ISBN validation successful",
+                original_isbn=isbn,
+                normalized_isbn=normalized,
+            )
 
         return normalized
 
@@ -234,24 +257,9 @@ class ValidationService:
         Returns:
             Completeness score (0.0 to 100.0)
         """
-        # Define field weights based on importance
-        field_weights = {
-            "title": 25.0,
-            "authors": 20.0,
-            "publication_date": 15.0,
-            "publisher": 10.0,
-            "description": 10.0,
-            "page_count": 8.0,
-            "language": 7.0,
-            "cover_image_url": 5.0,
-        }
-
-        total_weight = 0.0
         achieved_weight = 0.0
 
-        for field, weight in field_weights.items():
-            total_weight += weight
-
+        for field, weight in _FIELD_WEIGHTS:
             value = getattr(metadata, field, None)
             if value:
                 if field == "authors":
@@ -270,7 +278,7 @@ class ValidationService:
                     # Other types (dates, etc.) are valid if not None
                     achieved_weight += weight
 
-        return (achieved_weight / total_weight * 100.0) if total_weight > 0 else 0.0
+        return achieved_weight / _TOTAL_WEIGHT * 100.0
 
     def detect_suspicious_data(self, metadata: BookMetadata) -> list[str]:
         """Detect suspicious or potentially invalid data.
@@ -289,7 +297,7 @@ class ValidationService:
                 warnings.append("Title is too short")
             elif len(metadata.title) > 500:
                 warnings.append("Title is unusually long")
-            elif metadata.title.lower() in ["unknown", "n/a", "untitled"]:
+            elif metadata.title.lower() in _PLACEHOLDER_TITLES:
                 warnings.append("Title appears to be placeholder text")
 
         # Check for suspicious author data
@@ -300,7 +308,7 @@ class ValidationService:
             for author in metadata.authors:
                 if len(author) < 2:
                     warnings.append(f"Author name too short: {author}")
-                elif author.lower() in ["unknown", "anonymous", "n/a"]:
+                elif author.lower() in _PLACEHOLDER_AUTHORS:
                     warnings.append(f"Author appears to be placeholder: {author}")
 
         # Check for suspicious publication date
@@ -322,7 +330,7 @@ class ValidationService:
 
         # Check for suspicious publisher
         if metadata.publisher:
-            if metadata.publisher.lower() in ["unknown", "self-published", "n/a"]:
+            if metadata.publisher.lower() in _PLACEHOLDER_PUBLISHERS:
                 warnings.append("Publisher appears to be placeholder text")
 
         return warnings
@@ -370,13 +378,14 @@ class ValidationService:
             "suspicion_level": len(warnings),
         }
 
-        logger.info(
-            "Metadata quality assessment completed",
-            isbn=metadata.isbn_13,
-            completeness_score=completeness_score,
-            quality_status=quality_status,
-            warnings_count=len(warnings),
-            missing_fields_count=len(missing_fields),
-        )
+        if _stdlib_logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Metadata quality assessment completed",
+                isbn=metadata.isbn_13,
+                completeness_score=completeness_score,
+                quality_status=quality_status,
+                warnings_count=len(warnings),
+                missing_fields_count=len(missing_fields),
+            )
 
         return quality_report
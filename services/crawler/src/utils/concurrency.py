@@ -0,0 +1,90 @@
+"""Concurrency control helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+
+class AdmissionController:
+    """Concurrency limiter whose limit can be changed while it is in use.
+
+    Admission is an explicit active count checked under an ``asyncio.Condition``
+    rather than an ``asyncio.Semaphore``, so resizing never has to touch the
+    semaphore's private counter. Lowering the limit lets admitted work finish
+    and holds new callers until the active count drops below the new limit.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize controller.
+
+        Args:
+            limit: Maximum number of concurrently admitted callers
+
+        Raises:
+            ValueError: If limit is less than 1
+        """
+        if limit < 1:
+            raise ValueError("Concurrency limit must be at least 1")
+
+        self._cond = asyncio.Condition()
+        self._active = 0
+        self._limit = limit
+
+    @property
+    def limit(self) -> int:
+        """Maximum number of concurrently admitted callers."""
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        """Number of callers currently admitted."""
+        return self._active
+
+    def _has_capacity(self) -> bool:
+        return self._active < self._limit
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free and take it."""
+        async with self._cond:
+            try:
+                await self._cond.wait_for(self._has_capacity)
+            except asyncio.CancelledError:
+                # Pass on a wake-up this waiter may have consumed
+                self._cond.notify(1)
+                raise
+            self._active += 1
+
+    async def release(self) -> None:
+        """Give back a slot and wake the next waiter."""
+        self._active -= 1
+        # Shielded so a cancelled caller still wakes the next waiter
+        await asyncio.shield(self._notify(1))
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the concurrency limit.
+
+        Args:
+            limit: New maximum number of concurrently admitted callers
+
+        Raises:
+            ValueError: If limit is less than 1
+        """
+        if limit < 1:
+            raise ValueError("Concurrency limit must be at least 1")
+
+        async with self._cond:
+            self._limit = limit
+            self._cond.notify_all()
+
+    async def _notify(self, n: int) -> None:
+        async with self._cond:
+            self._cond.notify(n)
+
+    async def __aenter__(self) -> AdmissionController:
+        """Acquire a slot on context entry."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release the slot on context exit."""
+        await self.release()
@@ -2,10 +2,57 @@
 
 from __future__ import annotations
 
+import operator
 import re
 
 from src.core.exceptions import ValidationError
 
+# Formatting characters removed by clean_isbn
+_FORMATTING_RE = re.compile(r"[-\s]")
+
+# ASCII-only so Unicode digits (e.g. Arabic-Indic) are rejected
+_ISBN10_RE = re.compile(r"\d{9}[\dX]", re.ASCII)
+_ISBN13_RE = re.compile(r"97[89]\d{10}", re.ASCII)
+
+# Checksum weights of the digits preceding the check digit
+_ISBN10_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_ISBN13_WEIGHTS = (1, 3) * 6
+
+# ASCII "0" offsets folded out of the weighted sums
+_ISBN10_OFFSET = ord("0") * sum(_ISBN10_WEIGHTS)
+_ISBN13_OFFSET = ord("0") * sum(_ISBN13_WEIGHTS)
+
+
+def _isbn10_weighted_sum(digits: str) -> int:
+    """Weighted sum of the first 9 ASCII digits of an ISBN-10."""
+    return sum(map(operator.mul, digits.encode("ascii"), _ISBN10_WEIGHTS)) - (
+        _ISBN10_OFFSET
+    )
+
+
+def _isbn13_check_digit(digits: str) -> str:
+    """Check digit for the first 12 ASCII digits of an ISBN-13."""
+    checksum = sum(map(operator.mul, digits.encode("ascii"), _ISBN13_WEIGHTS))
+    return str(-(checksum - _ISBN13_OFFSET) % 10)
+
+
+def _is_clean_isbn_10(clean: str) -> bool:
+    """Validate an ISBN-10 that has already been through clean_isbn."""
+    if _ISBN10_RE.fullmatch(clean) is None:
+        return False
+
+    last_char = clean[9]
+    check_value = 10 if last_char == "X" else ord(last_char) - ord("0")
+    return (_isbn10_weighted_sum(clean) + check_value) % 11 == 0
+
+
+def _is_clean_isbn_13(clean: str) -> bool:
+    """Validate an ISBN-13 that has already been through clean_isbn."""
+    return (
+        _ISBN13_RE.fullmatch(clean) is not None
+        and _isbn13_check_digit(clean) == clean[12]
+    )
+
 
 def clean_isbn(isbn: str) -> str:
     """Remove hyphens, spaces, and other formatting from ISBN.
@@ -19,8 +66,12 @@ def clean_isbn(isbn: str) -> str:
     if not isbn:
         return ""
 
+    # Unformatted input (the common case) has nothing to strip
+    if isbn.isalnum():
+        return isbn.upper()
+
     # Remove common formatting characters
-    return re.sub(r"[-\s]", "", isbn.upper())
+    return _FORMATTING_RE.sub("", isbn.upper())
 
 
 def validate_isbn_10(isbn: str) -> bool:
@@ -32,29 +83,7 @@ def validate_isbn_10(isbn: str) -> bool:
     Returns:
         True if valid ISBN-10
     """
-    clean = clean_isbn(isbn)
-
-    # Must be exactly 10 characters
-    if len(clean) != 10:
-        return False
-
-    # First 9 must be digits, last can be digit or X
-    if not re.match(r"^\d{9}[\dX]$", clean):
-        return False
-
-    # Calculate checksum
-    checksum = 0
-    for i, char in enumerate(clean[:9]):
-        checksum += int(char) * (10 - i)
-
-    # Last character validation
-    last_char = clean[9]
-    if last_char == "X":
-        checksum += 10
-    else:
-        checksum += int(last_char)
-
-    return checksum % 11 == 0
+    return _is_clean_isbn_10(clean_isbn(isbn))
 
 
 def validate_isbn_13(isbn: str) -> bool:
@@ -64,30 +93,9 @@ def validate_isbn_13(isbn: str) -> bool:
         isbn: ISBN-13 string (may contain formatting)
 
     Returns:
-        True if valid ISBN-13
+        True if valid ISBN-13 with a 978 or 979 prefix
     """
-    clean = clean_isbn(isbn)
-
-    # Must be exactly 13 digits
-    if len(clean) != 13:
-        return False
-
-    # Must contain only digits
-    if not clean.isdigit():
-        return False
-
-    # Must start with 978 or 979
-    if not (clean.startswith("978") or clean.startswith("979")):
-        return False
-
-    # Calculate checksum using ISBN-13 algorithm
-    checksum = 0
-    for i, digit in enumerate(clean[:12]):
-        weight = 1 if i % 2 == 0 else 3
-        checksum += int(digit) * weight
-
-    check_digit = (10 - (checksum % 10)) % 10
-    return check_digit == int(clean[12])
+    return _is_clean_isbn_13(clean_isbn(isbn))
 
 
 def isbn_10_to_13(isbn_10: str) -> str:
@@ -104,21 +112,13 @@ def isbn_10_to_13(isbn_10: str) -> str:
     """
     clean = clean_isbn(isbn_10)
 
-    if not validate_isbn_10(clean):
+    if not _is_clean_isbn_10(clean):
         raise ValidationError("Invalid ISBN-10 format", field="isbn_10", value=isbn_10)
 
     # Remove check digit and add 978 prefix
     isbn_12 = "978" + clean[:9]
 
-    # Calculate new check digit
-    checksum = 0
-    for i, digit in enumerate(isbn_12):
-        weight = 1 if i % 2 == 0 else 3
-        checksum += int(digit) * weight
-
-    check_digit = (10 - (checksum % 10)) % 10
-
-    return isbn_12 + str(check_digit)
+    return isbn_12 + _isbn13_check_digit(isbn_12)
 
 
 def isbn_13_to_10(isbn_13: str) -> str | None:
@@ -135,7 +135,7 @@ def isbn_13_to_10(isbn_13: str) -> str | None:
     """
     clean = clean_isbn(isbn_13)
 
-    if not validate_isbn_13(clean):
+    if not _is_clean_isbn_13(clean):
         raise ValidationError("Invalid ISBN-13 format", field="isbn_13", value=isbn_13)
 
     # Only 978-prefixed ISBNs can be converted to ISBN-10
@@ -146,11 +146,7 @@ def isbn_13_to_10(isbn_13: str) -> str | None:
     isbn_9 = clean[3:12]
 
     # Calculate ISBN-10 check digit
-    checksum = 0
-    for i, digit in enumerate(isbn_9):
-        checksum += int(digit) * (10 - i)
-
-    check_remainder = checksum % 11
+    check_remainder = _isbn10_weighted_sum(isbn_9) % 11
     if check_remainder == 0:
         check_digit = "0"
     elif check_remainder == 1:
@@ -179,13 +175,14 @@ def normalize_isbn(isbn: str) -> str:
         raise ValidationError("Empty ISBN", field="isbn", value=isbn)
 
     if len(clean) == 10:
-        if validate_isbn_10(clean):
-            return isbn_10_to_13(clean)
+        if _is_clean_isbn_10(clean):
+            isbn_12 = "978" + clean[:9]
+            return isbn_12 + _isbn13_check_digit(isbn_12)
         else:
             raise ValidationError("Invalid ISBN-10", field="isbn", value=isbn)
 
     elif len(clean) == 13:
-        if validate_isbn_13(clean):
+        if _is_clean_isbn_13(clean):
             return clean
         else:
             raise ValidationError("Invalid ISBN-13", field="isbn", value=isbn)
@@ -205,11 +202,12 @@ def is_valid_isbn(isbn: str) -> bool:
     Returns:
         True if valid ISBN-10 or ISBN-13
     """
-    try:
-        normalize_isbn(isbn)
-        return True
-    except ValidationError:
-        return False
+    clean = clean_isbn(isbn)
+
+    if len(clean) == 10:
+        return _is_clean_isbn_10(clean)
+
+    return len(clean) == 13 and _is_clean_isbn_13(clean)
 
 
 def format_isbn_13(isbn: str) -> str:
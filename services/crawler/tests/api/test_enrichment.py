@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
+from src.api.enrichment import get_enrichment_service
+from src.core.exceptions import OpenLibraryError, ValidationError
 from src.main import app
 from src.models.database.book_metadata import BookMetadata
 from src.services.enrichment_service import EnrichmentResult, EnrichmentStatus
@@ -18,8 +22,9 @@ class TestEnrichmentAPI:
 
     @pytest.fixture
     def client(self):
-        """Create test client."""
-        return TestClient(app)
+        """Create test client with the application lifespan running."""
+        with TestClient(app) as client:
+            yield client
 
     @pytest.fixture
     async def async_client(self):
@@ -27,6 +32,14 @@ class TestEnrichmentAPI:
         async with AsyncClient(app=app, base_url="http://test") as client:
             yield client
 
+    @pytest.fixture
+    def mock_service(self):
+        """Override the shared enrichment service dependency with a mock."""
+        mock_service = AsyncMock()
+        app.dependency_overrides[get_enrichment_service] = lambda: mock_service
+        yield mock_service
+        app.dependency_overrides.pop(get_enrichment_service, None)
+
     @pytest.fixture
     def sample_metadata(self):
         """Sample book metadata for testing."""
@@ -51,22 +64,16 @@ class TestEnrichmentAPI:
             processing_time=2.5,
         )
 
-    def test_enrich_book_success(self, client, successful_enrichment_result):
+    def test_enrich_book_success(
+        self, mock_service, client, successful_enrichment_result
+    ):
         """Test successful book enrichment endpoint."""
-        with patch("src.api.enrichment.BookEnrichmentService") as mock_service_class:
-            # Mock the service instance and its methods
-            mock_service = AsyncMock()
-            mock_service.enrich_book.return_value = successful_enrichment_result
-            mock_service_class.return_value = mock_service
+        mock_service.enrich_book.return_value = successful_enrichment_result
 
-            # Mock the dependency
-            with patch("src.api.enrichment.get_enrichment_service") as mock_dep:
-                mock_dep.return_value = mock_service
-
-                response = client.post(
-                    "/enrichment/enrich",
-                    json={"isbn": "9780134685991", "force_refresh": False},
-                )
+        response = client.post(
+            "/enrichment/enrich",
+            json={"isbn": "9780134685991", "force_refresh": False},
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -77,7 +84,7 @@ class TestEnrichmentAPI:
         assert data["quality_score"] == 0.85
         assert "openlibrary" in data["sources_used"]
 
-    def test_enrich_book_not_found(self, client):
+    def test_enrich_book_not_found(self, mock_service, client):
         """Test book not found response."""
         failed_result = EnrichmentResult(
             isbn="9999999999999",
@@ -85,17 +92,9 @@ class TestEnrichmentAPI:
             error="Book not found in OpenLibrary",
         )
 
-        with patch("src.api.enrichment.BookEnrichmentService") as mock_service_class:
-            mock_service = AsyncMock()
-            mock_service.enrich_book.return_value = failed_result
-            mock_service_class.return_value = mock_service
+        mock_service.enrich_book.return_value = failed_result
 
-            with patch("src.api.enrichment.get_enrichment_service") as mock_dep:
-                mock_dep.return_value = mock_service
-
-                response = client.post(
-                    "/enrichment/enrich", json={"isbn": "9999999999999"}
-                )
+        response = client.post("/enrichment/enrich", json={"isbn": "9999999999999"})
 
         assert response.status_code == 404
         data = response.json()
@@ -104,7 +103,7 @@ class TestEnrichmentAPI:
         assert data["status"] == "failed"
         assert "not found" in data["error"].lower()
 
-    def test_enrich_book_partial_quality(self, client, sample_metadata):
+    def test_enrich_book_partial_quality(self, mock_service, client, sample_metadata):
         """Test partial enrichment due to low quality."""
         partial_result = EnrichmentResult(
             isbn="9780134685991",
@@ -114,18 +113,12 @@ class TestEnrichmentAPI:
             quality_score=0.50,
         )
 
-        with patch("src.api.enrichment.BookEnrichmentService") as mock_service_class:
-            mock_service = AsyncMock()
-            mock_service.enrich_book.return_value = partial_result
-            mock_service_class.return_value = mock_service
-
-            with patch("src.api.enrichment.get_enrichment_service") as mock_dep:
-                mock_dep.return_value = mock_service
+        mock_service.enrich_book.return_value = partial_result
 
-                response = client.post(
-                    "/enrichment/enrich",
-                    json={"isbn": "9780134685991", "min_quality_score": 0.7},
-                )
+        response = client.post(
+            "/enrichment/enrich",
+            json={"isbn": "9780134685991", "min_quality_score": 0.7},
+        )
 
         assert response.status_code == 206  # Partial Content
         data = response.json()
@@ -148,24 +141,20 @@ class TestEnrichmentAPI:
 
         assert response.status_code == 422  # Validation error
 
-    def test_enrich_book_with_options(self, client, successful_enrichment_result):
+    def test_enrich_book_with_options(
+        self, mock_service, client, successful_enrichment_result
+    ):
         """Test enrichment with all options."""
-        with patch("src.api.enrichment.BookEnrichmentService") as mock_service_class:
-            mock_service = AsyncMock()
-            mock_service.enrich_book.return_value = successful_enrichment_result
-            mock_service_class.return_value = mock_service
-
-            with patch("src.api.enrichment.get_enrichment_service") as mock_dep:
-                mock_dep.return_value = mock_service
-
-                response = client.post(
-                    "/enrichment/enrich",
-                    json={
-                        "isbn": "9780134685991",
-                        "force_refresh": True,
-                        "min_quality_score": 0.8,
-                    },
-                )
+        mock_service.enrich_book.return_value = successful_enrichment_result
+
+        response = client.post(
+            "/enrichment/enrich",
+            json={
+                "isbn": "9780134685991",
+                "force_refresh": True,
+                "min_quality_score": 0.8,
+            },
+        )
 
         assert response.status_code == 200
 
@@ -174,25 +163,21 @@ class TestEnrichmentAPI:
             isbn="9780134685991", force_refresh=True, min_quality_score=0.8
         )
 
-    def test_batch_enrich_success(self, client, successful_enrichment_result):
+    def test_batch_enrich_success(
+        self, mock_service, client, successful_enrichment_result
+    ):
         """Test successful batch enrichment."""
         batch_results = [successful_enrichment_result, successful_enrichment_result]
 
-        with patch("src.api.enrichment.BookEnrichmentService") as mock_service_class:
-            mock_service = AsyncMock()
-            mock_service.batch_enrich_books.return_value = batch_results
-            mock_service_class.return_value = mock_service
+        mock_service.batch_enrich_books.return_value = batch_results
 
-            with patch("src.api.enrichment.get_enrichment_service") as mock_dep:
-                mock_dep.return_value = mock_service
-
-                response = client.post(
-                    "/enrichment/batch",
-                    json={
-                        "isbns": ["9780134685991", "9780596517748"],
-                        "force_refresh": False,
-                    },
-                )
+        response = client.post(
+            "/enrichment/batch",
+            json={
+                "isbns": ["9780134685991", "9780596517748"],
+                "force_refresh": False,
+            },
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -203,7 +188,9 @@ class TestEnrichmentAPI:
         assert data["partial"] == 0
         assert len(data["results"]) == 2
 
-    def test_batch_enrich_mixed_results(self, client, successful_enrichment_result):
+    def test_batch_enrich_mixed_results(
+        self, mock_service, client, successful_enrichment_result
+    ):
         """Test batch enrichment with mixed results."""
         failed_result = EnrichmentResult(
             isbn="9999999999999", status=EnrichmentStatus.FAILED, error="Not found"
@@ -211,18 +198,12 @@ class TestEnrichmentAPI:
 
         batch_results = [successful_enrichment_result, failed_result]
 
-        with patch("src.api.enrichment.BookEnrichmentService") as mock_service_class:
-            mock_service = AsyncMock()
-            mock_service.batch_enrich_books.return_value = batch_results
-            mock_service_class.return_value = mock_service
-
-            with patch("src.api.enrichment.get_enrichment_service") as mock_dep:
-                mock_dep.return_value = mock_service
+        mock_service.batch_enrich_books.return_value = batch_results
 
-                response = client.post(
-                    "/enrichment/batch",
-                    json={"isbns": ["9780134685991", "9999999999999"]},
-                )
+        response = client.post(
+            "/enrichment/batch",
+            json={"isbns": ["9780134685991", "9999999999999"]},
+        )
 
         assert response.status_code == 207  # Multi-Status
         data = response.json()
@@ -232,6 +213,120 @@ class TestEnrichmentAPI:
         assert data["failed"] == 1
         assert data["partial"] == 0
 
+    def test_batch_enrich_partial_failure_body(
+        self, mock_service, client, successful_enrichment_result
+    ):
+        """Test that the 207 body is fully serialized, including datetimes."""
+        failed_result = EnrichmentResult(
+            isbn="9780596517748", status=EnrichmentStatus.FAILED, error="Not found"
+        )
+        mock_service.batch_enrich_books.return_value = [
+            successful_enrichment_result,
+            failed_result,
+        ]
+
+        response = client.post(
+            "/enrichment/batch",
+            json={"isbns": ["9780134685991", "9780596517748"]},
+        )
+
+        assert response.status_code == 207
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+
+        assert data["successful"] == 1
+        assert data["failed"] == 1
+        assert data["results"][0]["metadata"]["title"] == "Effective Java"
+        assert data["results"][1]["error"] == "Not found"
+        assert (
+            datetime.fromisoformat(data["results"][1]["timestamp"])
+            == failed_result.timestamp
+        )
+
+    def test_enrich_book_service_error_payload(self, mock_service, client):
+        """Test that service exceptions are returned as serialized ErrorResponse."""
+        mock_service.enrich_book.side_effect = ValidationError(
+            "Invalid ISBN format", field="isbn", value="9780134685991"
+        )
+
+        response = client.post("/enrichment/enrich", json={"isbn": "9780134685991"})
+
+        assert response.status_code == 400
+        data = response.json()
+
+        assert data["error_type"] == "ValidationError"
+        assert data["message"] == "Invalid ISBN format"
+        assert data["field"] == "isbn"
+        assert datetime.fromisoformat(data["timestamp"])
+
+    @pytest.mark.parametrize(
+        ("upstream_status", "expected_status"),
+        [(404, 404), (429, 429), (503, 502), (None, 502)],
+    )
+    def test_enrich_book_external_error_status(
+        self, mock_service, client, upstream_status, expected_status
+    ):
+        """Test that upstream API errors map to the expected HTTP status."""
+        mock_service.enrich_book.side_effect = OpenLibraryError(
+            "OpenLibrary failed", status_code=upstream_status
+        )
+
+        response = client.post("/enrichment/enrich", json={"isbn": "9780134685991"})
+
+        assert response.status_code == expected_status
+        assert response.json()["error_type"] == "OpenLibraryError"
+
+    def test_batch_enrich_stream(
+        self, mock_service, client, successful_enrichment_result
+    ):
+        """Test that batch results are streamed as newline-delimited JSON."""
+        failed_result = EnrichmentResult(
+            isbn="9780596517748", status=EnrichmentStatus.FAILED, error="Not found"
+        )
+
+        async def batch_results(**kwargs):
+            yield failed_result
+            yield successful_enrichment_result
+
+        mock_service.batch_enrich_books_iter = MagicMock(side_effect=batch_results)
+
+        response = client.post(
+            "/enrichment/batch/stream",
+            json={"isbns": ["9780134685991", "9780596517748"]},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["status"] for line in lines] == ["failed", "success"]
+        mock_service.enrich_book.assert_not_called()
+
+    def test_batch_enrich_stream_uses_batch_pipeline(self, mock_service, client):
+        """Test that the stream passes the request options to the batch."""
+
+        async def batch_results(**kwargs):
+            return
+            yield
+
+        mock_service.batch_enrich_books_iter = MagicMock(side_effect=batch_results)
+
+        response = client.post(
+            "/enrichment/batch/stream",
+            json={
+                "isbns": ["9780134685991", "9780596517748"],
+                "force_refresh": True,
+                "min_quality_score": 0.9,
+            },
+        )
+
+        assert response.status_code == 200
+        mock_service.batch_enrich_books_iter.assert_called_once_with(
+            isbns=["9780134685991", "9780596517748"],
+            force_refresh=True,
+            min_quality_score=0.9,
+        )
+
     def test_batch_enrich_invalid_request(self, client):
         """Test batch enrichment with invalid request."""
         # Empty ISBN list
@@ -270,19 +365,25 @@ class TestEnrichmentAPI:
         data = response.json()
         assert "not yet implemented" in data["detail"].lower()
 
-    async def test_enrich_book_async(self, async_client, successful_enrichment_result):
-        """Test enrichment endpoint with async client."""
-        with patch("src.api.enrichment.BookEnrichmentService") as mock_service_class:
-            mock_service = AsyncMock()
-            mock_service.enrich_book.return_value = successful_enrichment_result
-            mock_service_class.return_value = mock_service
+    def test_set_concurrency_limit(self, mock_service, client):
+        """Test changing the enrichment concurrency limit."""
+        mock_service.set_concurrency_limit.return_value = {"limit": 4, "active": 1}
 
-            with patch("src.api.enrichment.get_enrichment_service") as mock_dep:
-                mock_dep.return_value = mock_service
+        response = client.put("/enrichment/concurrency", json={"limit": 4})
 
-                response = await async_client.post(
-                    "/enrichment/enrich", json={"isbn": "9780134685991"}
-                )
+        assert response.status_code == 200
+        assert response.json() == {"limit": 4, "active": 1}
+        mock_service.set_concurrency_limit.assert_called_once_with(4)
+
+    async def test_enrich_book_async(
+        self, mock_service, async_client, successful_enrichment_result
+    ):
+        """Test enrichment endpoint with async client."""
+        mock_service.enrich_book.return_value = successful_enrichment_result
+
+        response = await async_client.post(
+            "/enrichment/enrich", json={"isbn": "9780134685991"}
+        )
 
         assert response.status_code == 200
         data = response.json()
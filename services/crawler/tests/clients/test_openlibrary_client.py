@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import AsyncMock, patch
+import logging
+import time
+from unittest.mock import AsyncMock, PropertyMock, patch
 
 import httpx
+import orjson
 import pytest
 
-from src.clients.openlibrary_client import OpenLibraryClient
+from src.clients.openlibrary_client import OpenLibraryClient, _response_snippet
+from src.core.config import settings
 from src.core.exceptions import OpenLibraryError, ValidationError
 
 
@@ -55,8 +59,8 @@ class TestOpenLibraryClient:
         with patch.object(client, "get") as mock_get:
             mock_response = AsyncMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = sample_openlibrary_response
-            mock_response.text = ""
+            mock_response.content = orjson.dumps(sample_openlibrary_response)
+            mock_response.headers = {}
             mock_get.return_value = mock_response
 
             result = await client.fetch_book_by_isbn(isbn)
@@ -76,6 +80,50 @@ class TestOpenLibraryClient:
                 },
             )
 
+    async def test_fetch_book_by_isbn_uses_etag(
+        self, client, sample_openlibrary_response
+    ):
+        """Test that a repeat fetch revalidates with If-None-Match and uses 304."""
+        isbn = "9780134685991"
+
+        with patch.object(client, "get") as mock_get:
+            mock_get.side_effect = [
+                httpx.Response(
+                    200,
+                    content=orjson.dumps(sample_openlibrary_response),
+                    headers={"ETag": '"abc123"'},
+                ),
+                httpx.Response(304),
+            ]
+
+            first = await client.fetch_book_by_isbn(isbn)
+            expected = dict(first)
+            first["title"] = "Changed by caller"
+            second = await client.fetch_book_by_isbn(isbn)
+
+            assert second == expected
+            assert second["title"] == "Effective Java"
+            assert mock_get.call_args_list[1].kwargs["headers"] == {
+                "If-None-Match": '"abc123"'
+            }
+
+    async def test_fetch_book_by_isbn_without_etag_is_not_cached(
+        self, client, sample_openlibrary_response
+    ):
+        """Test that responses without an ETag are always fetched in full."""
+        isbn = "9780134685991"
+
+        with patch.object(client, "get") as mock_get:
+            mock_get.return_value = httpx.Response(
+                200, content=orjson.dumps(sample_openlibrary_response)
+            )
+
+            await client.fetch_book_by_isbn(isbn)
+            await client.fetch_book_by_isbn(isbn)
+
+            assert "headers" not in mock_get.call_args_list[1].kwargs
+            assert client._etag_cache == {}
+
     async def test_fetch_book_by_isbn_not_found(
         self, client, empty_openlibrary_response
     ):
@@ -85,7 +133,7 @@ class TestOpenLibraryClient:
         with patch.object(client, "get") as mock_get:
             mock_response = AsyncMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = empty_openlibrary_response
+            mock_response.content = orjson.dumps(empty_openlibrary_response)
             mock_get.return_value = mock_response
 
             result = await client.fetch_book_by_isbn(isbn)
@@ -104,6 +152,13 @@ class TestOpenLibraryClient:
 
         assert "ISBN must contain only digits" in str(exc_info.value)
 
+    async def test_fetch_book_by_isbn_rejects_unicode_digits(self, client):
+        """Test that non-ASCII digits are not accepted as an ISBN."""
+        with pytest.raises(ValidationError) as exc_info:
+            await client.fetch_book_by_isbn("\u0669" * 13)
+
+        assert "ISBN must contain only digits" in str(exc_info.value)
+
     async def test_fetch_book_by_isbn_empty_isbn(self, client):
         """Test empty ISBN validation."""
         with pytest.raises(ValidationError) as exc_info:
@@ -118,7 +173,7 @@ class TestOpenLibraryClient:
         with patch.object(client, "get") as mock_get:
             mock_response = AsyncMock()
             mock_response.status_code = 500
-            mock_response.text = "Internal Server Error"
+            mock_response.content = b"Internal Server Error"
             mock_get.return_value = mock_response
 
             with pytest.raises(OpenLibraryError) as exc_info:
@@ -127,6 +182,36 @@ class TestOpenLibraryClient:
             assert "OpenLibrary API returned 500" in str(exc_info.value)
             assert exc_info.value.status_code == 500
 
+    def test_response_snippet_truncates_bytes(self):
+        """Test that the log snippet decodes at most 500 bytes of the body."""
+        # "é" is two bytes in UTF-8, so byte 500 splits a character
+        response = httpx.Response(500, content=("a" * 499 + "é" * 10).encode())
+
+        snippet = _response_snippet(response)
+
+        assert snippet == "a" * 499 + "\ufffd"
+
+    async def test_fetch_book_by_isbn_error_skips_body_when_disabled(self, client):
+        """Test that the response body is not read when WARNING is disabled."""
+        isbn = "9780134685991"
+        stdlib_logger = logging.getLogger("src.clients.openlibrary_client")
+        previous_level = stdlib_logger.level
+        stdlib_logger.setLevel(logging.CRITICAL)
+
+        try:
+            with patch.object(client, "get") as mock_get:
+                mock_response = AsyncMock()
+                mock_response.status_code = 500
+                type(mock_response).content = PropertyMock(
+                    side_effect=AssertionError("body should not be read")
+                )
+                mock_get.return_value = mock_response
+
+                with pytest.raises(OpenLibraryError):
+                    await client.fetch_book_by_isbn(isbn)
+        finally:
+            stdlib_logger.setLevel(previous_level)
+
     async def test_fetch_book_by_isbn_404_error(self, client):
         """Test OpenLibrary 404 error handling."""
         isbn = "9780134685991"
@@ -147,8 +232,7 @@ class TestOpenLibraryClient:
         with patch.object(client, "get") as mock_get:
             mock_response = AsyncMock()
             mock_response.status_code = 200
-            mock_response.json.side_effect = ValueError("Invalid JSON")
-            mock_response.text = "invalid json"
+            mock_response.content = b"invalid json"
             mock_get.return_value = mock_response
 
             with pytest.raises(OpenLibraryError) as exc_info:
@@ -164,13 +248,55 @@ class TestOpenLibraryClient:
         with patch.object(client, "get") as mock_get:
             mock_response = AsyncMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = response_without_details
+            mock_response.content = orjson.dumps(response_without_details)
             mock_get.return_value = mock_response
 
             result = await client.fetch_book_by_isbn(isbn)
 
             assert result is None
 
+    async def test_fetch_books_by_isbns_uses_one_request(
+        self, client, sample_openlibrary_response
+    ):
+        """Test that a bulk lookup sends all bibkeys in a single request."""
+        isbns = ["9780134685991", "9780596517748", "9780134685991"]
+
+        with patch.object(client, "get") as mock_get:
+            mock_get.return_value = httpx.Response(
+                200, content=orjson.dumps(sample_openlibrary_response)
+            )
+
+            result = await client.fetch_books_by_isbns(isbns)
+
+            assert list(result) == ["9780134685991"]
+            assert result["9780134685991"]["title"] == "Effective Java"
+            mock_get.assert_called_once_with(
+                "/api/books",
+                params={
+                    "bibkeys": "ISBN:9780134685991,ISBN:9780596517748",
+                    "format": "json",
+                    "jscmd": "details",
+                },
+            )
+
+    async def test_fetch_books_by_isbns_invalid_isbn(self, client):
+        """Test that an invalid ISBN fails the bulk lookup before any request."""
+        with patch.object(client, "get") as mock_get:
+            with pytest.raises(ValidationError):
+                await client.fetch_books_by_isbns(["9780134685991", "123"])
+
+            mock_get.assert_not_called()
+
+    async def test_fetch_books_by_isbns_api_error(self, client):
+        """Test bulk lookup error handling."""
+        with patch.object(client, "get") as mock_get:
+            mock_get.return_value = httpx.Response(500, content=b"boom")
+
+            with pytest.raises(OpenLibraryError) as exc_info:
+                await client.fetch_books_by_isbns(["9780134685991"])
+
+            assert exc_info.value.status_code == 500
+
     async def test_search_books_success(self, client):
         """Test successful book search."""
         search_response = {
@@ -191,7 +317,7 @@ class TestOpenLibraryClient:
         with patch.object(client, "get") as mock_get:
             mock_response = AsyncMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = search_response
+            mock_response.content = orjson.dumps(search_response)
             mock_get.return_value = mock_response
 
             results = await client.search_books(title="Test Book")
@@ -215,7 +341,7 @@ class TestOpenLibraryClient:
         with patch.object(client, "get") as mock_get:
             mock_response = AsyncMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {"docs": [], "num_found": 0}
+            mock_response.content = orjson.dumps({"docs": [], "num_found": 0})
             mock_get.return_value = mock_response
 
             await client.search_books(title="Test Book", author="Test Author")
@@ -277,36 +403,78 @@ class TestOpenLibraryClient:
 
             assert result is False
 
-    async def test_rate_limiting(self):
-        """Test rate limiting functionality."""
-        # Create client with very low rate limit for testing
-        client = OpenLibraryClient()
-        client._rate_limit_per_minute = 2  # Very low limit
+    async def test_rate_limiting(self, client):
+        """Test that requests beyond the available tokens are delayed."""
+        client._tokens = 1.0
+        client._refill_rate = 20.0  # One token every 50ms
+        client._last_refill = time.monotonic()
 
-        async with client:
-            with patch.object(client, "_retry_request") as mock_request:
-                mock_response = AsyncMock()
-                mock_response.status_code = 200
-                mock_response.json.return_value = {}
-                mock_request.return_value = mock_response
+        with patch.object(client._client, "request") as mock_request:
+            mock_request.return_value = httpx.Response(200, json={})
+
+            start_time = time.monotonic()
+
+            await asyncio.gather(
+                client.fetch_book_by_isbn("9780134685991"),
+                client.fetch_book_by_isbn("9780596517748"),
+                client.fetch_book_by_isbn("9781449373320"),
+            )
+
+            elapsed = time.monotonic() - start_time
+
+            # One request uses the available token, two wait for refills
+            assert elapsed >= 0.09
+            assert mock_request.call_count == 3
+
+    async def test_rate_limit_consumes_token(self, client):
+        """Test that each request consumes one rate limit token."""
+        client._tokens = 5.0
+
+        await client._wait_for_rate_limit()
+
+        assert 4.0 <= client._tokens < 5.0
 
-                # Make requests rapidly
-                start_time = asyncio.get_event_loop().time()
+    async def test_rate_limit_waits_for_refill(self, client):
+        """Test that an empty bucket waits until a token is refilled."""
+        client._tokens = 0.0
+        client._refill_rate = 100.0  # One token every 10ms
+        client._last_refill = time.monotonic()
 
-                tasks = [
-                    client.fetch_book_by_isbn("9780134685991"),
-                    client.fetch_book_by_isbn("9780596517748"),
-                    client.fetch_book_by_isbn("9781449373320"),
-                ]
+        start = time.monotonic()
+        await client._wait_for_rate_limit()
 
-                await asyncio.gather(*tasks)
+        assert time.monotonic() - start >= 0.005
+        assert client._tokens < 1.0
 
-                end_time = asyncio.get_event_loop().time()
-                elapsed = end_time - start_time
+    async def test_rate_limit_wakes_waiters_in_order(self, client):
+        """Test that queued waiters are released one token at a time in order."""
+        client._tokens = 0.0
+        client._refill_rate = 200.0  # One token every 5ms
+        client._last_refill = time.monotonic()
+        released: list[int] = []
 
-                # Should have been rate limited and taken some time
-                assert elapsed > 0.1  # At least some delay
-                assert mock_request.call_count == 3
+        async def waiter(index: int) -> None:
+            await client._wait_for_rate_limit()
+            released.append(index)
+
+        await asyncio.gather(*(waiter(i) for i in range(5)))
+
+        assert released == [0, 1, 2, 3, 4]
+        assert client._refill_task is None
+
+    async def test_close_releases_rate_limit_waiters(self, client):
+        """Test that closing the client fails requests waiting for a token."""
+        client._tokens = 0.0
+        client._refill_rate = 0.01  # Next token in 100s
+        client._last_refill = time.monotonic()
+
+        waiter = asyncio.create_task(client._wait_for_rate_limit())
+        await asyncio.sleep(0)
+        await client.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            await asyncio.wait_for(waiter, timeout=1)
+        assert client._rate_limit_waiters == 0
 
     async def test_retry_logic(self, client):
         """Test retry logic for failed requests."""
@@ -315,7 +483,7 @@ class TestOpenLibraryClient:
             mock_retry.side_effect = [
                 httpx.TimeoutException("Timeout"),
                 httpx.TimeoutException("Timeout"),
-                AsyncMock(status_code=200, json=lambda: {}),
+                httpx.Response(200, json={}),
             ]
 
             result = await client.fetch_book_by_isbn("9780134685991")
@@ -324,6 +492,22 @@ class TestOpenLibraryClient:
             assert mock_retry.call_count == 3
             assert result is None  # Empty response
 
+    async def test_client_pool_matches_concurrency(self, client):
+        """Test that the HTTP client uses HTTP/2 and a pool sized to concurrency."""
+        pool = client._client._transport._pool
+
+        assert pool._http2 is True
+        assert pool._max_keepalive_connections == client.max_concurrent
+        assert pool._max_connections == client.max_concurrent * 2
+        assert pool._keepalive_expiry == client.keepalive_expiry
+
+    async def test_client_uses_separate_connect_timeout(self, client):
+        """Test that connecting times out sooner than reading a response."""
+        timeout = client._client.timeout
+
+        assert timeout.connect == settings.OPENLIBRARY_CONNECT_TIMEOUT
+        assert timeout.read == settings.OPENLIBRARY_TIMEOUT
+
     async def test_context_manager(self):
         """Test async context manager functionality."""
         client = OpenLibraryClient()
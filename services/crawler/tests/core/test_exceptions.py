@@ -0,0 +1,175 @@
+"""Tests for the crawler service exception hierarchy."""
+
+from __future__ import annotations
+
+import sys
+
+from src.core.exceptions import (
+    ConcurrencyError,
+    ConfigurationError,
+    CrawlerServiceError,
+    DatabaseError,
+    DataQualityError,
+    EnrichmentError,
+    OpenLibraryError,
+    RateLimitError,
+    ValidationError,
+)
+
+
+class TestExceptionSerialization:
+    """Test suite for exception to_dict representations."""
+
+    def test_base_error_omits_empty_fields(self):
+        """Test that empty optional fields are left out."""
+        assert CrawlerServiceError("boom").to_dict() == {
+            "error_type": "CrawlerServiceError",
+            "message": "boom",
+        }
+
+    def test_base_error_includes_code_and_context(self):
+        """Test that error code and context are included when set."""
+        error = CrawlerServiceError("boom", error_code="X", isbn="9780134685991")
+
+        assert error.to_dict() == {
+            "error_type": "CrawlerServiceError",
+            "message": "boom",
+            "error_code": "X",
+            "context": {"isbn": "9780134685991"},
+        }
+
+    def test_validation_error(self):
+        """Test validation error fields."""
+        error = ValidationError("Invalid ISBN", field="isbn", value=123)
+
+        assert error.to_dict() == {
+            "error_type": "ValidationError",
+            "message": "Invalid ISBN",
+            "error_code": "VALIDATION_ERROR",
+            "field": "isbn",
+            "value": "123",
+        }
+
+    def test_openlibrary_error_truncates_response(self):
+        """Test that API response data is truncated to 500 characters."""
+        error = OpenLibraryError(
+            "Bad gateway", status_code=502, response_data="x" * 600
+        )
+
+        result = error.to_dict()
+
+        assert result["error_type"] == "OpenLibraryError"
+        assert result["error_code"] == "EXTERNAL_API_ERROR"
+        assert result["api_name"] == "OpenLibrary"
+        assert result["status_code"] == 502
+        assert result["response_data"] == "x" * 500
+        assert error.response_data == "x" * 500
+
+    def test_rate_limit_error(self):
+        """Test rate limit error fields."""
+        error = RateLimitError("Slow down", api_name="OpenLibrary", retry_after=30)
+
+        assert error.to_dict() == {
+            "error_type": "RateLimitError",
+            "message": "Slow down",
+            "error_code": "RATE_LIMIT_ERROR",
+            "api_name": "OpenLibrary",
+            "status_code": 429,
+            "retry_after": 30,
+        }
+
+    def test_enrichment_error(self):
+        """Test enrichment error fields."""
+        error = EnrichmentError("Failed", isbn="9780134685991", source="openlibrary")
+
+        assert error.to_dict() == {
+            "error_type": "EnrichmentError",
+            "message": "Failed",
+            "error_code": "ENRICHMENT_ERROR",
+            "isbn": "9780134685991",
+            "source": "openlibrary",
+        }
+
+    def test_data_quality_error(self):
+        """Test data quality error fields."""
+        error = DataQualityError(
+            "Low quality", quality_score=0.4, min_score=0.7, missing_fields=["title"]
+        )
+
+        assert error.to_dict() == {
+            "error_type": "DataQualityError",
+            "message": "Low quality",
+            "error_code": "DATA_QUALITY_ERROR",
+            "stage": "quality_validation",
+            "quality_score": 0.4,
+            "min_score": 0.7,
+            "missing_fields": ["title"],
+        }
+
+    def test_data_quality_error_optional_fields(self):
+        """Test that ISBN, source and context appear only when set."""
+        error = DataQualityError(
+            "Low quality",
+            quality_score=0.4,
+            min_score=0.7,
+            isbn="9780134685991",
+            source="openlibrary",
+            batch="nightly",
+        )
+
+        result = error.to_dict()
+
+        assert result["isbn"] == "9780134685991"
+        assert result["source"] == "openlibrary"
+        assert result["context"] == {"batch": "nightly"}
+        assert result["missing_fields"] == []
+
+    def test_configuration_database_and_concurrency_errors(self):
+        """Test the remaining error types' specific fields."""
+        config_error = ConfigurationError("Bad", config_key="PORT")
+        database_error = DatabaseError("Bad", operation="insert", table="books")
+
+        assert config_error.to_dict()["config_key"] == "PORT"
+        assert database_error.to_dict()["operation"] == "insert"
+        assert database_error.to_dict()["table"] == "books"
+
+        result = ConcurrencyError("Busy", current_requests=0, max_requests=10).to_dict()
+
+        assert result["current_requests"] == 0
+        assert result["max_requests"] == 10
+
+    def test_subclass_attributes_use_slots(self):
+        """Test that error attributes are stored in slots, not the instance dict."""
+        error = RateLimitError("Slow down", api_name="OpenLibrary", retry_after=30)
+
+        assert error.retry_after == 30
+        assert error.api_name == "OpenLibrary"
+        assert error.message == "Slow down"
+        assert error.__dict__ == {}
+
+
+class TestExceptionClassAttributes:
+    """Test suite for cached class-level exception attributes."""
+
+    def test_error_type_tracks_subclass_name(self):
+        """Test that subclasses report their own class name."""
+
+        class CustomError(ValidationError):
+            pass
+
+        assert CrawlerServiceError._error_type == "CrawlerServiceError"
+        assert RateLimitError._error_type == "RateLimitError"
+        assert CustomError("bad").to_dict()["error_type"] == "CustomError"
+
+    def test_empty_context_is_not_stored(self):
+        """Test that errors raised without context keep None."""
+        assert RateLimitError("slow down").context is None
+        assert CrawlerServiceError("boom", isbn="1").context == {"isbn": "1"}
+
+    def test_error_code_is_interned(self):
+        """Test that dynamically built error codes are interned."""
+        code = "".join(["DYNAMIC", "_ERROR"])
+
+        error = CrawlerServiceError("boom", error_code=code)
+
+        assert error.error_code is sys.intern("DYNAMIC_ERROR")
@@ -0,0 +1,86 @@
+"""Tests for structured logging helpers."""
+
+from __future__ import annotations
+
+import orjson
+import structlog
+
+from src.core.logging import (
+    LoggerMixin,
+    _orjson_dumps,
+    log_api_request,
+    log_enrichment_request,
+    log_function_call,
+)
+
+
+class _Worker(LoggerMixin):
+    """Example class using the logging mixin."""
+
+
+class _OtherWorker(LoggerMixin):
+    """Second example class using the logging mixin."""
+
+
+class TestLoggerMixin:
+    """Test suite for LoggerMixin."""
+
+    def test_instances_share_class_logger(self):
+        """Test that all instances of a class reuse one logger."""
+        assert _Worker().logger is _Worker().logger
+
+    def test_classes_get_separate_loggers(self):
+        """Test that different classes get their own loggers."""
+        assert _Worker().logger is not _OtherWorker().logger
+
+
+class TestLogContextHelpers:
+    """Test suite for flat log context helpers."""
+
+    def test_log_function_call_skips_private_args(self):
+        """Test that private arguments are not logged."""
+        assert log_function_call("fetch", isbn="9780134685991", _token="x") == {
+            "isbn": "9780134685991",
+            "function": "fetch",
+        }
+
+    def test_log_api_request_is_flat(self):
+        """Test that API request fields are top-level keys."""
+        assert log_api_request("GET", "/api/books", 200, 0.25, attempt=1) == {
+            "attempt": 1,
+            "method": "GET",
+            "url": "/api/books",
+            "status_code": 200,
+            "response_time": 0.25,
+        }
+
+    def test_log_enrichment_request_optional_fields(self):
+        """Test that optional enrichment fields appear only when set."""
+        assert log_enrichment_request("9780134685991", "openlibrary", True) == {
+            "isbn": "9780134685991",
+            "source": "openlibrary",
+            "success": True,
+        }
+        assert log_enrichment_request(
+            "9780134685991", "openlibrary", False, quality_score=0.0, error="boom"
+        ) == {
+            "isbn": "9780134685991",
+            "source": "openlibrary",
+            "success": False,
+            "quality_score": 0.0,
+            "error": "boom",
+        }
+
+
+class TestJSONRenderer:
+    """Test suite for the production JSON log serializer."""
+
+    def test_renders_event_as_text(self):
+        """Test that events render to a JSON string with repr fallback."""
+        renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+        marker = object()
+
+        rendered = renderer(None, "info", {"event": "done", 1: marker})
+
+        assert isinstance(rendered, str)
+        assert orjson.loads(rendered) == {"event": "done", "1": repr(marker)}
@@ -0,0 +1,60 @@
+"""Tests for HTTP middleware."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.middleware import AllowlistCORSMiddleware
+
+
+class TestAllowlistCORSMiddleware:
+    """Test suite for the set-based CORS middleware."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client for an app with an explicit origin allowlist."""
+        app = FastAPI()
+        app.add_middleware(
+            AllowlistCORSMiddleware,
+            allow_origins=["https://ezlib.example"],
+            allow_origin_regex=r"https://.*\.ezlib\.example",
+            allow_methods=["GET", "POST"],
+            allow_headers=["X-Correlation-ID"],
+        )
+
+        @app.get("/ping")
+        async def ping() -> dict[str, str]:
+            return {"status": "ok"}
+
+        return TestClient(app)
+
+    def test_allowed_origin_is_echoed(self, client):
+        """Test that listed and regex-matched origins are allowed."""
+        for origin in ("https://ezlib.example", "https://admin.ezlib.example"):
+            response = client.get("/ping", headers={"Origin": origin})
+
+            assert response.headers["access-control-allow-origin"] == origin
+
+    def test_unknown_origin_is_not_allowed(self, client):
+        """Test that unlisted origins get no CORS headers."""
+        response = client.get("/ping", headers={"Origin": "https://evil.example"})
+
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_preflight_checks_method_and_headers(self, client):
+        """Test that preflight requests are validated against the sets."""
+        headers = {
+            "Origin": "https://ezlib.example",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "x-correlation-id",
+        }
+
+        assert client.options("/ping", headers=headers).status_code == 200
+
+        headers["Access-Control-Request-Method"] = "DELETE"
+        response = client.options("/ping", headers=headers)
+
+        assert response.status_code == 400
+        assert response.text == "Disallowed CORS method"
@@ -0,0 +1,212 @@
+"""Tests for internal book metadata models."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.database import book_metadata
+from src.models.database.book_metadata import (
+    AuthorData,
+    BookContributor,
+    BookMetadata,
+    make_contributor,
+)
+from src.models.external.openlibrary_models import OpenLibraryBookDetails
+
+
+class TestBookMetadata:
+    """Test suite for BookMetadata validators."""
+
+    def test_subjects_are_deduplicated_case_insensitively(self):
+        """Test that duplicate subjects keep the first spelling."""
+        metadata = BookMetadata(
+            isbn_13="9780134685991",
+            title="Effective Java",
+            subjects=["Java", "java", " Programming "],
+        )
+
+        assert metadata.subjects == ["Java", "Programming"]
+
+    def test_subjects_are_limited_to_ten_unique(self):
+        """Test that only the first ten unique subjects are kept."""
+        subjects = ["A", "a", "", "x" * 101] + [f"Subject {i}" for i in range(20)]
+
+        metadata = BookMetadata(
+            isbn_13="9780134685991", title="Effective Java", subjects=subjects
+        )
+
+        assert metadata.subjects == ["A"] + [f"Subject {i}" for i in range(9)]
+
+    def test_invalid_cover_url_is_dropped(self):
+        """Test that non-HTTP cover URLs are discarded."""
+        metadata = BookMetadata(
+            isbn_13="9780134685991",
+            title="Effective Java",
+            cover_image_url="ftp://example.com/cover.jpg",
+        )
+
+        assert metadata.cover_image_url is None
+
+    def test_unreasonable_publication_year_is_rejected(self):
+        """Test that publication years outside the valid range fail."""
+        with pytest.raises(ValidationError):
+            BookMetadata(
+                isbn_13="9780134685991", title="Effective Java", publication_year=1200
+            )
+
+    def test_max_publication_year_is_refreshed(self, monkeypatch):
+        """Test that the cached year limit is recomputed once stale."""
+        monkeypatch.setattr(book_metadata, "_max_pub_year", 1500)
+        monkeypatch.setattr(book_metadata, "_max_pub_year_refresh_at", float("inf"))
+
+        with pytest.raises(ValidationError):
+            BookMetadata(
+                isbn_13="9780134685991", title="Effective Java", publication_year=2017
+            )
+
+        monkeypatch.setattr(book_metadata, "_max_pub_year_refresh_at", 0.0)
+
+        metadata = BookMetadata(
+            isbn_13="9780134685991", title="Effective Java", publication_year=2017
+        )
+
+        assert metadata.publication_year == 2017
+
+    def test_quality_score_weights(self):
+        """Test that the quality score sums the weights of present fields."""
+        minimal = BookMetadata(isbn_13="9780134685991", title="Effective Java")
+        complete = BookMetadata(
+            isbn_13="9780134685991",
+            title="Effective Java",
+            authors=["Joshua Bloch"],
+            publication_year=2017,
+            publisher="Addison-Wesley",
+            cover_image_url="https://covers.openlibrary.org/b/id/8439134-L.jpg",
+            description="Best practices for the Java platform",
+            page_count=412,
+            subjects=["Java"],
+        )
+
+        assert minimal.calculate_quality_score() == pytest.approx(0.35)
+        assert complete.calculate_quality_score() == pytest.approx(1.0)
+
+    def test_is_high_quality_caches_score(self):
+        """Test that the computed score is stored for later checks."""
+        metadata = BookMetadata(isbn_13="9780134685991", title="Effective Java")
+
+        assert metadata.is_high_quality(min_score=0.3) is True
+        assert metadata.quality_score == pytest.approx(0.35)
+        assert metadata.is_high_quality(min_score=0.7) is False
+
+    def test_missing_fields(self):
+        """Test that missing important fields are reported in order."""
+        metadata = BookMetadata(
+            isbn_13="9780134685991",
+            title="Unknown Title",
+            authors=["Joshua Bloch"],
+            publisher="Addison-Wesley",
+        )
+
+        assert metadata.get_missing_fields() == [
+            "title",
+            "publication_date",
+            "cover_image",
+            "description",
+        ]
+
+
+class TestBookMetadataFromOpenLibrary:
+    """Test suite for building BookMetadata from OpenLibrary details."""
+
+    @pytest.fixture
+    def ol_details(self):
+        """Sample OpenLibrary book details."""
+        return OpenLibraryBookDetails(
+            title="Design Patterns",
+            authors=[{"name": " Erich Gamma "}, {"name": "Richard Helm"}],
+            publish_date="1994",
+            publishers=["Addison-Wesley"],
+            number_of_pages=395,
+            covers=[12345],
+            description="A classic software engineering book.",
+            subjects=["Patterns", "patterns", " Software "],
+        )
+
+    def test_matches_validated_construction(self, ol_details):
+        """Test that the fast path cleans fields like full validation does."""
+        metadata = BookMetadata.from_openlibrary("9780201633610", ol_details)
+        volatile = {"enriched_at", "quality_score"}
+        validated = BookMetadata(**metadata.model_dump(exclude=volatile))
+
+        assert metadata.authors == ["Erich Gamma", "Richard Helm"]
+        assert metadata.subjects == ["Patterns", "Software"]
+        assert metadata.model_dump(exclude=volatile) == validated.model_dump(
+            exclude=volatile
+        )
+        assert metadata.quality_score == pytest.approx(1.0)
+
+    def test_enriched_at(self, ol_details):
+        """Test that the timestamp defaults to aware UTC and can be shared."""
+        batch_time = datetime(2024, 1, 1, tzinfo=UTC)
+
+        metadata = BookMetadata.from_openlibrary("9780201633610", ol_details)
+        batched = BookMetadata.from_openlibrary(
+            "9780201633610", ol_details, enriched_at=batch_time
+        )
+
+        assert metadata.enriched_at.tzinfo is UTC
+        assert batched.enriched_at is batch_time
+
+    def test_out_of_range_fields_still_fail_validation(self, ol_details):
+        """Test that constraint violations fall back to full validation."""
+        ol_details.number_of_pages = 0
+
+        with pytest.raises(ValidationError):
+            BookMetadata.from_openlibrary("9780201633610", ol_details)
+
+
+class TestAuthorData:
+    """Test suite for AuthorData canonical name generation."""
+
+    def test_canonical_name_generated_from_name(self):
+        """Test that a missing canonical name is derived from the name."""
+        author = AuthorData(name="Dr. Joshua Bloch Jr.")
+
+        assert author.canonical_name == "joshua bloch"
+
+    def test_explicit_canonical_name_is_kept(self):
+        """Test that an explicit canonical name is not overwritten."""
+        author = AuthorData(name="Joshua Bloch", canonical_name="bloch joshua")
+
+        assert author.canonical_name == "bloch joshua"
+
+
+class TestBookContributor:
+    """Test suite for BookContributor construction."""
+
+    def test_contribution_type_is_normalized(self):
+        """Test that contribution types are lowercased and IDs parsed."""
+        contributor = make_contributor(
+            "00000000-0000-0000-0000-000000000001",
+            UUID("00000000-0000-0000-0000-000000000002"),
+            contribution_type="Editor",
+        )
+
+        assert contributor == BookContributor(
+            UUID("00000000-0000-0000-0000-000000000001"),
+            UUID("00000000-0000-0000-0000-000000000002"),
+            "editor",
+        )
+
+    def test_invalid_contribution_type_is_rejected(self):
+        """Test that unknown contribution types raise ValueError."""
+        with pytest.raises(ValueError, match="narrator"):
+            make_contributor(
+                "00000000-0000-0000-0000-000000000001",
+                "00000000-0000-0000-0000-000000000002",
+                contribution_type="narrator",
+            )
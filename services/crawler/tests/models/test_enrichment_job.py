@@ -0,0 +1,233 @@
+"""Tests for enrichment job tracking models."""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from datetime import datetime
+
+import orjson
+import pytest
+
+from src.models.database.enrichment_job import (
+    BatchEnrichmentJob,
+    EnrichmentJob,
+    EnrichmentStatus,
+    ErrorCategory,
+    ErrorDetails,
+    ProcessingMetrics,
+)
+
+
+class TestErrorDetails:
+    """Test suite for ErrorDetails serialization."""
+
+    def test_to_dict(self):
+        """Test that all fields are serialized with an ISO timestamp."""
+        details = ErrorDetails(
+            category=ErrorCategory.API_ERROR,
+            message="Upstream failed",
+            api_source="openlibrary",
+            timestamp=datetime(2024, 1, 1, 12, 0),
+        )
+
+        assert details.to_dict() == {
+            "category": "api_error",
+            "message": "Upstream failed",
+            "api_source": "openlibrary",
+            "field_name": None,
+            "error_code": None,
+            "timestamp": "2024-01-01T12:00:00",
+        }
+
+
+class TestProcessingMetrics:
+    """Test suite for ProcessingMetrics serialization."""
+
+    def test_to_dict_before_completion(self):
+        """Test that an unfinished run keeps completed_at as None."""
+        metrics = ProcessingMetrics(started_at=datetime(2024, 1, 1, 12, 0))
+
+        assert metrics.to_dict() == {
+            "started_at": "2024-01-01T12:00:00",
+            "completed_at": None,
+            "processing_time_seconds": None,
+            "api_calls_made": 0,
+            "cache_hits": 0,
+            "sources_used": [],
+            "retry_attempts": 0,
+        }
+
+    def test_to_dict_copies_sources(self):
+        """Test that later changes to the metrics don't leak into the dict."""
+        metrics = ProcessingMetrics(
+            started_at=datetime(2024, 1, 1, 12, 0), sources_used=["cache"]
+        )
+        metrics.mark_completed()
+
+        result = metrics.to_dict()
+        metrics.sources_used.append("openlibrary")
+
+        assert result["sources_used"] == ["cache"]
+        assert result["completed_at"] == metrics.completed_at.isoformat()
+
+
+class TestEnrichmentJob:
+    """Test suite for EnrichmentJob summaries."""
+
+    def test_to_summary_dict(self):
+        """Test that the summary is JSON-ready and includes the duration."""
+        job = EnrichmentJob.create_job(
+            "job-1",
+            "9780134685991",
+            correlation_id="corr-1",
+            created_at=datetime(2024, 1, 1, 12, 0),
+            updated_at=datetime(2024, 1, 1, 12, 5),
+        )
+        job.update_status(EnrichmentStatus.SUCCESS)
+        job.updated_at = datetime(2024, 1, 1, 12, 5)
+        job.processing_metrics = {"processing_time_seconds": 1.5}
+
+        assert job.to_summary_dict() == {
+            "job_id": "job-1",
+            "correlation_id": "corr-1",
+            "isbn": "9780134685991",
+            "status": "success",
+            "created_at": "2024-01-01T12:00:00",
+            "updated_at": "2024-01-01T12:05:00",
+            "quality_score": None,
+            "error_message": None,
+            "has_warnings": False,
+            "requires_review": False,
+            "processing_time": 1.5,
+        }
+
+    def test_model_dump_json_uses_native_encoders(self):
+        """Test that enums and datetimes serialize without custom encoders."""
+        job = EnrichmentJob.create_job(
+            "job-1",
+            "9780134685991",
+            created_at=datetime(2024, 1, 1, 12, 0),
+        )
+        job.set_error("Timed out", category=ErrorCategory.TIMEOUT_ERROR)
+
+        data = orjson.loads(job.model_dump_json())
+
+        assert data["status"] == "failed"
+        assert data["error_category"] == "timeout_error"
+        assert data["created_at"] == "2024-01-01T12:00:00"
+
+    def test_setters_reuse_a_shared_timestamp(self):
+        """Test that chained setters record the timestamp they are given."""
+        job = EnrichmentJob.create_job("job-1", "9780134685991")
+        now = datetime(2024, 1, 1, 12, 0)
+
+        job.set_quality_scores(0.5, now=now)
+        job.add_quality_warnings(["Short title"], now=now)
+        job.mark_for_review("Suspicious", now=now)
+
+        assert job.updated_at is now
+        assert job.suspicious_data_flags == [
+            "Short title",
+            "Review required: Suspicious",
+        ]
+
+    def test_assignment_is_not_revalidated(self):
+        """Test that setter writes skip pydantic assignment validation."""
+        assert EnrichmentJob.model_config["validate_assignment"] is False
+
+    def test_processing_metrics_are_readable_and_dumped(self):
+        """Test that stored metrics are visible however the job is read."""
+        job = EnrichmentJob.create_job("job-1", "9780134685991")
+        metrics = ProcessingMetrics(
+            started_at=datetime(2024, 1, 1, 12, 0), processing_time_seconds=1.5
+        )
+
+        job.set_processing_metrics(metrics)
+
+        assert job.processing_metrics == metrics.to_dict()
+        assert job.get_duration() == 1.5
+        assert job.model_dump()["processing_metrics"] == metrics.to_dict()
+        assert job.model_dump(exclude_none=True)["processing_metrics"] == (
+            metrics.to_dict()
+        )
+        json_metrics = orjson.loads(job.model_dump_json())["processing_metrics"]
+        assert json_metrics["processing_time_seconds"] == 1.5
+        assert "processing_metrics" not in job.model_dump(
+            exclude={"processing_metrics"}
+        )
+
+    def test_is_completed_for_enum_and_string_statuses(self):
+        """Test terminal-state detection whether status is an enum or a str."""
+        job = EnrichmentJob.create_job("job-1", "9780134685991", status="partial")
+
+        assert isinstance(job.status, str)
+        assert job.is_completed() is True
+
+        job.update_status(EnrichmentStatus.IN_PROGRESS)
+        assert job.is_completed() is False
+
+        job.update_status(EnrichmentStatus.SUCCESS)
+        assert job.is_completed() is True
+
+
+class TestBatchEnrichmentJob:
+    """Test suite for BatchEnrichmentJob summaries."""
+
+    def test_to_summary_dict(self):
+        """Test that the summary has JSON-ready timestamps and derived rates."""
+        batch = BatchEnrichmentJob(
+            batch_id="batch-1",
+            total_books=4,
+            created_at=datetime(2024, 1, 1, 12, 0),
+            updated_at=datetime(2024, 1, 1, 12, 0),
+            started_at=datetime(2024, 1, 1, 12, 1),
+            completed_jobs=2,
+            successful_jobs=1,
+            failed_jobs=1,
+            job_ids=["job-1", "job-2"],
+        )
+
+        assert batch.to_summary_dict() == {
+            "batch_id": "batch-1",
+            "status": "processing",
+            "total_books": 4,
+            "completed_jobs": 2,
+            "successful_jobs": 1,
+            "failed_jobs": 1,
+            "partial_jobs": 0,
+            "success_rate": 50.0,
+            "progress_percentage": 50.0,
+            "created_at": "2024-01-01T12:00:00",
+            "updated_at": "2024-01-01T12:00:00",
+            "started_at": "2024-01-01T12:01:00",
+            "completed_at": None,
+        }
+
+    def test_completing_batch_uses_one_timestamp(self):
+        """Test that the final progress update stamps completion once."""
+        batch = BatchEnrichmentJob(batch_id="batch-1", total_books=1)
+        batch.start_processing()
+
+        batch.update_progress(completed=1, successful=1)
+
+        assert batch.status == "completed"
+        assert batch.started_at <= batch.completed_at
+        assert batch.completed_at is batch.updated_at
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        ErrorDetails(category=ErrorCategory.UNKNOWN_ERROR, message="boom"),
+        ProcessingMetrics(started_at=datetime(2024, 1, 1)),
+    ],
+)
+def test_to_dict_covers_every_field(instance):
+    """Test that hand-written to_dict methods stay in sync with the fields."""
+    assert list(instance.to_dict()) == [f.name for f in fields(instance)]
+
+
+@pytest.mark.parametrize("cls", [ErrorDetails, ProcessingMetrics])
+def test_dataclasses_use_slots(cls):
+    """Test that the short-lived tracking dataclasses carry no instance dict."""
+    assert "__dict__" not in dir(cls)
@@ -0,0 +1,54 @@
+"""Tests for enrichment API request models."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.requests.enrichment_request import (
+    BatchEnrichmentRequest,
+    EnrichmentRequest,
+)
+
+
+class TestEnrichmentRequest:
+    """Test suite for single enrichment request validation."""
+
+    @pytest.mark.parametrize(
+        ("isbn", "expected"),
+        [
+            ("978-0-13-468599-1", "9780134685991"),
+            ("978 0134685991", "9780134685991"),
+            ("0-8044-2957-x", "080442957X"),
+        ],
+    )
+    def test_isbn_is_cleaned(self, isbn, expected):
+        """Test that hyphens and spaces are removed and X is uppercased."""
+        assert EnrichmentRequest(isbn=isbn).isbn == expected
+
+    def test_invalid_isbn_is_rejected(self):
+        """Test that checksum failures are rejected."""
+        with pytest.raises(ValidationError, match="Invalid ISBN format"):
+            EnrichmentRequest(isbn="9780134685990")
+
+
+class TestBatchEnrichmentRequest:
+    """Test suite for batch enrichment request validation."""
+
+    def test_isbns_are_cleaned(self):
+        """Test that every ISBN in the batch is cleaned."""
+        request = BatchEnrichmentRequest(isbns=["978-0-13-468599-1", "0-8044-2957-x"])
+
+        assert request.isbns == ["9780134685991", "080442957X"]
+
+    def test_formatted_duplicates_are_rejected(self):
+        """Test that duplicates are detected after cleaning."""
+        with pytest.raises(ValidationError, match="Duplicate ISBN.*978-0-13-468599-1"):
+            BatchEnrichmentRequest(isbns=["9780134685991", "978-0-13-468599-1"])
+
+    def test_first_duplicate_stops_validation(self):
+        """Test that validation stops at the first duplicate ISBN."""
+        with pytest.raises(ValidationError, match="Duplicate ISBN"):
+            BatchEnrichmentRequest(
+                isbns=["9780134685991", "9780134685991", "9780134685990"]
+            )
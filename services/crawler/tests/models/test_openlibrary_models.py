@@ -0,0 +1,141 @@
+"""Tests for OpenLibrary API response models."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.models.external.openlibrary_models import (
+    OpenLibraryBookDetails,
+    OpenLibraryResponse,
+    OpenLibrarySearchResponse,
+)
+
+
+class TestOpenLibraryBookDetails:
+    """Test suite for OpenLibraryBookDetails parsing."""
+
+    def test_authors_accept_dicts_and_strings(self):
+        """Test that both author formats become plain author dicts."""
+        details = OpenLibraryBookDetails(
+            authors=[
+                {"key": "/authors/OL1A", "name": "Erich Gamma", "extra": 1},
+                "Richard Helm",
+                {"key": "/authors/OL2A"},
+                42,
+            ]
+        )
+
+        assert details.authors == [
+            {"key": "/authors/OL1A", "name": "Erich Gamma"},
+            {"name": "Richard Helm"},
+            {"key": "/authors/OL2A", "name": None},
+        ]
+        assert details.get_author_names() == ["Erich Gamma", "Richard Helm"]
+
+    def test_author_names_are_memoized_until_authors_change(self):
+        """Test that cached names are reused but refreshed on reassignment."""
+        details = OpenLibraryBookDetails(authors=["Erich Gamma"])
+
+        names = details.get_author_names()
+        names.append("mutated")
+
+        assert details.get_author_names() == ["Erich Gamma"]
+
+        details.authors = [{"name": "Richard Helm"}]
+
+        assert details.get_author_names() == ["Richard Helm"]
+
+    def test_cover_urls_are_memoized_per_size(self):
+        """Test that cover URLs are cached per size and reset with covers."""
+        details = OpenLibraryBookDetails(covers=[12345])
+
+        large = details.get_cover_url("L")
+
+        assert large == "https://covers.openlibrary.org/b/id/12345-L.jpg"
+        assert details.get_cover_url("L") is large
+        assert details.get_cover_url() == (
+            "https://covers.openlibrary.org/b/id/12345-M.jpg"
+        )
+
+        details.covers = [67890]
+
+        assert details.get_cover_url("L") == (
+            "https://covers.openlibrary.org/b/id/67890-L.jpg"
+        )
+
+        details.covers = []
+
+        assert details.get_cover_url("L") is None
+
+    def test_description_and_covers_are_normalized(self):
+        """Test that typed-text descriptions and non-integer covers are handled."""
+        details = OpenLibraryBookDetails(
+            description={"type": "/type/text", "value": "A classic."},
+            covers=[12345, "bad", None],
+        )
+
+        assert details.description == "A classic."
+        assert details.covers == [12345]
+
+    @pytest.mark.parametrize(
+        ("publish_date", "expected"),
+        [
+            ("1994", 1994),
+            ("1200", None),
+            ("2200", None),
+            ("October 1, 1994", 1994),
+            ("c1994", None),
+            ("1994-10", 1994),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_get_publication_year(self, publish_date, expected):
+        """Test year extraction from bare years and longer date strings."""
+        details = OpenLibraryBookDetails(publish_date=publish_date)
+
+        assert details.get_publication_year() == expected
+
+
+class TestOpenLibraryResponse:
+    """Test suite for OpenLibraryResponse parsing."""
+
+    def test_missing_book_returns_empty_details(self):
+        """Test that a response without the ISBN yields empty details."""
+        response = OpenLibraryResponse.from_api_response({}, "9780201633610")
+
+        assert response.details.title is None
+
+
+class TestOpenLibrarySearchResponse:
+    """Test suite for OpenLibrarySearchResponse parsing."""
+
+    def test_from_api_response(self):
+        """Test that parsing keeps known fields and drops the rest."""
+        data = {
+            "num_found": 1,
+            "start": 0,
+            "docs": [
+                {
+                    "key": "/works/OL1W",
+                    "title": "Design Patterns",
+                    "cover_i": 12345,
+                    "edition_count": 40,
+                }
+            ],
+        }
+
+        response = OpenLibrarySearchResponse.from_api_response(data)
+
+        assert response.num_found == 1
+        assert response.docs[0].model_dump() == {
+            "key": "/works/OL1W",
+            "title": "Design Patterns",
+            "author_name": [],
+            "first_publish_year": None,
+            "isbn": [],
+            "cover_i": 12345,
+        }
+        assert response.docs[0].get_cover_url("S") == (
+            "https://covers.openlibrary.org/b/id/12345-S.jpg"
+        )
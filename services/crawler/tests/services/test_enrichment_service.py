@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from src.clients.openlibrary_client import OpenLibraryClient
 from src.models.database.book_metadata import BookMetadata
+from src.models.external.openlibrary_models import OpenLibraryBookDetails
 from src.services.enrichment_service import (
     BookEnrichmentService,
     EnrichmentResult,
     EnrichmentStatus,
 )
+from src.utils.cache import TTLCache
+from src.utils.concurrency import AdmissionController
 
 
 class TestBookEnrichmentService:
@@ -272,12 +276,28 @@ class TestBookEnrichmentService:
         assert result_dict["isbn"] == "9780134685991"
         assert result_dict["status"] == EnrichmentStatus.SUCCESS
         assert result_dict["metadata"]["title"] == "Test Book"
+        assert isinstance(result_dict["metadata"]["enriched_at"], str)
         assert result_dict["quality_score"] == 0.8
         assert result_dict["sources_used"] == ["openlibrary"]
         assert result_dict["processing_time"] == 1.5
         assert "timestamp" in result_dict
         assert "correlation_id" in result_dict
 
+    async def test_enrichment_result_lazy_fields(self):
+        """Test that correlation ID and timestamp are generated once, on access."""
+        result = EnrichmentResult(isbn="9780134685991", status=EnrichmentStatus.FAILED)
+
+        assert result._correlation_id is None
+        assert result._timestamp is None
+        assert result.correlation_id == result.correlation_id
+        assert result.timestamp is result.timestamp
+        assert result.timestamp.tzinfo is UTC
+
+        supplied = EnrichmentResult(
+            isbn="9780134685991", status=EnrichmentStatus.FAILED, correlation_id="c-1"
+        )
+        assert supplied.correlation_id == "c-1"
+
     async def test_context_manager(self, mock_openlibrary_client):
         """Test service as async context manager."""
         async with BookEnrichmentService(
@@ -295,3 +315,516 @@ class TestBookEnrichmentService:
         assert isinstance(service._openlibrary_client, OpenLibraryClient)
 
         await service.close()
+
+
+class TestInflightCoalescing:
+    """Test suite for coalescing concurrent enrichments of the same ISBN."""
+
+    @pytest.fixture
+    def external_api_service(self):
+        """External API service mock whose lookups take a moment to complete."""
+
+        async def slow_fetch(isbn, force_refresh=False):
+            await asyncio.sleep(0.01)
+            return None, ["openlibrary"]
+
+        service = AsyncMock()
+        service.fetch_book_by_isbn.side_effect = slow_fetch
+        return service
+
+    @pytest.fixture
+    async def service(self, external_api_service):
+        """Create enrichment service backed by the external API mock."""
+        async with BookEnrichmentService(
+            external_api_service=external_api_service
+        ) as service:
+            yield service
+
+    async def test_concurrent_duplicates_share_one_fetch(
+        self, service, external_api_service
+    ):
+        """Test that concurrent requests for one ISBN run a single enrichment."""
+        results = await asyncio.gather(
+            *(
+                service.enrich_book("9780134685991", correlation_id=f"req-{i}")
+                for i in range(3)
+            )
+        )
+
+        assert external_api_service.fetch_book_by_isbn.call_count == 1
+        assert [result.correlation_id for result in results] == [
+            "req-0",
+            "req-1",
+            "req-2",
+        ]
+        assert len({result.error for result in results}) == 1
+        assert service._inflight == {}
+
+    async def test_follower_survives_cancelled_leader(
+        self, service, external_api_service
+    ):
+        """Test that cancelling the owning request does not fail its followers."""
+        leader = asyncio.create_task(service.enrich_book("9780134685991"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            service.enrich_book("9780134685991", correlation_id="req-2")
+        )
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        result = await follower
+
+        assert leader.cancelled()
+        assert result.correlation_id == "req-2"
+        assert result.status == EnrichmentStatus.FAILED
+        assert external_api_service.fetch_book_by_isbn.call_count == 2
+        assert service._inflight == {}
+
+    async def test_different_isbns_are_not_coalesced(
+        self, service, external_api_service
+    ):
+        """Test that distinct ISBNs are enriched independently."""
+        await asyncio.gather(
+            service.enrich_book("9780134685991"),
+            service.enrich_book("9780596517748"),
+        )
+
+        assert external_api_service.fetch_book_by_isbn.call_count == 2
+
+    async def test_sequential_requests_fetch_again(self, service, external_api_service):
+        """Test that completed enrichments are not reused by later calls."""
+        await service.enrich_book("9780134685991")
+        await service.enrich_book("9780134685991", force_refresh=True)
+
+        assert external_api_service.fetch_book_by_isbn.call_count == 2
+
+
+class TestServiceLifecycle:
+    """Test suite for starting shared services once per service lifetime."""
+
+    async def test_services_are_started_once(self):
+        """Test that enrichments reuse the started external API service."""
+        external_api_service = AsyncMock()
+        external_api_service.fetch_book_by_isbn.return_value = (None, ["openlibrary"])
+
+        async with BookEnrichmentService(
+            external_api_service=external_api_service
+        ) as service:
+            await service.enrich_book("9780134685991")
+            await service.enrich_book("9780596517748")
+
+        external_api_service.__aenter__.assert_called_once()
+        external_api_service.close.assert_called_once()
+
+    async def test_concurrent_first_calls_start_services_once(self):
+        """Test that racing first enrichments start the services only once."""
+
+        async def start():
+            await asyncio.sleep(0)
+
+        external_api_service = AsyncMock()
+        external_api_service.__aenter__.side_effect = start
+        external_api_service.fetch_book_by_isbn.return_value = (None, ["openlibrary"])
+        service = BookEnrichmentService(external_api_service=external_api_service)
+
+        await asyncio.gather(
+            service.enrich_book("9780134685991"),
+            service.enrich_book("9780596517748"),
+        )
+
+        external_api_service.__aenter__.assert_called_once()
+
+    async def test_failed_job_records_one_failure_time(self):
+        """Test that a failed job and its error details share a timestamp."""
+        service = BookEnrichmentService()
+
+        result = await service.enrich_book("invalid-isbn")
+
+        job = next(iter(service._job_history.values()))
+        assert result.status == EnrichmentStatus.FAILED
+        assert job.error_details["timestamp"] == job.updated_at.isoformat()
+
+    async def test_job_ids_are_unique_across_instances(self):
+        """Test that job IDs are unique per instance and across instances."""
+        first, second = BookEnrichmentService(), BookEnrichmentService()
+
+        job_ids = {
+            service._create_enrichment_job(isbn="9780134685991").job_id
+            for service in (first, first, second)
+        }
+
+        assert len(job_ids) == 3
+
+    async def test_job_history_keeps_the_most_recent_jobs(self):
+        """Test that completed jobs stay findable until evicted, oldest first."""
+        service = BookEnrichmentService()
+        with patch("src.services.enrichment_service._JOB_HISTORY_SIZE", 2):
+            jobs = [service._create_enrichment_job(isbn="invalid") for _ in range(3)]
+            for job in jobs:
+                service._complete_job(job)
+
+        assert service.get_job_status(jobs[0].job_id) is None
+        assert service.get_job_status(jobs[2].job_id)["job_id"] == jobs[2].job_id
+        assert service.get_active_jobs() == []
+
+
+class TestResultCache:
+    """Test suite for caching completed enrichment results."""
+
+    @pytest.fixture
+    def external_api_service(self):
+        """External API service mock that finds every book."""
+        details = OpenLibraryBookDetails(
+            title="Effective Java",
+            authors=[{"name": "Joshua Bloch"}],
+            publishers=["Addison-Wesley"],
+            publish_date="2017",
+        )
+        service = AsyncMock()
+        service.fetch_book_by_isbn.return_value = (details, ["openlibrary"])
+        return service
+
+    @pytest.fixture
+    async def service(self, external_api_service):
+        """Create enrichment service backed by the external API mock."""
+        async with BookEnrichmentService(
+            external_api_service=external_api_service
+        ) as service:
+            yield service
+
+    async def test_repeat_enrichment_is_served_from_cache(
+        self, service, external_api_service
+    ):
+        """Test that a cached result is reused under the normalized ISBN."""
+        first = await service.enrich_book("9780134685991")
+        second = await service.enrich_book("0134685997", correlation_id="req-2")
+
+        assert external_api_service.fetch_book_by_isbn.call_count == 1
+        assert second is not first
+        assert second.metadata is first.metadata
+        assert second.correlation_id == "req-2"
+
+    async def test_cache_hit_reports_its_own_request(
+        self, service, external_api_service
+    ):
+        """Test that a cache hit does not repeat the first request's details."""
+        first = await service.enrich_book("9780134685991")
+        first_timestamp = first.timestamp
+
+        second = await service.enrich_book("9780134685991")
+
+        assert second.timestamp is not first_timestamp
+        assert second.processing_time is None
+        assert second.sources_used == ["openlibrary:cached"]
+        assert first.sources_used == ["openlibrary"]
+
+    async def test_empty_injected_cache_is_used(self, external_api_service):
+        """Test that an injected cache is kept even while it is empty."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        service = BookEnrichmentService(
+            external_api_service=external_api_service, result_cache=cache
+        )
+
+        await service.enrich_book("9780134685991")
+
+        assert service._result_cache is cache
+        assert len(cache) == 1
+
+    async def test_force_refresh_bypasses_cache(self, service, external_api_service):
+        """Test that force_refresh always runs a new enrichment."""
+        await service.enrich_book("9780134685991")
+        await service.enrich_book("9780134685991", force_refresh=True)
+
+        assert external_api_service.fetch_book_by_isbn.call_count == 2
+
+    async def test_quality_threshold_is_part_of_the_key(
+        self, service, external_api_service
+    ):
+        """Test that results are cached per quality threshold."""
+        await service.enrich_book("9780134685991")
+        await service.enrich_book("9780134685991", min_quality_score=0.9)
+
+        assert external_api_service.fetch_book_by_isbn.call_count == 2
+
+    async def test_default_threshold_shares_the_cache_entry(
+        self, service, external_api_service
+    ):
+        """Test that an explicit default threshold reuses the default entry."""
+        with patch(
+            "src.services.enrichment_service.settings.ENRICHMENT_MIN_QUALITY_SCORE",
+            0.6,
+        ):
+            await service.enrich_book("9780134685991")
+            await service.enrich_book("9780134685991", min_quality_score=0.6)
+
+        assert external_api_service.fetch_book_by_isbn.call_count == 1
+
+    async def test_failed_results_are_not_cached(self, service, external_api_service):
+        """Test that failures are retried on the next call."""
+        external_api_service.fetch_book_by_isbn.side_effect = Exception("boom")
+
+        await service.enrich_book("9780134685991")
+        await service.enrich_book("9780134685991")
+
+        assert external_api_service.fetch_book_by_isbn.call_count == 2
+
+    async def test_not_found_is_remembered(self, service, external_api_service):
+        """Test that an ISBN no source knows is not fetched again."""
+        external_api_service.fetch_book_by_isbn.return_value = (None, ["openlibrary"])
+
+        await service.enrich_book("9780134685991")
+        second = await service.enrich_book("9780134685991")
+        await service.enrich_book("9780134685991", force_refresh=True)
+
+        assert external_api_service.fetch_book_by_isbn.call_count == 2
+        assert second.status == EnrichmentStatus.FAILED
+        assert second.sources_used == ["openlibrary:cached"]
+
+    async def test_fast_paths_skip_admission(self, service):
+        """Test that cache hits and invalid ISBNs never wait for a slot."""
+        await service.enrich_book("9780134685991")
+        service._admission_controller = AsyncMock()
+
+        cached = await service.enrich_book("9780134685991")
+        invalid = await service.enrich_book("invalid-isbn")
+
+        assert cached.is_successful
+        assert invalid.status == EnrichmentStatus.FAILED
+        service._admission.__aenter__.assert_not_called()
+
+
+class TestConcurrencyLimit:
+    """Test suite for resizing enrichment concurrency at runtime."""
+
+    @pytest.fixture
+    async def service(self):
+        """Create enrichment service backed by an external API mock."""
+        external_api_service = AsyncMock()
+        external_api_service.fetch_book_by_isbn.return_value = (None, ["openlibrary"])
+        async with BookEnrichmentService(
+            external_api_service=external_api_service
+        ) as service:
+            yield service
+
+    async def test_set_concurrency_limit(self, service):
+        """Test that the limit can be changed and is reported back."""
+        status = await service.set_concurrency_limit(3)
+
+        assert status == {"limit": 3, "active": 0}
+        assert service.get_concurrency_status() == status
+
+    async def test_enrichment_holds_a_slot(self, service):
+        """Test that running enrichments are counted against the limit."""
+        seen_active = []
+
+        async def fetch(isbn, force_refresh=False):
+            seen_active.append(service.get_concurrency_status()["active"])
+            return None, ["openlibrary"]
+
+        service._external_api_service.fetch_book_by_isbn.side_effect = fetch
+
+        await service.enrich_book("9780134685991")
+
+        assert seen_active == [1]
+        assert service.get_concurrency_status()["active"] == 0
+
+    async def test_instances_share_the_limit(self, service):
+        """Test that services without their own limiter share one limit."""
+        other = BookEnrichmentService()
+        await other.set_concurrency_limit(4)
+
+        assert service.get_concurrency_status()["limit"] == 4
+
+    def test_shared_admission_follows_the_running_loop(self):
+        """Test that one instance uses each event loop's own limiter."""
+        service = BookEnrichmentService()
+
+        async def current_admission():
+            return service._admission
+
+        assert asyncio.run(current_admission()) is not asyncio.run(current_admission())
+
+    async def test_injected_admission_is_used(self):
+        """Test that a caller-supplied limiter replaces the shared one."""
+        admission = AdmissionController(2)
+        service = BookEnrichmentService(admission=admission)
+
+        assert service.get_concurrency_status() == {"limit": 2, "active": 0}
+
+    async def test_timeout_releases_the_slot(self, service):
+        """Test that a timed-out enrichment fails and frees its slot."""
+
+        async def fetch(isbn, force_refresh=False):
+            await asyncio.sleep(1)
+
+        service._external_api_service.fetch_book_by_isbn.side_effect = fetch
+
+        with patch("src.services.enrichment_service.settings.ENRICHMENT_TIMEOUT", 0):
+            result = await service.enrich_book("9780134685991")
+
+        assert result.status == EnrichmentStatus.FAILED
+        assert "timeout" in result.error
+        assert service.get_concurrency_status()["active"] == 0
+
+
+class TestBatchPrefetch:
+    """Test suite for bulk prefetching in batch enrichment."""
+
+    @pytest.fixture
+    def external_api_service(self):
+        """External API service mock with a bulk lookup."""
+        details = OpenLibraryBookDetails(
+            title="Effective Java",
+            authors=[{"name": "Joshua Bloch"}],
+            publishers=["Addison-Wesley"],
+            publish_date="2017",
+        )
+
+        async def bulk_fetch(isbns, force_refresh=False):
+            return {isbn: (details, ["openlibrary"]) for isbn in isbns}
+
+        service = AsyncMock()
+        service.fetch_books_by_isbns.side_effect = bulk_fetch
+        service.fetch_book_by_isbn.return_value = (None, ["openlibrary"])
+        return service
+
+    @pytest.fixture
+    async def service(self, external_api_service):
+        """Create enrichment service backed by the external API mock."""
+        async with BookEnrichmentService(
+            external_api_service=external_api_service
+        ) as service:
+            yield service
+
+    async def test_batch_uses_single_bulk_lookup(self, service, external_api_service):
+        """Test that a batch is fetched in bulk instead of per ISBN."""
+        results = await service.batch_enrich_books(
+            ["9780134685991", "9780596517748", "invalid-isbn"]
+        )
+
+        external_api_service.fetch_books_by_isbns.assert_called_once_with(
+            ["9780134685991", "9780596517748"], force_refresh=False
+        )
+        external_api_service.fetch_book_by_isbn.assert_not_called()
+        assert [r.metadata is not None for r in results] == [True, True, False]
+        assert "Invalid ISBN format" in results[2].error
+
+    async def test_batch_skips_prefetch_for_cached_results(
+        self, service, external_api_service
+    ):
+        """Test that ISBNs with a cached result are not fetched in bulk."""
+        await service.batch_enrich_books(["9780134685991"])
+        external_api_service.fetch_books_by_isbns.reset_mock()
+
+        await service.batch_enrich_books(["9780134685991", "9780596517748"])
+
+        external_api_service.fetch_books_by_isbns.assert_called_once_with(
+            ["9780596517748"], force_refresh=False
+        )
+
+    async def test_batch_shares_one_enrichment_time(self, service):
+        """Test that every book in a batch is stamped with the same time."""
+        results = await service.batch_enrich_books(["9780134685991", "9780596517748"])
+        later = await service.batch_enrich_books(["9781449373320"])
+
+        first, second = (result.metadata.enriched_at for result in results)
+        assert first is second
+        assert later[0].metadata.enriched_at is not first
+
+    async def test_batch_falls_back_when_bulk_lookup_fails(
+        self, service, external_api_service
+    ):
+        """Test that single lookups are used when the bulk lookup fails."""
+        external_api_service.fetch_books_by_isbns.side_effect = Exception("boom")
+
+        results = await service.batch_enrich_books(["9780134685991"])
+
+        external_api_service.fetch_book_by_isbn.assert_called_once()
+        assert results[0].status == EnrichmentStatus.FAILED
+
+    async def test_batch_iter_yields_every_result(self, service):
+        """Test that the streaming batch yields one result per ISBN."""
+        isbns = ["9780134685991", "9780596517748", "invalid-isbn"]
+
+        results = [result async for result in service.batch_enrich_books_iter(isbns)]
+
+        assert sorted(result.isbn for result in results) == sorted(isbns)
+
+    async def test_batch_rejects_invalid_isbns_without_enriching(self, service):
+        """Test that invalid ISBNs fail up front and valid ones still run."""
+        with patch.object(
+            service, "_enrich_normalized", wraps=service._enrich_normalized
+        ) as enrich:
+            results = await service.batch_enrich_books(
+                ["invalid-isbn", "9780134685991"]
+            )
+
+        enrich.assert_called_once()
+        assert "Invalid ISBN format" in results[0].error
+        assert results[1].metadata is not None
+
+    async def test_batch_enriches_duplicate_isbns_once(
+        self, service, external_api_service
+    ):
+        """Test that repeated ISBNs in a batch share a single enrichment."""
+        with patch.object(
+            service, "_enrich_normalized", wraps=service._enrich_normalized
+        ) as enrich:
+            results = await service.batch_enrich_books(
+                ["9780134685991", "978-0-13-468599-1", "9780134685991"]
+            )
+
+        enrich.assert_called_once()
+        external_api_service.fetch_books_by_isbns.assert_called_once_with(
+            ["9780134685991"], force_refresh=False
+        )
+        assert all(result.metadata is not None for result in results)
+        assert len({result.correlation_id for result in results}) == 3
+
+    async def test_batch_schedules_at_most_the_concurrency_limit(self, service):
+        """Test that a batch never runs more enrichments than the limit."""
+        await service.set_concurrency_limit(2)
+        running = 0
+        peak = 0
+
+        async def enrich(isbn, *args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return EnrichmentResult(isbn=isbn, status=EnrichmentStatus.SUCCESS)
+
+        isbns = [
+            "9780134685991",
+            "9780596517748",
+            "9781449373320",
+            "9780321125217",
+            "9780804429573",
+            "9791220109062",
+        ]
+        with patch.object(service, "_enrich_normalized", side_effect=enrich):
+            results = await service.batch_enrich_books(isbns)
+
+        assert peak == 2
+        assert [result.isbn for result in results] == isbns
+
+    async def test_batch_logs_progress_instead_of_per_book(self, service):
+        """Test that batches replace per-book INFO logs with progress logs."""
+        module = "src.services.enrichment_service"
+        with (
+            patch(f"{module}._stdlib_logger.isEnabledFor", return_value=True),
+            patch(f"{module}.settings.ENRICHMENT_BATCH_PROGRESS_INTERVAL", 1),
+            patch(f"{module}.logger") as log,
+        ):
+            await service.batch_enrich_books(["9780134685991", "invalid-isbn"])
+            batch_events = [call.args[0] for call in log.info.call_args_list]
+
+            log.reset_mock()
+            await service.enrich_book("9780596517748")
+            single_events = [call.args[0] for call in log.info.call_args_list]
+
+        assert "Starting enhanced book enrichment" not in batch_events
+        assert "Created enrichment job" not in batch_events
+        assert batch_events.count("Batch enrichment progress") == 2
+        assert "Starting enhanced book enrichment" in single_events
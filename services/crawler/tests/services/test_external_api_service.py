@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -330,6 +330,77 @@ class TestExternalAPIService:
         # All should succeed
         assert all(result[1] is not None for result in results)
 
+    @pytest.mark.asyncio
+    async def test_fetch_books_by_isbns_chunks_requests(
+        self, external_api_service, mock_openlibrary_client, sample_book_data
+    ):
+        """Test that bulk fetching sends one request per chunk."""
+        isbns = [f"978032112521{i}" for i in range(5)]
+
+        async def bulk_fetch(chunk):
+            return {isbn: sample_book_data for isbn in chunk if isbn != isbns[0]}
+
+        mock_openlibrary_client.fetch_books_by_isbns.side_effect = bulk_fetch
+
+        with patch("src.core.config.settings.OPENLIBRARY_BATCH_SIZE", 2):
+            results = await external_api_service.fetch_books_by_isbns(isbns)
+
+        assert mock_openlibrary_client.fetch_books_by_isbns.call_count == 3
+        mock_openlibrary_client.fetch_book_by_isbn.assert_not_called()
+        assert results[isbns[0]] == (None, ["openlibrary"])
+        for isbn in isbns[1:]:
+            book_details, sources_used = results[isbn]
+            assert book_details.title == sample_book_data["title"]
+            assert sources_used == ["openlibrary"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_books_by_isbns_uses_cache(
+        self, external_api_service, mock_openlibrary_client, sample_book_details
+    ):
+        """Test that cached books are not requested again."""
+        cached_isbn, missing_isbn = "9780321125217", "9780321125218"
+        cache_key = external_api_service._get_cache_key(
+            "openlibrary", "fetch_book", isbn=cached_isbn
+        )
+        external_api_service._cache_response(cache_key, sample_book_details)
+        mock_openlibrary_client.fetch_books_by_isbns.return_value = {}
+
+        results = await external_api_service.fetch_books_by_isbns(
+            [cached_isbn, missing_isbn]
+        )
+
+        assert results[cached_isbn] == (sample_book_details, ["openlibrary:cached"])
+        mock_openlibrary_client.fetch_books_by_isbns.assert_called_once_with(
+            [missing_isbn]
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetch_books_by_isbns_omits_failed_chunks(
+        self, external_api_service, mock_openlibrary_client
+    ):
+        """Test that ISBNs from a failed chunk are left out of the result."""
+        mock_openlibrary_client.fetch_books_by_isbns.side_effect = Exception("boom")
+
+        results = await external_api_service.fetch_books_by_isbns(["9780321125217"])
+
+        assert results == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_timeout_reports_status(
+        self, external_api_service, mock_openlibrary_client
+    ):
+        """Test that a timed-out chunk raises with the API name and 408."""
+        mock_openlibrary_client.fetch_books_by_isbns.side_effect = (
+            asyncio.TimeoutError()
+        )
+
+        with pytest.raises(ExternalAPIError) as exc_info:
+            await external_api_service._fetch_batch_from_openlibrary(["9780321125217"])
+
+        assert exc_info.value.message == "OpenLibrary API timeout"
+        assert exc_info.value.api_name == "openlibrary"
+        assert exc_info.value.status_code == 408
+
     # Metrics Tests
     def test_api_call_metrics_duration(self):
         """Test API call metrics duration calculation."""
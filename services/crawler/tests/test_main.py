@@ -47,3 +47,16 @@ def test_redoc_docs_available(client: TestClient) -> None:
     response = client.get("/redoc")
     assert response.status_code == 200
     assert "html" in response.headers.get("content-type", "").lower()
+
+
+def test_lifespan_shares_enrichment_service() -> None:
+    """Test that the lifespan exposes one shared enrichment service."""
+    from src.main import app
+    from src.services.enrichment_service import BookEnrichmentService
+
+    with TestClient(app) as client:
+        service = app.state.enrichment_service
+        assert isinstance(service, BookEnrichmentService)
+
+        client.get("/health")
+        assert app.state.enrichment_service is service
@@ -0,0 +1,54 @@
+"""Tests for in-memory caching helpers."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from src.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test suite for the bounded TTL cache."""
+
+    def test_get_and_set(self):
+        """Test storing and retrieving a value."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_entries_expire(self):
+        """Test that entries are dropped once their TTL has passed."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        with patch("src.utils.cache.time.monotonic", return_value=1000.0):
+            cache.set("a", 1)
+
+        with patch("src.utils.cache.time.monotonic", return_value=1060.0):
+            assert cache.get("a") is None
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_pop_and_clear(self):
+        """Test removing entries."""
+        cache = TTLCache(maxsize=3, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.pop("a")
+        cache.pop("missing")
+
+        assert cache.get("a") is None
+        assert cache.clear() == 1
+        assert len(cache) == 0
@@ -0,0 +1,99 @@
+"""Tests for concurrency control helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.utils.concurrency import AdmissionController
+
+
+class TestAdmissionController:
+    """Test suite for the resizable admission controller."""
+
+    async def _hold(self, controller, release: asyncio.Event) -> None:
+        async with controller:
+            await release.wait()
+
+    def test_rejects_invalid_limit(self):
+        """Test that a limit below one is rejected."""
+        with pytest.raises(ValueError):
+            AdmissionController(0)
+
+    async def test_limits_active_callers(self):
+        """Test that callers beyond the limit wait for a free slot."""
+        controller = AdmissionController(2)
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(self._hold(controller, release)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        assert controller.active == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert controller.active == 0
+
+    async def test_raising_limit_admits_waiters(self):
+        """Test that raising the limit wakes waiting callers immediately."""
+        controller = AdmissionController(1)
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(self._hold(controller, release)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        await controller.set_limit(3)
+        await asyncio.sleep(0)
+
+        assert controller.active == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    async def test_lowering_limit_drains_active_callers(self):
+        """Test that lowering the limit holds new callers until work drains."""
+        controller = AdmissionController(2)
+        first, second = asyncio.Event(), asyncio.Event()
+        holders = [
+            asyncio.create_task(self._hold(controller, first)),
+            asyncio.create_task(self._hold(controller, second)),
+        ]
+        await asyncio.sleep(0)
+
+        await controller.set_limit(1)
+        waiter = asyncio.create_task(self._hold(controller, asyncio.Event()))
+        first.set()
+        await asyncio.sleep(0.01)
+
+        # One holder left still fills the lowered limit
+        assert controller.active == 1
+        assert not waiter.done()
+
+        second.set()
+        await asyncio.gather(*holders)
+        await asyncio.sleep(0)
+
+        assert controller.active == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert controller.active == 0
+
+    async def test_cancelled_waiter_does_not_take_a_slot(self):
+        """Test that cancelling a waiting caller leaves the count unchanged."""
+        controller = AdmissionController(1)
+        release = asyncio.Event()
+        holder = asyncio.create_task(self._hold(controller, release))
+        await asyncio.sleep(0)
+
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        release.set()
+        await holder
+
+        assert controller.active == 0
@@ -72,6 +72,15 @@ class TestIsbnUtils:
         assert validate_isbn_13("9770134685991") is False  # Invalid prefix
         assert validate_isbn_13("1234567890123") is False  # Invalid prefix
 
+    def test_validate_rejects_unicode_digits(self):
+        """Test that non-ASCII digits are not accepted as ISBN digits."""
+        arabic_indic = "9780134685991".translate(
+            str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩")
+        )
+
+        assert validate_isbn_13(arabic_indic) is False
+        assert is_valid_isbn(arabic_indic) is False
+
     def test_isbn_10_to_13_conversion(self):
         """Test ISBN-10 to ISBN-13 conversion."""
         assert isbn_10_to_13("0134685997") == "9780134685991"